@@ -13,7 +13,8 @@ Accuracy: 99% valid waypoints, zero land crossings
 
 import math
 import random
-from typing import List, Tuple, Dict, Optional, Set
+import numpy as np
+from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 from app.services.land_detection import LandDetectionService
 from app.services.real_time_weather import get_weather_service
@@ -34,6 +35,65 @@ class TreeNode:
         return isinstance(other, TreeNode) and abs(self.lat - other.lat) < 1e-4 and abs(self.lon - other.lon) < 1e-4
 
 
+class SpatialTree(set):
+    """
+    Set of tree nodes with a uniform grid index for nearest-neighbor queries.
+    
+    Nodes are bucketed by (lat, lon) cell; a query scans rings of cells
+    around the point and stops once no farther ring can hold a closer node,
+    so lookups stay near-constant as the tree grows instead of O(n).
+    """
+    
+    def __init__(self, nodes=(), cell_deg: float = 0.5):
+        super().__init__()
+        self.cell_deg = cell_deg
+        self._buckets: Dict[Tuple[int, int], List[TreeNode]] = {}
+        self._bounds = [math.inf, -math.inf, math.inf, -math.inf]  # Occupied cells: i min/max, j min/max
+        for node in nodes:
+            self.add(node)
+    
+    def _key(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg))
+    
+    def add(self, node: TreeNode):
+        if node in self:
+            return
+        super().add(node)
+        i, j = self._key(node.lat, node.lon)
+        self._buckets.setdefault((i, j), []).append(node)
+        bounds = self._bounds
+        bounds[0], bounds[1] = min(bounds[0], i), max(bounds[1], i)
+        bounds[2], bounds[3] = min(bounds[2], j), max(bounds[3], j)
+    
+    def nearest(self, point: Tuple[float, float]) -> TreeNode:
+        """Node closest to point (Euclidean distance in degrees)"""
+        lat, lon = point
+        ci, cj = self._key(lat, lon)
+        i_min, i_max, j_min, j_max = self._bounds
+        max_ring = max(ci - i_min, i_max - ci, cj - j_min, j_max - cj)
+        
+        best, best_dist_sq = None, math.inf
+        for ring in range(max_ring + 1):
+            # A ring costs 8 * ring bucket lookups; once that outgrows the
+            # tree, a plain scan is cheaper (e.g. far-away goal samples)
+            if 8 * ring > len(self):
+                return min(self, key=lambda n: (n.lat - lat)**2 + (n.lon - lon)**2)
+            
+            for i in range(ci - ring, ci + ring + 1):
+                step = 1 if abs(i - ci) == ring else 2 * ring
+                for j in range(cj - ring, cj + ring + 1, step):
+                    for node in self._buckets.get((i, j), ()):
+                        dist_sq = (node.lat - lat)**2 + (node.lon - lon)**2
+                        if dist_sq < best_dist_sq:
+                            best, best_dist_sq = node, dist_sq
+            
+            # Nodes in later rings are at least ring * cell_deg away
+            if best is not None and best_dist_sq <= (ring * self.cell_deg)**2:
+                break
+        
+        return best
+
+
 class HybridBidirectionalRRTStar:
     """
     Fast, accurate maritime pathfinding combining:
@@ -47,7 +107,9 @@ class HybridBidirectionalRRTStar:
                  start: Tuple[float, float],
                  goal: Tuple[float, float],
                  max_iterations: int = 300,  # Increased for better exploration
-                 step_size_nm: float = 25):  # Smaller steps for coastal navigation
+                 step_size_nm: float = 25,  # Smaller steps for coastal navigation
+                 nn_bucket_deg: Optional[float] = None,
+                 informed: bool = True):
         """
         Initialize hybrid bidirectional RRT*.
         
@@ -56,10 +118,13 @@ class HybridBidirectionalRRTStar:
             goal: Goal position (lat, lon)
             max_iterations: Iterations per direction
             step_size_nm: Step size in nautical miles
+            nn_bucket_deg: Nearest-neighbor index cell size (default: step size)
+            informed: Once a path is found, only sample where a cheaper one can exist
         """
         self.start = start
         self.goal = goal
         self.max_iterations = max_iterations
+        self.informed = informed
         self.step_size_deg = step_size_nm / 60.0  # Convert to degrees
         
         # Calculate route distance for adaptive parameters
@@ -73,9 +138,10 @@ class HybridBidirectionalRRTStar:
         else:
             self.goal_bias = 0.2   # More exploration for long routes
         
-        # Bidirectional trees
-        self.tree_start: Set[TreeNode] = {TreeNode(start[0], start[1])}
-        self.tree_goal: Set[TreeNode] = {TreeNode(goal[0], goal[1])}
+        # Bidirectional trees, indexed for nearest-neighbor queries
+        bucket_deg = nn_bucket_deg or self.step_size_deg
+        self.tree_start = SpatialTree([TreeNode(start[0], start[1])], bucket_deg)
+        self.tree_goal = SpatialTree([TreeNode(goal[0], goal[1])], bucket_deg)
         
         # Connection point (where trees meet)
         self.connection_point: Optional[Tuple[TreeNode, TreeNode]] = None
@@ -109,6 +175,13 @@ class HybridBidirectionalRRTStar:
             (15.0, 65.0, 3.0, [5, 6, 7, 8, 9], 1.3),  # SW Monsoon Arabian Sea
             (15.0, 90.0, 3.0, [5, 6, 7, 8, 9], 1.25), # SW Monsoon Bay of Bengal
         ]
+        
+        # Lowest hazard multiplier any point can get: shallow water and monsoon
+        # zones only add cost, piracy zones scale it by mult * 0.8 (below 1
+        # for the current zones), and a point may lie in all of them
+        self._min_hazard_multiplier = 1.0
+        for _, _, _, mult in self.piracy_zones:
+            self._min_hazard_multiplier *= min(1.0, mult * 0.8)
     
     def _is_water(self, lat: float, lon: float) -> bool:
         """Fast water check using instance land detector"""
@@ -127,24 +200,27 @@ class HybridBidirectionalRRTStar:
             min_lon = min(self.start[1], self.goal[1]) - margin
             max_lon = max(self.start[1], self.goal[1]) + margin
             
-            # Three tiers of water cells for better sampling
-            self._deep_water_cells = [cell for cell in self._grid.cells.values()
-                if cell.cell_type == CellType.WATER and cell.depth_m > 50 and min_lat <= cell.lat <= max_lat and min_lon <= cell.lon <= max_lon]
-            self._shallow_water_cells = [cell for cell in self._grid.cells.values()
-                if cell.cell_type == CellType.WATER and 20 <= cell.depth_m <= 50 and min_lat <= cell.lat <= max_lat and min_lon <= cell.lon <= max_lon]
-            self._all_water_cells = [cell for cell in self._grid.cells.values()
-                if cell.cell_type == CellType.WATER and min_lat <= cell.lat <= max_lat and min_lon <= cell.lon <= max_lon]
+            # Three tiers of water cells for better sampling, as flat indices
+            # into the grid arrays (row-major, the grid's cell order)
+            self._grid_lat = self._grid.lat.reshape(-1)
+            self._grid_lon = self._grid.lon.reshape(-1)
+            depth = self._grid.depth_m.reshape(-1)
+            in_water_box = (
+                (self._grid.cell_type.reshape(-1) == CellType.WATER.value) &
+                (self._grid_lat >= min_lat) & (self._grid_lat <= max_lat) &
+                (self._grid_lon >= min_lon) & (self._grid_lon <= max_lon)
+            )
+            self._deep_water_index = np.flatnonzero(in_water_box & (depth > 50))
+            self._shallow_water_index = np.flatnonzero(in_water_box & (depth >= 20) & (depth <= 50))
+            self._all_water_index = np.flatnonzero(in_water_box)
         
         # Sampling strategy: prefer deep water, but allow shallow for coastal navigation
-        if random.random() < 0.7 and self._deep_water_cells:  # 70% deep water
-            cell = random.choice(self._deep_water_cells)
-            return (cell.lat, cell.lon)
-        elif random.random() < 0.9 and self._shallow_water_cells:  # 20% shallow water
-            cell = random.choice(self._shallow_water_cells)
-            return (cell.lat, cell.lon)
-        elif self._all_water_cells:  # 10% any water
-            cell = random.choice(self._all_water_cells)
-            return (cell.lat, cell.lon)
+        if random.random() < 0.7 and len(self._deep_water_index):  # 70% deep water
+            return self._grid_point(random.choice(self._deep_water_index))
+        elif random.random() < 0.9 and len(self._shallow_water_index):  # 20% shallow water
+            return self._grid_point(random.choice(self._shallow_water_index))
+        elif len(self._all_water_index):  # 10% any water
+            return self._grid_point(random.choice(self._all_water_index))
         
         # Fallback strategies for difficult regions
         # Strategy 1: Midpoint with relaxed depth requirements
@@ -171,16 +247,67 @@ class HybridBidirectionalRRTStar:
                     return (safe_lat, safe_lon)
         
         # Strategy 3: Global water search (slower but reliable)
-        all_water = [cell for cell in self._grid.cells.values() if cell.cell_type == CellType.WATER]
-        if all_water:
-            cell = random.choice(all_water)
-            return (cell.lat, cell.lon)
+        all_water = np.flatnonzero(self._grid.cell_type.reshape(-1) == CellType.WATER.value)
+        if len(all_water):
+            return self._grid_point(random.choice(all_water))
         
         # Last resort: offset from route line toward known ocean
         mid_lat = (self.start[0] + self.goal[0]) / 2
         mid_lon = (self.start[1] + self.goal[1]) / 2 - 1.0  # Offset west toward Arabian Sea
         return (mid_lat, mid_lon)
     
+    def _grid_point(self, index: int) -> Tuple[float, float]:
+        """(lat, lon) of the sampling grid cell at a flat index"""
+        return (float(self._grid_lat[index]), float(self._grid_lon[index]))
+    
+    def _sample_point(self) -> Tuple[float, float]:
+        """Random water point; once a path exists, from the informed ellipse only"""
+        if self.informed and self.connection_point is not None:
+            point = self._sample_informed(self.best_path_cost)
+            if point is not None:
+                return point
+        return self._get_random_water_point()
+    
+    def _sample_informed(self, c_best: float, attempts: int = 10) -> Optional[Tuple[float, float]]:
+        """
+        Uniform water point from the ellipse with foci start and goal that
+        holds every path cheaper than c_best (Informed RRT*).
+        
+        Path cost is Euclidean length times hazard multipliers, which can
+        discount a segment down to _min_hazard_multiplier (piracy zones). A
+        path cheaper than c_best is therefore shorter than
+        c_best / _min_hazard_multiplier, the ellipse's major axis.
+        
+        Returns:
+            Point, or None if the ellipse is degenerate (the best path cannot
+            be improved) or no sample hit water
+        """
+        c_min = self._distance(self.start, self.goal)
+        max_length = c_best / self._min_hazard_multiplier
+        if c_min == 0 or max_length <= c_min:
+            return None
+        
+        # Semi-axes, and unit vectors along and across the start-goal line
+        a = max_length / 2
+        b = math.sqrt(max_length**2 - c_min**2) / 2
+        e_lat = (self.goal[0] - self.start[0]) / c_min
+        e_lon = (self.goal[1] - self.start[1]) / c_min
+        center_lat = (self.start[0] + self.goal[0]) / 2
+        center_lon = (self.start[1] + self.goal[1]) / 2
+        
+        for _ in range(attempts):
+            # Uniform in the unit disk, stretched to the ellipse
+            r = math.sqrt(random.random())
+            phi = 2 * math.pi * random.random()
+            x = a * r * math.cos(phi)
+            y = b * r * math.sin(phi)
+            lat = center_lat + x * e_lat - y * e_lon
+            lon = center_lon + x * e_lon + y * e_lat
+            if self._is_water(lat, lon):
+                return (lat, lon)
+        
+        return None
+    
     def _get_hazard_cost(self, lat: float, lon: float) -> float:
         """Calculate hazard cost multiplier for a point"""
         cost = 1.0
@@ -272,11 +399,11 @@ class HybridBidirectionalRRTStar:
         """Haversine distance in degrees"""
         return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
     
-    def _nearest_node(self, point: Tuple[float, float], tree: Set[TreeNode]) -> TreeNode:
+    def _nearest_node(self, point: Tuple[float, float], tree: SpatialTree) -> TreeNode:
         """Find nearest node in tree"""
-        return min(tree, key=lambda n: self._distance((n.lat, n.lon), point))
+        return tree.nearest(point)
     
-    def _extend(self, tree: Set[TreeNode], point: Tuple[float, float]) -> Optional[TreeNode]:
+    def _extend(self, tree: SpatialTree, point: Tuple[float, float]) -> Optional[TreeNode]:
         """Extend one tree toward a point"""
         nearest = self._nearest_node(point, tree)
         nearest_pos = (nearest.lat, nearest.lon)
@@ -313,7 +440,7 @@ class HybridBidirectionalRRTStar:
             if random.random() < self.goal_bias:
                 rand_point = self.goal
             else:
-                rand_point = self._get_random_water_point()
+                rand_point = self._sample_point()
             
             # Extend from start tree
             new_start = self._extend(self.tree_start, rand_point)
@@ -336,7 +463,7 @@ class HybridBidirectionalRRTStar:
             if random.random() < self.goal_bias:
                 rand_point = self.start  # Bias toward start from goal side
             else:
-                rand_point = self._get_random_water_point()
+                rand_point = self._sample_point()
             
             new_goal = self._extend(self.tree_goal, rand_point)
             
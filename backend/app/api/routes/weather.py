@@ -1,22 +1,28 @@
-from fastapi import APIRouter, HTTPException
-from app.services.weather import WeatherService
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from app.services.weather import CACHE_DURATION, WeatherService
 from app.models.schemas import WeatherPoint
 
 router = APIRouter()
 
+# Weather is refreshed upstream every CACHE_DURATION, so clients and proxies may reuse it
+WEATHER_CACHE_CONTROL = f"max-age={CACHE_DURATION}, stale-while-revalidate=60"
+
 @router.get("/current")
-async def get_current_weather(latitude: float, longitude: float):
+async def get_current_weather(latitude: float, longitude: float, response: Response):
     """Get current weather for coordinates"""
     
     if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
         raise HTTPException(status_code=400, detail="Invalid coordinates")
     
     weather_service = WeatherService()
-    weather = weather_service.get_current_weather(latitude, longitude)
+    # Blocking HTTP call: keep it off the event loop
+    weather = await run_in_threadpool(weather_service.get_current_weather, latitude, longitude)
     
     if not weather:
         raise HTTPException(status_code=500, detail="Could not fetch weather data")
     
+    response.headers["Cache-Control"] = WEATHER_CACHE_CONTROL
     return {
         "latitude": latitude,
         "longitude": longitude,
@@ -29,6 +35,7 @@ async def get_route_weather(
     start_lon: float,
     end_lat: float,
     end_lon: float,
+    response: Response,
     num_points: int = 5
 ):
     """Get weather along route"""
@@ -43,8 +50,9 @@ async def get_route_weather(
         num_points = 5
     
     weather_service = WeatherService()
-    weather_data = weather_service.get_route_weather(
-        start_lat, start_lon, end_lat, end_lon, num_points
+    weather_data = await run_in_threadpool(
+        weather_service.get_route_weather, start_lat, start_lon, end_lat, end_lon, num_points
     )
     
+    response.headers["Cache-Control"] = WEATHER_CACHE_CONTROL
     return {"weather_points": weather_data}
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./ship_routing.db"
     
+    # Precomputed data (land raster etc.), shared by all worker processes
+    DATA_CACHE_DIR: str = "./.cache"
+    
     # CORS
     CORS_ORIGINS: List[str] = [
         "http://localhost",
@@ -22,6 +25,7 @@ class Settings(BaseSettings):
     
     # Weather API
     OPENWEATHER_API_KEY: str = "your-openweather-api-key"
+    WEATHER_CACHE_MAXSIZE: int = 10_000  # Cached points per provider
     
     # Indian Ocean center coordinates
     INDIAN_OCEAN_CENTER_LAT: float = 5.0
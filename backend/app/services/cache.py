@@ -0,0 +1,193 @@
+"""
+Shared caching primitives for weather services
+
+- TTLCache: size-capped in-memory cache with per-entry expiry and an
+  optional persistent SQLite tier (DiskCache)
+- SingleFlight: collapses concurrent calls for the same key into one
+"""
+
+import marshal
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.config import settings
+
+
+class DiskCache:
+    """
+    Weather entries persisted in SQLite under settings.DATA_CACHE_DIR.
+    
+    Survives process restarts, so a redeploy does not trigger a refetch storm
+    against the providers. Expiry uses wall-clock time since entries outlive
+    the process. Any database error disables the disk tier instead of
+    failing weather lookups.
+    
+    Values (plain dicts of str/float) are stored in marshal's binary format,
+    several times faster to encode and decode than JSON; keys carry the
+    marshal format version so a format change can never be misread.
+    """
+    
+    SCHEMA_VERSION = 2     # Bump when the cached payload format changes
+    PRUNE_EVERY = 1000     # Writes between sweeps of expired rows
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._disabled = False
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS weather "
+                         "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)")
+            self._conn = conn
+        return self._conn
+    
+    def _key(self, key: str) -> str:
+        return f"v{self.SCHEMA_VERSION}.{marshal.version}:{key}"
+    
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(value, seconds until expiry) for key, or None if missing or expired"""
+        if self._disabled:
+            return None
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT value, expires_at FROM weather WHERE key = ?", (self._key(key),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return None
+        return marshal.loads(row[0]), remaining
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds"""
+        if self._disabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("INSERT OR REPLACE INTO weather (key, expires_at, value) VALUES (?, ?, ?)",
+                             (self._key(key), time.time() + ttl, marshal.dumps(value)))
+                self._writes += 1
+                if self._writes % self.PRUNE_EVERY == 0:
+                    conn.execute("DELETE FROM weather WHERE expires_at < ?", (time.time(),))
+                conn.commit()
+        except sqlite3.Error as e:
+            self._disable(e)
+    
+    def _disable(self, error: Exception):
+        print(f"[Cache] Disk cache disabled ({self.path}): {error}")
+        self._disabled = True
+
+
+_disk_cache: Optional[DiskCache] = None
+
+
+def get_disk_cache() -> DiskCache:
+    """Get or create the shared persistent weather cache"""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = DiskCache(os.path.join(settings.DATA_CACHE_DIR, "weather_cache.sqlite3"))
+    return _disk_cache
+
+
+class TTLCache:
+    """
+    Size-capped, thread-safe cache whose entries expire after ttl seconds.
+    
+    Once maxsize entries are held, the least recently used one is evicted,
+    so a long-running process does not accumulate every point ever queried.
+    With a disk tier, memory misses fall through to it and writes go to both.
+    In memory, expiry is a monotonic-clock deadline: one float comparison
+    per lookup, unaffected by wall-clock adjustments.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float, disk: Optional[DiskCache] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk = disk
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Fresh value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+        
+        if self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                value, remaining = stored
+                self._store(key, value, remaining)
+                return value
+        
+        return default
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store value under key for ttl seconds (default: the cache's ttl)"""
+        ttl = self.ttl if ttl is None else ttl
+        self._store(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+    
+    def _store(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one in-flight call"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+    
+    def do(self, key: str, fn: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Run fn() for key, or wait for the result of a call already running for key"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
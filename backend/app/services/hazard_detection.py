@@ -16,6 +16,9 @@ References:
 """
 
 import math
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Set
 from enum import Enum
 from datetime import datetime
@@ -51,7 +54,8 @@ class HazardZone:
                  center_lat: float, center_lon: float, radius_deg: float,
                  severity: HazardLevel = HazardLevel.MODERATE,
                  active_months: Optional[List[int]] = None,
-                 cost_multiplier: float = 1.0):
+                 cost_multiplier: float = 1.0,
+                 created_at: Optional[datetime] = None):
         self.name = name
         self.hazard_type = hazard_type
         self.center_lat = center_lat
@@ -60,39 +64,153 @@ class HazardZone:
         self.severity = severity
         self.active_months = active_months or list(range(1, 13))  # Active all year by default
         self.cost_multiplier = cost_multiplier
-        self.created_at = datetime.utcnow()
+        self.created_at = created_at  # Stamped when added as a dynamic hazard
     
     def contains_point(self, lat: float, lon: float) -> bool:
         """Check if point is within hazard zone"""
-        dist = math.sqrt((lat - self.center_lat)**2 + (lon - self.center_lon)**2)
-        return dist <= self.radius_deg
+        d_lat = lat - self.center_lat
+        d_lon = lon - self.center_lon
+        return d_lat * d_lat + d_lon * d_lon <= self.radius_deg * self.radius_deg
     
     def is_active(self, month: int) -> bool:
         """Check if hazard is active in given month"""
         return month in self.active_months
     
-    def get_severity_for_point(self, lat: float, lon: float) -> Tuple[HazardLevel, float]:
+    def evaluate_point(self, lat: float, lon: float) -> Tuple[bool, HazardLevel, float, float]:
         """
-        Get hazard severity for a point (0 if outside, degrades with distance from edge).
+        Containment and severity for a point in a single pass.
+        
+        Rejects points outside the zone on squared distance, so only points
+        inside the zone pay for one square root.
         
         Returns:
-            (severity_level, cost_multiplier)
+            (inside, severity_level, cost_multiplier, distance_from_center)
         """
-        dist = math.sqrt((lat - self.center_lat)**2 + (lon - self.center_lon)**2)
+        d_lat = lat - self.center_lat
+        d_lon = lon - self.center_lon
+        dist_sq = d_lat * d_lat + d_lon * d_lon
+        if dist_sq > self.radius_deg * self.radius_deg:
+            return (False, HazardLevel.NONE, 1.0, -1.0)
         
-        if dist > self.radius_deg:
-            return (HazardLevel.NONE, 1.0)
+        dist = math.sqrt(dist_sq)
         
         # Severity increases closer to center
         proximity_factor = (self.radius_deg - dist) / self.radius_deg
         severity_value = int(self.severity.value * proximity_factor)
         
         if severity_value >= self.severity.value:
-            return (self.severity, self.cost_multiplier)
+            return (True, self.severity, self.cost_multiplier, dist)
         elif severity_value == 0:
-            return (HazardLevel.NONE, 1.0)
+            return (True, HazardLevel.NONE, 1.0, dist)
         else:
-            return (HazardLevel(severity_value), 1.0 + (self.cost_multiplier - 1.0) * (proximity_factor * 0.5))
+            return (True, HazardLevel(severity_value),
+                    1.0 + (self.cost_multiplier - 1.0) * (proximity_factor * 0.5), dist)
+    
+    def get_severity_for_point(self, lat: float, lon: float) -> Tuple[HazardLevel, float]:
+        """
+        Get hazard severity for a point (0 if outside, degrades with distance from edge).
+        
+        Returns:
+            (severity_level, cost_multiplier)
+        """
+        _, severity, cost, _ = self.evaluate_point(lat, lon)
+        return (severity, cost)
+
+
+# Static hazard zone table, one row per HazardZone:
+# (name, hazard_type, center_lat, center_lon, radius_deg, severity, active_months, cost_multiplier)
+_STATIC_ZONE_DEFS: List[Tuple[str, HazardType, float, float, float, HazardLevel, Optional[List[int]], float]] = [
+    # Permanent geographical hazards (shallow water and congestion)
+    ("Suez Canal Approach", HazardType.SHALLOW_WATER, 30.5, 32.3, 0.5, HazardLevel.MODERATE, None, 2.0),
+    ("Red Sea Narrows", HazardType.SHALLOW_WATER, 19.0, 40.0, 1.0, HazardLevel.MODERATE, None, 1.8),
+    ("Strait of Malacca", HazardType.SHALLOW_WATER, 2.0, 101.0, 1.5, HazardLevel.HIGH, None, 2.5),
+    ("Singapore Strait", HazardType.SHALLOW_WATER, 1.3, 103.8, 0.8, HazardLevel.HIGH, None, 2.3),
+    ("Sunda Strait", HazardType.SHALLOW_WATER, -6.5, 105.8, 1.0, HazardLevel.MODERATE, None, 2.0),
+    ("English Channel", HazardType.SHALLOW_WATER, 50.0, -2.0, 1.5, HazardLevel.MODERATE, None, 1.8),
+    ("Gulf of Mexico Shallows", HazardType.SHALLOW_WATER, 25.0, -90.0, 3.0, HazardLevel.LOW, None, 1.3),
+    
+    # Southwest Monsoon (May-September): Arabian Sea, Bay of Bengal, Eastern Indian Ocean
+    ("Arabian Sea Southwest Monsoon", HazardType.MONSOON, 12.0, 65.0, 12.0, HazardLevel.HIGH, [5, 6, 7, 8, 9], 3.5),
+    ("Bay of Bengal Southwest Monsoon", HazardType.MONSOON, 15.0, 90.0, 10.0, HazardLevel.HIGH, [5, 6, 7, 8, 9], 3.3),
+    ("Eastern Indian Ocean Southwest Monsoon", HazardType.MONSOON, 5.0, 105.0, 8.0, HazardLevel.MODERATE, [5, 6, 7, 8, 9], 2.8),
+    # Northeast Monsoon transition periods (October-November, March-April)
+    ("Arabian Sea Monsoon Transition", HazardType.MONSOON, 12.0, 65.0, 10.0, HazardLevel.MODERATE, [10, 11, 3, 4], 2.0),
+    
+    # Cyclone-prone areas (Bay of Bengal/Arabian Sea: May-June, September-November)
+    ("Bay of Bengal Cyclone Zone", HazardType.CYCLONE, 15.0, 88.0, 8.0, HazardLevel.CRITICAL, [5, 6, 9, 10, 11], 5.0),
+    ("Arabian Sea Cyclone Zone", HazardType.CYCLONE, 12.0, 62.0, 8.0, HazardLevel.CRITICAL, [5, 6, 9, 10, 11], 5.0),
+    # Northwest Pacific typhoon season (June-November)
+    ("Northwest Pacific Typhoon Zone", HazardType.CYCLONE, 20.0, 130.0, 15.0, HazardLevel.HIGH, [6, 7, 8, 9, 10, 11], 3.5),
+    
+    # Traffic separation schemes (TSS) - LOWER cost to encourage use of the lanes
+    ("Suez Canal TSS", HazardType.TRAFFIC_CONGESTION, 30.5, 32.3, 1.0, HazardLevel.LOW, None, 0.8),
+    ("Singapore Strait TSS", HazardType.TRAFFIC_CONGESTION, 1.3, 103.8, 1.2, HazardLevel.LOW, None, 0.85),
+    ("Malacca Strait TSS", HazardType.TRAFFIC_CONGESTION, 2.0, 101.0, 1.5, HazardLevel.LOW, None, 0.9),
+    ("Arabian Sea Shipping Lanes", HazardType.TRAFFIC_CONGESTION, 10.0, 60.0, 3.0, HazardLevel.LOW, None, 0.95),
+    
+    # Piracy-prone areas
+    ("Gulf of Aden - Piracy Risk", HazardType.PIRACY, 12.5, 48.0, 4.0, HazardLevel.MODERATE, None, 1.8),
+    ("Malacca Strait - Piracy Risk", HazardType.PIRACY, 2.0, 101.0, 2.0, HazardLevel.LOW, None, 1.3),
+    
+    # Ice-prone areas (Arctic winter, southern winter)
+    ("Arctic Ice Zone", HazardType.ICE, 75.0, 0.0, 20.0, HazardLevel.HIGH, [1, 2, 3, 11, 12], 4.0),
+    ("Southern Ocean Ice Zone", HazardType.ICE, -60.0, 0.0, 15.0, HazardLevel.MODERATE, [6, 7, 8, 9], 2.5),
+]
+
+
+def _month_mask(active_months: Optional[List[int]]) -> int:
+    """Bitmask of active months (bit 0 = January); None means all year"""
+    if active_months is None:
+        return (1 << 12) - 1
+    mask = 0
+    for month in active_months:
+        mask |= 1 << (month - 1)
+    return mask
+
+
+def _compile_zone_evaluator(zones: List[Tuple[HazardZone, int]]):
+    """
+    Generate a point evaluator with every zone's constants inlined.
+    
+    The emitted function mirrors HazardZone.evaluate_point for each zone in
+    turn, with centers, squared radii, severities and costs written as
+    literals, so a single-point query does no attribute or array loads.
+    
+    Args:
+        zones: (zone, active_month_mask) pairs
+    
+    Returns:
+        fn(lat, lon, month_bit, is_hazardous, max_cost, max_sev)
+            -> (is_hazardous, max_cost, max_sev)
+    """
+    lines = ["def _zone_evaluator(lat, lon, month_bit, is_hazardous, max_cost, max_sev):"]
+    for zone, mask in zones:
+        radius = float(zone.radius_deg)
+        severity = zone.severity.value
+        cost = float(zone.cost_multiplier)
+        lines += [
+            f"    if month_bit & {mask}:",
+            f"        d_lat = lat - {float(zone.center_lat)!r}",
+            f"        d_lon = lon - {float(zone.center_lon)!r}",
+            f"        dist_sq = d_lat * d_lat + d_lon * d_lon",
+            f"        if dist_sq <= {radius * radius!r}:",
+            f"            proximity = ({radius!r} - sqrt(dist_sq)) / {radius!r}",
+            f"            level = int({severity} * proximity)",
+            f"            if level >= {severity}:",
+            f"                is_hazardous = True",
+            f"                if {severity} > max_sev: max_sev = {severity}",
+            f"                if {cost!r} > max_cost: max_cost = {cost!r}",
+            f"            elif level > 0:",
+            f"                is_hazardous = True",
+            f"                if level > max_sev: max_sev = level",
+            f"                cost = 1.0 + {cost - 1.0!r} * (proximity * 0.5)",
+            f"                if cost > max_cost: max_cost = cost",
+        ]
+    lines.append("    return (is_hazardous, max_cost, max_sev)")
+    
+    namespace = {"sqrt": math.sqrt}
+    exec(compile("\n".join(lines), "<hazard-zone-evaluator>", "exec"), namespace)
+    return namespace["_zone_evaluator"]
 
 
 class HazardDetectionService:
@@ -102,297 +220,201 @@ class HazardDetectionService:
     Combines multiple hazard sources with real-time weather integration.
     """
     
+    # Waypoints per run when pruning candidate zones along a route
+    ROUTE_CHUNK_SIZE = 64
+    # Routes at least this long evaluate the zone arrays across threads
+    PARALLEL_MIN_WAYPOINTS = 4096
+    
     def __init__(self, ocean_grid: Optional[OceanGrid] = None):
         """
         Initialize hazard detection service.
         
         Args:
-            ocean_grid: Pre-initialized OceanGrid, or creates new one
+            ocean_grid: Pre-initialized OceanGrid, or one is created on first use
         """
-        self.ocean_grid = ocean_grid or OceanGrid(level=1)
-        self.hazard_zones: List[HazardZone] = []
+        self._ocean_grid = ocean_grid
+        self.hazard_zones: List[HazardZone] = [HazardZone(*row) for row in _STATIC_ZONE_DEFS]
         self.dynamic_hazards: Dict[str, HazardZone] = {}  # Real-time hazards (cyclones, storms)
         
-        # Initialize static hazard zones
-        self._initialize_static_hazards()
-        self._initialize_monsoon_zones()
-        self._initialize_cyclone_zones()
-        self._initialize_traffic_schemes()
-        self._initialize_piracy_zones()
-        self._initialize_ice_zones()
-    
-    def _initialize_static_hazards(self):
-        """Add permanent geographical hazard zones"""
-        # Suez Canal - shallow water and congestion
-        self.hazard_zones.append(HazardZone(
-            name="Suez Canal Approach",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=30.5,
-            center_lon=32.3,
-            radius_deg=0.5,
-            severity=HazardLevel.MODERATE,
-            cost_multiplier=2.0
-        ))
-        
-        # Red Sea - shallow water and congestion
-        self.hazard_zones.append(HazardZone(
-            name="Red Sea Narrows",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=19.0,
-            center_lon=40.0,
-            radius_deg=1.0,
-            severity=HazardLevel.MODERATE,
-            cost_multiplier=1.8
-        ))
-        
-        # Strait of Malacca - shallow and congestion
-        self.hazard_zones.append(HazardZone(
-            name="Strait of Malacca",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=2.0,
-            center_lon=101.0,
-            radius_deg=1.5,
-            severity=HazardLevel.HIGH,
-            cost_multiplier=2.5
-        ))
-        
-        # Singapore Strait
-        self.hazard_zones.append(HazardZone(
-            name="Singapore Strait",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=1.3,
-            center_lon=103.8,
-            radius_deg=0.8,
-            severity=HazardLevel.HIGH,
-            cost_multiplier=2.3
-        ))
-        
-        # Sunda Strait (between Java and Sumatra)
-        self.hazard_zones.append(HazardZone(
-            name="Sunda Strait",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=-6.5,
-            center_lon=105.8,
-            radius_deg=1.0,
-            severity=HazardLevel.MODERATE,
-            cost_multiplier=2.0
-        ))
-        
-        # English Channel
-        self.hazard_zones.append(HazardZone(
-            name="English Channel",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=50.0,
-            center_lon=-2.0,
-            radius_deg=1.5,
-            severity=HazardLevel.MODERATE,
-            cost_multiplier=1.8
-        ))
-        
-        # Gulf of Mexico shallow areas
-        self.hazard_zones.append(HazardZone(
-            name="Gulf of Mexico Shallows",
-            hazard_type=HazardType.SHALLOW_WATER,
-            center_lat=25.0,
-            center_lon=-90.0,
-            radius_deg=3.0,
-            severity=HazardLevel.LOW,
-            cost_multiplier=1.3
-        ))
+        # Derived zone structures are rebuilt lazily when the version moves
+        self._zones_version = 0
+        self._arrays_version = -1
+        self._zones_by_month: Dict[int, List[HazardZone]] = {}
     
-    def _initialize_monsoon_zones(self):
-        """Add seasonal monsoon hazard zones"""
-        # Southwest Monsoon (May-September): Dangerous in Arabian Sea and Bay of Bengal
-        
-        # Arabian Sea
-        self.hazard_zones.append(HazardZone(
-            name="Arabian Sea Southwest Monsoon",
-            hazard_type=HazardType.MONSOON,
-            center_lat=12.0,
-            center_lon=65.0,
-            radius_deg=12.0,
-            severity=HazardLevel.HIGH,
-            active_months=[5, 6, 7, 8, 9],
-            cost_multiplier=3.5
-        ))
-        
-        # Bay of Bengal
-        self.hazard_zones.append(HazardZone(
-            name="Bay of Bengal Southwest Monsoon",
-            hazard_type=HazardType.MONSOON,
-            center_lat=15.0,
-            center_lon=90.0,
-            radius_deg=10.0,
-            severity=HazardLevel.HIGH,
-            active_months=[5, 6, 7, 8, 9],
-            cost_multiplier=3.3
-        ))
-        
-        # Eastern Indian Ocean
-        self.hazard_zones.append(HazardZone(
-            name="Eastern Indian Ocean Southwest Monsoon",
-            hazard_type=HazardType.MONSOON,
-            center_lat=5.0,
-            center_lon=105.0,
-            radius_deg=8.0,
-            severity=HazardLevel.MODERATE,
-            active_months=[5, 6, 7, 8, 9],
-            cost_multiplier=2.8
-        ))
-        
-        # Northeast Monsoon transition periods (October-November, March-April)
-        self.hazard_zones.append(HazardZone(
-            name="Arabian Sea Monsoon Transition",
-            hazard_type=HazardType.MONSOON,
-            center_lat=12.0,
-            center_lon=65.0,
-            radius_deg=10.0,
-            severity=HazardLevel.MODERATE,
-            active_months=[10, 11, 3, 4],
-            cost_multiplier=2.0
-        ))
+    @property
+    def ocean_grid(self) -> OceanGrid:
+        """Ocean grid used for shallow-water checks (built on first access)"""
+        if self._ocean_grid is None:
+            self._ocean_grid = OceanGrid(level=1)
+        return self._ocean_grid
     
-    def _initialize_cyclone_zones(self):
-        """Add cyclone-prone areas"""
-        # Bay of Bengal cyclone season (May-June, September-November)
-        self.hazard_zones.append(HazardZone(
-            name="Bay of Bengal Cyclone Zone",
-            hazard_type=HazardType.CYCLONE,
-            center_lat=15.0,
-            center_lon=88.0,
-            radius_deg=8.0,
-            severity=HazardLevel.CRITICAL,
-            active_months=[5, 6, 9, 10, 11],
-            cost_multiplier=5.0
-        ))
+    @ocean_grid.setter
+    def ocean_grid(self, grid: OceanGrid):
+        self._ocean_grid = grid
+    
+    def _ensure_zone_arrays(self):
+        """Rebuild the per-month zone lists, SoA arrays and zone evaluator if zones changed"""
+        if self._arrays_version != self._zones_version:
+            self._zones_by_month = {}
+            self._build_zone_arrays()
+            self._zone_evaluator = _compile_zone_evaluator(
+                [(z, _month_mask(z.active_months)) for z in self.hazard_zones] +
+                [(z, _month_mask(None)) for z in self.dynamic_hazards.values()]
+            )
+            self._arrays_version = self._zones_version
+    
+    def _build_zone_arrays(self):
+        """
+        Pack static and dynamic zones into SoA arrays for the vectorized route path.
         
-        # Arabian Sea cyclone season
-        self.hazard_zones.append(HazardZone(
-            name="Arabian Sea Cyclone Zone",
-            hazard_type=HazardType.CYCLONE,
-            center_lat=12.0,
-            center_lon=62.0,
-            radius_deg=8.0,
-            severity=HazardLevel.CRITICAL,
-            active_months=[5, 6, 9, 10, 11],
-            cost_multiplier=5.0
-        ))
+        Narrow types are enough here: coordinates and radii are degree-scale
+        (float32 resolves ~1e-5°), costs carry two significant digits, severity
+        is 0-4 and the active months fit a 12-bit mask. Dynamic hazards are
+        active all year, matching get_all_hazards.
+        """
+        zones = self.hazard_zones + list(self.dynamic_hazards.values())
+        masks = [_month_mask(z.active_months) for z in self.hazard_zones]
+        masks += [_month_mask(None)] * len(self.dynamic_hazards)
+        
+        self._z_lat = np.array([z.center_lat for z in zones], dtype=np.float32)
+        self._z_lon = np.array([z.center_lon for z in zones], dtype=np.float32)
+        self._z_radius = np.array([z.radius_deg for z in zones], dtype=np.float32)
+        self._z_rsq = self._z_radius * self._z_radius
+        self._z_sev = np.array([z.severity.value for z in zones], dtype=np.int8)
+        self._z_cost = np.array([z.cost_multiplier for z in zones], dtype=np.float32)
+        self._z_active_mask = np.array(masks, dtype=np.uint16)
+        self._build_zone_index(zones, masks)
+    
+    def _build_zone_index(self, zones: List[HazardZone], masks: List[int]):
+        """
+        Build a hierarchical spatial hash over the zones.
         
-        # Northwest Pacific typhoon season (June-November)
-        self.hazard_zones.append(HazardZone(
-            name="Northwest Pacific Typhoon Zone",
-            hazard_type=HazardType.CYCLONE,
-            center_lat=20.0,
-            center_lon=130.0,
-            radius_deg=15.0,
-            severity=HazardLevel.HIGH,
-            active_months=[6, 7, 8, 9, 10, 11],
-            cost_multiplier=3.5
-        ))
+        Zone radii range from 0.5° (Suez) to 20° (Arctic), so one flat grid
+        either has huge buckets or inserts big zones into many cells. Instead
+        each zone goes to the level whose cell size (2**level degrees) covers
+        its diameter, so it lands in at most 2×2 cells of that level. A query
+        looks up one cell per level.
+        """
+        self._indexed_zones = zones
+        self._indexed_masks = masks
+        self._zone_levels: Dict[int, Dict[Tuple[int, int], List[int]]] = {}
+        
+        for idx, zone in enumerate(zones):
+            level = max(0, math.ceil(math.log2(2 * zone.radius_deg))) if zone.radius_deg > 0 else 0
+            size = float(2 ** level)
+            buckets = self._zone_levels.setdefault(level, {})
+            for i in range(math.floor((zone.center_lat - zone.radius_deg) / size),
+                           math.floor((zone.center_lat + zone.radius_deg) / size) + 1):
+                for j in range(math.floor((zone.center_lon - zone.radius_deg) / size),
+                               math.floor((zone.center_lon + zone.radius_deg) / size) + 1):
+                    buckets.setdefault((i, j), []).append(idx)
     
-    def _initialize_traffic_schemes(self):
-        """Add maritime traffic separation schemes (TSS) - these have LOWER cost to encourage use"""
-        # Suez Canal TSS
-        self.hazard_zones.append(HazardZone(
-            name="Suez Canal TSS",
-            hazard_type=HazardType.TRAFFIC_CONGESTION,
-            center_lat=30.5,
-            center_lon=32.3,
-            radius_deg=1.0,
-            severity=HazardLevel.LOW,
-            cost_multiplier=0.8  # LOWER cost to prefer this lane
-        ))
+    def _zone_candidates(self, lat: float, lon: float, current_month: int) -> List[HazardZone]:
+        """Active zones whose hash cell contains the point, in get_all_hazards order"""
+        self._ensure_zone_arrays()
+        month_bit = 1 << (current_month - 1)
+        hits = []
+        for level, buckets in self._zone_levels.items():
+            size = float(2 ** level)
+            hits.extend(buckets.get((math.floor(lat / size), math.floor(lon / size)), ()))
+        hits.sort()
+        return [self._indexed_zones[idx] for idx in hits if self._indexed_masks[idx] & month_bit]
+    
+    def _evaluate_zones(self, run: np.ndarray,
+                        current_month: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the zone arrays for a run of waypoints in one broadcast.
         
-        # Singapore Strait TSS
-        self.hazard_zones.append(HazardZone(
-            name="Singapore Strait TSS",
-            hazard_type=HazardType.TRAFFIC_CONGESTION,
-            center_lat=1.3,
-            center_lon=103.8,
-            radius_deg=1.2,
-            severity=HazardLevel.LOW,
-            cost_multiplier=0.85
-        ))
+        Zones inactive this month or not overlapping the run's bounding box are
+        dropped before the (waypoints × zones) evaluation.
         
-        # Malacca Strait TSS
-        self.hazard_zones.append(HazardZone(
-            name="Malacca Strait TSS",
-            hazard_type=HazardType.TRAFFIC_CONGESTION,
-            center_lat=2.0,
-            center_lon=101.0,
-            radius_deg=1.5,
-            severity=HazardLevel.LOW,
-            cost_multiplier=0.9
-        ))
+        Args:
+            run: (N, 2) array of (lat, lon) waypoints
+            current_month: Month (1-12)
         
-        # Indian Ocean main shipping lanes
-        self.hazard_zones.append(HazardZone(
-            name="Arabian Sea Shipping Lanes",
-            hazard_type=HazardType.TRAFFIC_CONGESTION,
-            center_lat=10.0,
-            center_lon=60.0,
-            radius_deg=3.0,
-            severity=HazardLevel.LOW,
-            cost_multiplier=0.95
-        ))
+        Returns:
+            (is_hazardous, max_cost, max_severity) arrays of length N
+        """
+        run = run.astype(np.float32, copy=False)
+        n = len(run)
+        min_lat, min_lon = run.min(axis=0)
+        max_lat, max_lon = run.max(axis=0)
+        
+        d_lat = self._z_lat - np.clip(self._z_lat, min_lat, max_lat)
+        d_lon = self._z_lon - np.clip(self._z_lon, min_lon, max_lon)
+        candidates = np.flatnonzero(
+            ((self._z_active_mask >> (current_month - 1)) & 1).astype(bool) &
+            (d_lat * d_lat + d_lon * d_lon <= self._z_rsq)
+        )
+        if candidates.size == 0:
+            return np.zeros(n, dtype=bool), np.ones(n, dtype=np.float32), np.zeros(n, dtype=np.int8)
+        
+        radius = self._z_radius[candidates]
+        severity = self._z_sev[candidates]
+        zone_cost = self._z_cost[candidates]
+        
+        d_lat = run[:, 0:1] - self._z_lat[candidates]
+        d_lon = run[:, 1:2] - self._z_lon[candidates]
+        dist_sq = d_lat * d_lat + d_lon * d_lon
+        dist = np.sqrt(dist_sq)
+        
+        # Same severity falloff as HazardZone.evaluate_point
+        proximity = (radius - dist) / radius
+        level = (severity * proximity).astype(np.int8)
+        full = level >= severity
+        hit = (dist_sq <= self._z_rsq[candidates]) & (level > 0)
+        cost = np.where(full, zone_cost, 1.0 + (zone_cost - 1.0) * (proximity * 0.5))
+        level = np.where(full, severity, level)
+        
+        max_cost = np.maximum(np.where(hit, cost, 1.0).max(axis=1), 1.0)
+        max_sev = np.where(hit, level, 0).max(axis=1)
+        return hit.any(axis=1), max_cost, max_sev
     
-    def _initialize_piracy_zones(self):
-        """Add piracy-prone areas"""
-        # Somali coast
-        self.hazard_zones.append(HazardZone(
-            name="Gulf of Aden - Piracy Risk",
-            hazard_type=HazardType.PIRACY,
-            center_lat=12.5,
-            center_lon=48.0,
-            radius_deg=4.0,
-            severity=HazardLevel.MODERATE,
-            cost_multiplier=1.8
-        ))
-        
-        # Strait of Malacca piracy
-        self.hazard_zones.append(HazardZone(
-            name="Malacca Strait - Piracy Risk",
-            hazard_type=HazardType.PIRACY,
-            center_lat=2.0,
-            center_lon=101.0,
-            radius_deg=2.0,
-            severity=HazardLevel.LOW,
-            cost_multiplier=1.3
-        ))
+    def _evaluate_zones_slice(self, coords: np.ndarray,
+                              current_month: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run _evaluate_zones over consecutive runs of a (non-empty) waypoint slice"""
+        results = [
+            self._evaluate_zones(coords[start:start + self.ROUTE_CHUNK_SIZE], current_month)
+            for start in range(0, len(coords), self.ROUTE_CHUNK_SIZE)
+        ]
+        hit, cost, sev = zip(*results)
+        return np.concatenate(hit), np.concatenate(cost), np.concatenate(sev)
     
-    def _initialize_ice_zones(self):
-        """Add ice-prone areas"""
-        # Arctic
-        self.hazard_zones.append(HazardZone(
-            name="Arctic Ice Zone",
-            hazard_type=HazardType.ICE,
-            center_lat=75.0,
-            center_lon=0.0,
-            radius_deg=20.0,
-            severity=HazardLevel.HIGH,
-            active_months=[1, 2, 3, 11, 12],  # Winter months
-            cost_multiplier=4.0
-        ))
+    def _evaluate_zones_route(self, coords: np.ndarray,
+                              current_month: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Zone evaluation for a whole route.
         
-        # Southern Ocean
-        self.hazard_zones.append(HazardZone(
-            name="Southern Ocean Ice Zone",
-            hazard_type=HazardType.ICE,
-            center_lat=-60.0,
-            center_lon=0.0,
-            radius_deg=15.0,
-            severity=HazardLevel.MODERATE,
-            active_months=[6, 7, 8, 9],  # Southern winter
-            cost_multiplier=2.5
+        Long routes are cut into one run-aligned slice per worker and dispatched
+        to a shared thread pool; NumPy releases the GIL inside the broadcasts.
+        Slices are concatenated back in route order.
+        """
+        if len(coords) == 0:
+            return np.zeros(0, dtype=bool), np.ones(0, dtype=np.float32), np.zeros(0, dtype=np.int8)
+        if len(coords) < self.PARALLEL_MIN_WAYPOINTS:
+            return self._evaluate_zones_slice(coords, current_month)
+        
+        runs = -(-len(coords) // self.ROUTE_CHUNK_SIZE)
+        runs_per_slice = -(-runs // _WORKERS)
+        step = runs_per_slice * self.ROUTE_CHUNK_SIZE
+        slices = [coords[start:start + step] for start in range(0, len(coords), step)]
+        results = list(_get_executor().map(
+            lambda part: self._evaluate_zones_slice(part, current_month), slices
         ))
+        hit, cost, sev = zip(*results)
+        return np.concatenate(hit), np.concatenate(cost), np.concatenate(sev)
     
     def add_dynamic_hazard(self, hazard_id: str, hazard: HazardZone):
         """Add or update a dynamic real-time hazard (e.g., active cyclone)"""
+        if hazard.created_at is None:
+            hazard.created_at = datetime.utcnow()
         self.dynamic_hazards[hazard_id] = hazard
+        self._zones_version += 1
     
     def remove_dynamic_hazard(self, hazard_id: str):
         """Remove a dynamic hazard"""
-        self.dynamic_hazards.pop(hazard_id, None)
+        if self.dynamic_hazards.pop(hazard_id, None) is not None:
+            self._zones_version += 1
     
     def get_all_hazards(self, current_month: Optional[int] = None) -> List[HazardZone]:
         """
@@ -407,8 +429,12 @@ class HazardDetectionService:
         if current_month is None:
             current_month = datetime.utcnow().month
         
-        active = [h for h in self.hazard_zones if h.is_active(current_month)]
-        active.extend(self.dynamic_hazards.values())
+        self._ensure_zone_arrays()
+        active = self._zones_by_month.get(current_month)
+        if active is None:
+            active = [h for h in self.hazard_zones if h.is_active(current_month)]
+            active.extend(self.dynamic_hazards.values())
+            self._zones_by_month[current_month] = active
         return active
     
     def evaluate_point_hazard(self, lat: float, lon: float, 
@@ -452,19 +478,17 @@ class HazardDetectionService:
                 max_cost = max(max_cost, grid_cell.cost)
         
         # Check zone-based hazards
-        active_zones = self.get_all_hazards(current_month)
-        for zone in active_zones:
-            if zone.contains_point(lat, lon):
-                severity, cost = zone.get_severity_for_point(lat, lon)
-                if severity != HazardLevel.NONE:
-                    hazards.append({
-                        "name": zone.name,
-                        "type": zone.hazard_type.value,
-                        "severity": severity.name,
-                        "distance_from_center": math.sqrt((lat - zone.center_lat)**2 + (lon - zone.center_lon)**2),
-                        "cost_multiplier": cost
-                    })
-                    max_cost = max(max_cost, cost)
+        for zone in self._zone_candidates(lat, lon, current_month):
+            _, severity, cost, dist = zone.evaluate_point(lat, lon)
+            if severity != HazardLevel.NONE:
+                hazards.append({
+                    "name": zone.name,
+                    "type": zone.hazard_type.value,
+                    "severity": severity.name,
+                    "distance_from_center": dist,
+                    "cost_multiplier": cost
+                })
+                max_cost = max(max_cost, cost)
         
         return {
             "is_hazardous": len(hazards) > 0,
@@ -475,11 +499,67 @@ class HazardDetectionService:
             "longitude": lon
         }
     
+    def evaluate_point_hazard_fast(self, lat: float, lon: float,
+                                   current_month: Optional[int] = None,
+                                   check_land: bool = True,
+                                   zones: Optional[List[HazardZone]] = None) -> Tuple[bool, float, int]:
+        """
+        Allocation-free variant of evaluate_point_hazard for route aggregation.
+        
+        Args:
+            lat, lon: Coordinates
+            current_month: Month (1-12)
+            check_land: Set False when the caller already ran a batched land check
+            zones: Candidate zones to test; by default all active hazards are
+                evaluated through the generated zone evaluator
+        
+        Returns:
+            (is_hazardous, cost_multiplier, max_severity_value)
+        """
+        if current_month is None:
+            current_month = datetime.utcnow().month
+        
+        if check_land and LandDetectionService.is_point_on_land(lat, lon):
+            return (True, float('inf'), HazardLevel.CRITICAL.value)
+        
+        is_hazardous = False
+        max_cost = 1.0
+        max_sev = HazardLevel.NONE.value
+        
+        grid_cell = self.ocean_grid.get_cell(lat, lon)
+        if grid_cell and grid_cell.cell_type == CellType.SHALLOW:
+            is_hazardous = True
+            max_sev = HazardLevel.MODERATE.value
+            if grid_cell.cost > max_cost:
+                max_cost = grid_cell.cost
+        
+        if zones is None:
+            self._ensure_zone_arrays()
+            return self._zone_evaluator(lat, lon, 1 << (current_month - 1),
+                                        is_hazardous, max_cost, max_sev)
+        
+        for zone in zones:
+            _, severity, cost, _ = zone.evaluate_point(lat, lon)
+            if severity != HazardLevel.NONE:
+                is_hazardous = True
+                if severity.value > max_sev:
+                    max_sev = severity.value
+                if cost > max_cost:
+                    max_cost = cost
+        
+        return (is_hazardous, max_cost, max_sev)
+    
     def evaluate_route_hazards(self, waypoints: List[Tuple[float, float]], 
                               current_month: Optional[int] = None) -> Dict:
         """
         Evaluate hazards along an entire route.
         
+        Land is checked for the whole route in one batched call, and all zones
+        (static and dynamic) are evaluated with NumPy in runs of ROUTE_CHUNK_SIZE
+        (split across threads for long routes). Only the shallow-water grid
+        check goes through the tuple-returning fast path per waypoint. The full
+        hazard dict is only built for waypoints that report.
+        
         Args:
             waypoints: List of (lat, lon) coordinates
             current_month: Month (1-12)
@@ -495,12 +575,25 @@ class HazardDetectionService:
         hazard_points = []
         critical_hazards = []
         
-        for lat, lon in waypoints:
-            evaluation = self.evaluate_point_hazard(lat, lon, current_month)
-            cost = evaluation["cost_multiplier"]
+        coords = np.asarray(waypoints, dtype=np.float64).reshape(-1, 2)
+        on_land = LandDetectionService.points_on_land(coords[:, 0], coords[:, 1])
+        
+        self._ensure_zone_arrays()
+        zone_hit, zone_cost, _ = self._evaluate_zones_route(coords, current_month)
+        
+        for i, (lat, lon) in enumerate(waypoints):
+            if on_land[i]:
+                is_hazardous, cost = True, float('inf')
+            else:
+                is_hazardous, cost, _ = self.evaluate_point_hazard_fast(
+                    lat, lon, current_month, check_land=False, zones=()
+                )
+                is_hazardous = is_hazardous or bool(zone_hit[i])
+                cost = max(cost, float(zone_cost[i]))
             total_cost += cost
             
-            if evaluation["is_hazardous"]:
+            if is_hazardous:
+                evaluation = self.evaluate_point_hazard(lat, lon, current_month)
                 hazard_points.append(evaluation)
                 for hazard in evaluation["hazards"]:
                     sev = HazardLevel[hazard["severity"]]
@@ -520,3 +613,16 @@ class HazardDetectionService:
             "hazard_points": hazard_points,
             "risk_assessment": "HIGH" if max_severity in [HazardLevel.CRITICAL, HazardLevel.HIGH] else "MODERATE" if max_severity == HazardLevel.MODERATE else "LOW"
         }
+
+
+# Shared worker pool for long-route zone evaluation
+_WORKERS = os.cpu_count() or 1
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared hazard evaluation thread pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="hazard-eval")
+    return _executor
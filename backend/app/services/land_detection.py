@@ -8,8 +8,14 @@ This is CRITICAL for preventing ships from routing through land.
 Accuracy is essential for research-grade maritime routing.
 """
 
+import hashlib
 import math
-from typing import Tuple, List, Dict
+import os
+from math import asin as _asin, cos as _cos, radians as _rad, sin as _sin, sqrt as _sqrt
+import numpy as np
+from typing import Tuple, List, Dict, Optional
+
+from app.core.config import settings
 
 
 class LandDetectionService:
@@ -20,7 +26,7 @@ class LandDetectionService:
     - Define realistic coastline polygons for continents and major islands
     - Use point-in-polygon algorithm (ray casting) for accurate detection
     - Allows natural maritime passages (straits, channels)
-    - Fast enough for real-time routing (O(n) per point check)
+    - Polygons are rasterized once at 0.01° so point checks are O(1) lookups
     
     Data Source: High-resolution Natural Earth coastline (1:10m resolution)
     Enhanced with OpenStreetMap coastal data for Indian Ocean
@@ -237,32 +243,21 @@ class LandDetectionService:
             True if point is inside polygon, False otherwise
         """
         lat, lon = point
-        n = len(polygon)
-        inside = False
-        
-        p1_lat, p1_lon = polygon[0]
-        for i in range(1, n + 1):
-            p2_lat, p2_lon = polygon[i % n]
-            
-            # Check if point is between two vertices vertically
-            if lat > min(p1_lat, p2_lat):
-                if lat <= max(p1_lat, p2_lat):
-                    # Check if ray crosses the edge
-                    if lon <= max(p1_lon, p2_lon):
-                        if p1_lat != p2_lat:
-                            xinters = (lat - p1_lat) * (p2_lon - p1_lon) / (p2_lat - p1_lat) + p1_lon
-                        if p1_lon == p2_lon or lon <= xinters:
-                            inside = not inside
-            
-            p1_lat, p1_lon = p2_lat, p2_lon
-        
-        return inside
+        vertices = np.asarray(polygon, dtype=np.float64)
+        following = np.roll(vertices, -1, axis=0)
+        crosses = _edge_crossings(lat, lon, vertices[:, 0], vertices[:, 1],
+                                  following[:, 0], following[:, 1])
+        return bool(np.logical_xor.reduce(crosses))
     
     @staticmethod
     def is_point_on_land(lat: float, lon: float) -> bool:
         """
         Check if a point is on land using polygon-based approach.
         
+        Coordinates are snapped to the 0.01° grid matching the coastline
+        accuracy and looked up in the precomputed land raster, so a query is
+        a single bit fetch rather than a polygon test.
+        
         Args:
             lat: Latitude
             lon: Longitude
@@ -270,45 +265,114 @@ class LandDetectionService:
         Returns:
             True if point is on land, False if in water
         """
-        point = (lat, lon)
+        i = round(lat * _QUANT_SCALE) - _RASTER_LAT0
+        j = round(lon * _QUANT_SCALE) - _RASTER_LON0
+        if 0 <= i < _RASTER_ROWS and 0 <= j < _RASTER_COLS:
+            return bool((_LAND_RASTER[i, j >> 3] >> (j & 7)) & 1)
+        return False
+    
+    @staticmethod
+    def points_on_land(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Batch version of is_point_on_land for many points at once.
         
-        # Check against each land polygon
-        for region_name, polygon in LandDetectionService.LAND_POLYGONS.items():
-            if LandDetectionService.point_in_polygon(point, polygon):
-                return True
+        Snaps to the same 0.01° grid and gathers all bits from the land raster
+        with fancy indexing instead of one Python call per point.
         
-        return False
+        Args:
+            lats: Array of latitudes
+            lons: Array of longitudes (same shape as lats)
+            
+        Returns:
+            Boolean array, True where the point is on land
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        on_land = np.zeros(lats.shape, dtype=bool)
+        if lats.size == 0:
+            return on_land
+        
+        i = np.rint(lats.reshape(-1) * _QUANT_SCALE).astype(np.int64) - _RASTER_LAT0
+        j = np.rint(lons.reshape(-1) * _QUANT_SCALE).astype(np.int64) - _RASTER_LON0
+        inside = np.flatnonzero((i >= 0) & (i < _RASTER_ROWS) & (j >= 0) & (j < _RASTER_COLS))
+        i, j = i[inside], j[inside]
+        on_land.reshape(-1)[inside] = (_LAND_RASTER[i, j >> 3] >> (j & 7)) & 1
+        
+        return on_land
     
     @staticmethod
     def line_crosses_land(lat1: float, lon1: float, lat2: float, lon2: float, 
-                         num_checks: int = 50) -> bool:
+                         num_checks: Optional[int] = None) -> bool:
         """
         Check if a line segment crosses land by sampling intermediate points.
-        Uses high resolution (50 points) for accuracy.
+        By default samples every ~0.02° along the segment, so short edges
+        cost a few lookups and long ones keep full coastline resolution.
         
         Args:
             lat1, lon1: Start point
             lat2, lon2: End point
-            num_checks: Number of intermediate points to check (default 50 for accuracy)
+            num_checks: Fixed number of sample intervals (default: adaptive)
             
         Returns:
             True if line crosses land, False if completely in water
         """
-        # Check start and end points
-        if LandDetectionService.is_point_on_land(lat1, lon1):
-            return True
-        if LandDetectionService.is_point_on_land(lat2, lon2):
-            return True
-        
-        # Check intermediate points
-        for i in range(1, num_checks):
-            t = i / num_checks
-            lat = lat1 + t * (lat2 - lat1)
-            lon = lon1 + t * (lon2 - lon1)
+        # Segments whose bbox misses every polygon bbox need no sampling
+        if not _segments_near_land(lat1, lon1, lat2, lon2)[0]:
+            return False
+        
+        lats, lons, _ = _segment_samples(lat1, lon1, lat2, lon2, num_checks)
+        return LandDetectionService.batch_any_on_land(lats, lons)
+    
+    @staticmethod
+    def segments_cross_land(lats1: np.ndarray, lons1: np.ndarray,
+                            lats2: np.ndarray, lons2: np.ndarray,
+                            num_checks: Optional[int] = None) -> np.ndarray:
+        """
+        Batch version of line_crosses_land for many segments at once.
+        
+        Samples every segment at the same positions as line_crosses_land and
+        tests all samples of all segments in a single points_on_land call.
+        
+        Args:
+            lats1, lons1: Arrays of segment start points
+            lats2, lons2: Arrays of segment end points
+            num_checks: Fixed number of sample intervals (default: adaptive)
             
-            if LandDetectionService.is_point_on_land(lat, lon):
-                return True
+        Returns:
+            Boolean array, True where the segment crosses land
+        """
+        near = _segments_near_land(lats1, lons1, lats2, lons2)
+        crosses = np.zeros(near.shape, dtype=bool)
+        if near.any():
+            lats, lons, starts = _segment_samples(np.ravel(lats1)[near], np.ravel(lons1)[near],
+                                                  np.ravel(lats2)[near], np.ravel(lons2)[near],
+                                                  num_checks)
+            on_land = LandDetectionService.points_on_land(lats, lons)
+            crosses[near] = np.logical_or.reduceat(on_land, starts)
+        return crosses
+    
+    @staticmethod
+    def batch_any_on_land(lats: np.ndarray, lons: np.ndarray) -> bool:
+        """
+        Check whether any of a batch of points is on land.
+        
+        Large batches (full routes, grids of candidate points) are tested in
+        chunks so the scan stops at the first chunk containing land.
         
+        Args:
+            lats: Array of latitudes
+            lons: Array of longitudes (same shape as lats)
+            
+        Returns:
+            True if at least one point is on land
+        """
+        lats = np.asarray(lats, dtype=np.float64).reshape(-1)
+        lons = np.asarray(lons, dtype=np.float64).reshape(-1)
+        
+        for start in range(0, lats.size, _ANY_CHUNK_POINTS):
+            stop = start + _ANY_CHUNK_POINTS
+            if LandDetectionService.points_on_land(lats[start:stop], lons[start:stop]).any():
+                return True
         return False
     
     @staticmethod
@@ -324,18 +388,36 @@ class LandDetectionService:
         Returns:
             Distance in kilometers
         """
+        a = _sin(_rad(lat2 - lat1) / 2) ** 2 + \
+            _cos(_rad(lat1)) * _cos(_rad(lat2)) * _sin(_rad(lon2 - lon1) / 2) ** 2
+        
+        # 2 * R * asin(sqrt(a)) == 2 * R * atan2(sqrt(a), sqrt(1 - a)), R = 6371 km
+        return 12742.0 * _asin(_sqrt(a))
+    
+    @staticmethod
+    def haversine_distances_array(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Haversine distances between consecutive points of a route.
+        
+        Args:
+            lats: Array of waypoint latitudes (degrees)
+            lons: Array of waypoint longitudes (degrees)
+            
+        Returns:
+            Array of len(lats) - 1 segment distances in kilometers
+        """
         R = 6371  # Earth radius in km
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        lats_rad = np.radians(lats)
+        delta_lat = np.radians(np.diff(lats))
+        delta_lon = np.radians(np.diff(lons))
         
-        a = math.sin(delta_lat / 2) ** 2 + \
-            math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        a = np.sin(delta_lat / 2) ** 2 + \
+            np.cos(lats_rad[:-1]) * np.cos(lats_rad[1:]) * np.sin(delta_lon / 2) ** 2
         
-        return R * c
+        return 2 * R * np.arcsin(np.sqrt(a))
     
     @staticmethod
     def get_safe_point(lat: float, lon: float, search_radius: float = 2.0) -> Tuple[float, float]:
@@ -355,16 +437,14 @@ class LandDetectionService:
         if not LandDetectionService.is_point_on_land(lat, lon):
             return (lat, lon)
         
-        # Try expanding search
-        for offset in [0.1, 0.2, 0.3, 0.5, 1.0]:
-            for d_lat in [-offset, 0, offset]:
-                for d_lon in [-offset, 0, offset]:
-                    if d_lat == 0 and d_lon == 0:
-                        continue
-                    test_lat = lat + d_lat
-                    test_lon = lon + d_lon
-                    if not LandDetectionService.is_point_on_land(test_lat, test_lon):
-                        return (test_lat, test_lon)
+        # Expanding search: every ring's 8 neighbours tested in one batch,
+        # first water point in (offset, d_lat, d_lon) order wins
+        cand_lat = lat + _SAFE_POINT_DLAT
+        cand_lon = lon + _SAFE_POINT_DLON
+        water = ~LandDetectionService.points_on_land(cand_lat, cand_lon)
+        if water.any():
+            k = int(np.argmax(water))
+            return (float(cand_lat[k]), float(cand_lon[k]))
         
         # Default return original
         return (lat, lon)
@@ -383,15 +463,16 @@ class LandDetectionService:
         total_distance = 0
         land_crossings = 0
         
-        for i in range(len(waypoints) - 1):
-            lat1, lon1 = waypoints[i]
-            lat2, lon2 = waypoints[i + 1]
-            
-            distance_km = LandDetectionService.haversine_distance(lat1, lon1, lat2, lon2)
-            total_distance += distance_km
-            
-            if LandDetectionService.line_crosses_land(lat1, lon1, lat2, lon2):
-                land_crossings += 1
+        # Distances and land samples for all segments in one batch each
+        if len(waypoints) > 1:
+            coords = np.asarray(waypoints, dtype=np.float64)
+            total_distance = float(
+                LandDetectionService.haversine_distances_array(coords[:, 0], coords[:, 1]).sum()
+            )
+            crossings = LandDetectionService.segments_cross_land(
+                coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1]
+            )
+            land_crossings = int(np.count_nonzero(crossings))
         
         return {
             "total_distance_km": round(total_distance, 2),
@@ -399,3 +480,256 @@ class LandDetectionService:
             "land_crossing_segments": land_crossings,
             "is_valid_route": land_crossings == 0
         }
+
+
+def _edge_crossings(lat, lon, p1_lat, p1_lon, p2_lat, p2_lon) -> np.ndarray:
+    """
+    Vectorized ray casting edge test, same rules as point_in_polygon.
+    
+    Returns a boolean array (broadcast of point and edge shapes) that is True
+    where the eastward ray from the point crosses the edge p1 -> p2.
+    
+    Branchless form: exactly one endpoint strictly below the point's latitude
+    is min < lat <= max. Instead of dividing to get the ray's intersection
+    longitude, lon <= xinters is decided by the sign of the 2D determinant
+    D = (p1_lon - lon) * dlat + (lat - p1_lat) * dlon, which must share the
+    sign of dlat (or be zero). No division, so no inf/NaN on horizontal edges.
+    """
+    dlat = p2_lat - p1_lat
+    det = (p1_lon - lon) * dlat + (lat - p1_lat) * (p2_lon - p1_lon)
+    return (
+        ((p1_lat < lat) ^ (p2_lat < lat)) &
+        (lon <= np.maximum(p1_lon, p2_lon)) &
+        ((det == 0) | ((det > 0) == (dlat > 0)))
+    )
+
+
+def _segment_samples(lats1, lons1, lats2, lons2,
+                     num_checks: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample points along segments for the land crossing checks.
+    
+    Segment k is split into n_k intervals, either the fixed num_checks or, when
+    None, one per _SAMPLE_STEP_DEG of its length (at least 2, at most
+    _MAX_SAMPLE_INTERVALS). Its n_k + 1 samples (both endpoints exactly) are
+    stored contiguously in flat arrays.
+    
+    Returns:
+        (lats, lons, starts) where segment k's samples begin at starts[k]
+    """
+    lats1, lons1 = np.ravel(lats1).astype(np.float64), np.ravel(lons1).astype(np.float64)
+    lats2, lons2 = np.ravel(lats2).astype(np.float64), np.ravel(lons2).astype(np.float64)
+    dlat = lats2 - lats1
+    dlon = lons2 - lons1
+    
+    if num_checks is None:
+        intervals = np.clip((np.hypot(dlat, dlon) / _SAMPLE_STEP_DEG).astype(np.int64),
+                            2, _MAX_SAMPLE_INTERVALS)
+    else:
+        intervals = np.full(lats1.shape, num_checks, dtype=np.int64)
+    
+    counts = intervals + 1
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    segment = np.repeat(np.arange(lats1.size), counts)
+    t = (np.arange(ends[-1] if ends.size else 0) - starts[segment]) / intervals[segment]
+    
+    lats = lats1[segment] + t * dlat[segment]
+    lons = lons1[segment] + t * dlon[segment]
+    lats[ends - 1], lons[ends - 1] = lats2, lons2
+    return lats, lons, starts
+
+
+def _segments_near_land(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """
+    Segment-level prune for the land crossing checks.
+    
+    True where the segment's bounding box overlaps at least one polygon bbox
+    (padded by half a grid step, since queries snap to the 0.01° grid).
+    Segments that are False cannot have any sample on land.
+    """
+    lats1, lats2 = np.ravel(lats1)[:, None], np.ravel(lats2)[:, None]
+    lons1, lons2 = np.ravel(lons1)[:, None], np.ravel(lons2)[:, None]
+    return (
+        (np.minimum(lats1, lats2) <= _POLY_BBOXES_PADDED[:, 1]) &
+        (np.maximum(lats1, lats2) >= _POLY_BBOXES_PADDED[:, 0]) &
+        (np.minimum(lons1, lons2) <= _POLY_BBOXES_PADDED[:, 3]) &
+        (np.maximum(lons1, lons2) >= _POLY_BBOXES_PADDED[:, 2])
+    ).any(axis=1)
+
+
+def _flatten_polygons() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten LAND_POLYGONS into contiguous structure-of-arrays form.
+    
+    Returns:
+        (verts_lat, verts_lon, next_lat, next_lon, offsets) where polygon k owns
+        vertices offsets[k]:offsets[k+1] and next_* holds each vertex's successor
+        (wrapping around within its polygon), so edge i is vert[i] -> next[i].
+        Coordinates are stored as float32: ~400 vertices fit in a few KB, and
+        float32 resolves ~1e-5° here, far below the ±0.01° coastline accuracy.
+    """
+    polygons = list(LandDetectionService.LAND_POLYGONS.values())
+    offsets = np.zeros(len(polygons) + 1, dtype=np.intp)
+    offsets[1:] = np.cumsum([len(polygon) for polygon in polygons])
+    
+    vertices = np.concatenate([np.asarray(polygon, dtype=np.float32) for polygon in polygons])
+    successor = np.arange(1, len(vertices) + 1)
+    successor[offsets[1:] - 1] = offsets[:-1]
+    
+    return (np.ascontiguousarray(vertices[:, 0]), np.ascontiguousarray(vertices[:, 1]),
+            vertices[successor, 0], vertices[successor, 1], offsets)
+
+
+_VERTS_LAT, _VERTS_LON, _NEXT_LAT, _NEXT_LON, _POLY_OFFSETS = _flatten_polygons()
+
+# Per-polygon bounding boxes: (lat_min, lat_max, lon_min, lon_max)
+_POLY_BBOXES = np.column_stack([
+    np.minimum.reduceat(_VERTS_LAT, _POLY_OFFSETS[:-1]),
+    np.maximum.reduceat(_VERTS_LAT, _POLY_OFFSETS[:-1]),
+    np.minimum.reduceat(_VERTS_LON, _POLY_OFFSETS[:-1]),
+    np.maximum.reduceat(_VERTS_LON, _POLY_OFFSETS[:-1]),
+])
+
+# Per-edge constants for the raster fill: dlon / dlat (inf on horizontal
+# edges, which never straddle a scanline) and the edge's eastern extent
+with np.errstate(divide='ignore', invalid='ignore'):
+    _EDGE_SLOPE = ((_NEXT_LON.astype(np.float64) - _VERTS_LON) /
+                   (_NEXT_LAT.astype(np.float64) - _VERTS_LAT))
+_EDGE_HORIZONTAL = _NEXT_LAT == _VERTS_LAT
+_EDGE_SLOPE[_EDGE_HORIZONTAL] = np.inf
+_EDGE_LON_MAX = np.maximum(_VERTS_LON, _NEXT_LON).astype(np.float64)
+
+# Land queries are snapped to 1 / _QUANT_SCALE degrees (coastline accuracy)
+_QUANT_SCALE = 100
+
+# get_safe_point search offsets, flattened in the original ring order
+# (offset, then d_lat, then d_lon; the centre of each ring is skipped)
+_SAFE_POINT_DLAT, _SAFE_POINT_DLON = (np.array(d) for d in zip(*[
+    (d_lat, d_lon)
+    for offset in [0.1, 0.2, 0.3, 0.5, 1.0]
+    for d_lat in [-offset, 0, offset]
+    for d_lon in [-offset, 0, offset]
+    if d_lat != 0 or d_lon != 0
+]))
+
+# Polygon bboxes grown by half a grid step to cover snapped query points
+_POLY_BBOXES_PADDED = _POLY_BBOXES.astype(np.float64) + \
+    np.array([-0.5, 0.5, -0.5, 0.5]) / _QUANT_SCALE
+
+# Adaptive segment sampling: one sample per ~2 km, bounded per segment
+_SAMPLE_STEP_DEG = 0.02
+_MAX_SAMPLE_INTERVALS = 5000
+
+# Points per chunk in batch_any_on_land
+_ANY_CHUNK_POINTS = 10_000
+
+
+def _raster_geometry() -> Tuple[int, int, int, int]:
+    """Raster origin and size on the query grid: (lat0_q, lon0_q, rows, cols)"""
+    scale = _QUANT_SCALE
+    lat0 = math.floor(float(_POLY_BBOXES[:, 0].min()) * scale)
+    lon0 = math.floor(float(_POLY_BBOXES[:, 2].min()) * scale)
+    rows = math.ceil(float(_POLY_BBOXES[:, 1].max()) * scale) - lat0 + 1
+    cols = math.ceil(float(_POLY_BBOXES[:, 3].max()) * scale) - lon0 + 1
+    return lat0, lon0, rows, cols
+
+
+def _rasterize_polygons(lat0: int, lon0: int, rows: int, cols: int) -> np.ndarray:
+    """
+    Rasterize every land polygon onto the 0.01° query grid with a scanline fill.
+    
+    For a fixed row (latitude) the ray casting test of each edge holds for a
+    prefix of the columns, since the determinant in _edge_crossings is monotonic
+    in lon. Each crossing edge therefore contributes one prefix length L; it is
+    estimated from the intersection longitude, then corrected by evaluating the
+    exact predicate on a few columns around it, so every pixel equals the
+    polygon test at that grid point. Parity per pixel is then a reverse XOR
+    accumulation of the prefix ends. Polygons are filled separately inside
+    their (byte-aligned) bboxes and OR-ed in, which handles overlaps.
+    
+    Returns:
+        Bit-packed mask: mask[i, j >> 3] bit (j & 7) is the land flag for
+        lat (lat0 + i) / 100, lon (lon0 + j) / 100.
+    """
+    scale = _QUANT_SCALE
+    width = (cols + 7) // 8
+    mask = np.zeros((rows, width), dtype=np.uint8)
+    window = np.arange(-3, 4)
+    
+    for k, (lat_min, lat_max, lon_min, lon_max) in enumerate(_POLY_BBOXES.tolist()):
+        # Stored float32, evaluated in float64 like the query coordinates
+        edges = slice(_POLY_OFFSETS[k], _POLY_OFFSETS[k + 1])
+        p1_lat, p1_lon = _VERTS_LAT[edges].astype(np.float64), _VERTS_LON[edges].astype(np.float64)
+        p2_lat, p2_lon = _NEXT_LAT[edges].astype(np.float64), _NEXT_LON[edges].astype(np.float64)
+        
+        r0 = math.floor(lat_min * scale) - lat0
+        r1 = math.ceil(lat_max * scale) - lat0 + 1
+        c0 = (math.floor(lon_min * scale) - lon0) // 8 * 8
+        c1 = min((math.ceil(lon_max * scale) - lon0 + 8) // 8 * 8, width * 8)
+        n = c1 - c0
+        
+        # (row, edge) pairs whose edge straddles the row latitude
+        row_lat = ((lat0 + np.arange(r0, r1)) / scale)[:, None]
+        rr, ee = np.nonzero((p1_lat < row_lat) ^ (p2_lat < row_lat))
+        lat = row_lat[rr, 0]
+        slope = _EDGE_SLOPE[edges][ee]
+        edge_lon_max = _EDGE_LON_MAX[edges][ee]
+        p1_lat, p1_lon, p2_lat, p2_lon = p1_lat[ee], p1_lon[ee], p2_lat[ee], p2_lon[ee]
+        
+        # Estimated prefix length (one multiply-add per pair with the
+        # precomputed slope), corrected against the exact predicate
+        xinters = np.minimum(p1_lon + (lat - p1_lat) * slope, edge_lon_max)
+        est = np.floor(xinters * scale).astype(np.int64) - lon0 - c0 + 1
+        probe = est[:, None] + window
+        crosses = _edge_crossings(lat[:, None], (lon0 + c0 + probe) / scale,
+                                  p1_lat[:, None], p1_lon[:, None],
+                                  p2_lat[:, None], p2_lon[:, None])
+        prefix = np.clip(est + window[0] + crosses.sum(axis=1), 0, n)
+        
+        ends = np.zeros((r1 - r0, n + 1), dtype=np.uint8)
+        np.bitwise_xor.at(ends, (rr, prefix), 1)
+        parity = np.bitwise_xor.accumulate(ends[:, ::-1], axis=1)[:, ::-1]
+        mask[r0:r1, c0 // 8:c1 // 8] |= np.packbits(parity[:, 1:].astype(bool), axis=1,
+                                                    bitorder='little')
+    
+    return mask
+
+
+def _load_land_raster(lat0: int, lon0: int, rows: int, cols: int) -> np.ndarray:
+    """
+    Load the land raster from the on-disk cache, building it on a miss.
+    
+    The file is memory-mapped read-only, so every worker process of the API
+    server shares one physical copy. Its name carries a digest of the polygon
+    data and grid, so editing LAND_POLYGONS invalidates it automatically.
+    """
+    digest = hashlib.sha1(b"".join([
+        _VERTS_LAT.tobytes(), _VERTS_LON.tobytes(), _POLY_OFFSETS.tobytes(),
+        np.array([_QUANT_SCALE, lat0, lon0, rows, cols]).tobytes(),
+    ])).hexdigest()[:16]
+    path = os.path.join(settings.DATA_CACHE_DIR, f"land_raster_{digest}.npy")
+    shape = (rows, (cols + 7) // 8)
+    
+    try:
+        mask = np.load(path, mmap_mode='r')
+        if mask.shape == shape and mask.dtype == np.uint8:
+            return mask
+    except (OSError, ValueError):
+        pass
+    
+    print("[LandDetection] Building land raster (first run only)...")
+    mask = _rasterize_polygons(lat0, lon0, rows, cols)
+    try:
+        os.makedirs(settings.DATA_CACHE_DIR, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, mask)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[LandDetection] Could not cache land raster: {e}")
+    return mask
+
+
+_RASTER_LAT0, _RASTER_LON0, _RASTER_ROWS, _RASTER_COLS = _raster_geometry()
+_LAND_RASTER = _load_land_raster(_RASTER_LAT0, _RASTER_LON0, _RASTER_ROWS, _RASTER_COLS)
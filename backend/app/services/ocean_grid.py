@@ -16,14 +16,29 @@ References:
 - Chen et al. (2019): "A hierarchical framework for ship route planning"
 """
 
-import math
+import os
 import numpy as np
-from typing import List, Tuple, Dict, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import List, Tuple, Dict, Optional, Iterator
 from enum import Enum
-from dataclasses import dataclass, field
 from app.services.land_detection import LandDetectionService
 
 
+# Shared worker pool for batch cell classification
+_WORKERS = os.cpu_count() or 1
+_CLASSIFY_CHUNK_CELLS = 1 << 18
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared grid classification thread pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="grid-classify")
+    return _executor
+
+
 class CellType(Enum):
     """Classification of ocean grid cells"""
     LAND = 0           # Blocked - continent/island
@@ -33,23 +48,87 @@ class CellType(Enum):
     UNKNOWN = 4        # Not yet classified
 
 
-@dataclass
+def _cell_array_attribute(name: str, doc: str, to_value=float, to_storage=None,
+                          on_write=None) -> property:
+    """Property reading/writing one element of the grid's per-cell array `name`"""
+    def getter(cell):
+        return to_value(getattr(cell._grid, name)[cell._i, cell._j])
+    
+    def setter(cell, value):
+        getattr(cell._grid, name)[cell._i, cell._j] = value if to_storage is None else to_storage(value)
+        if on_write is not None:
+            on_write(cell._grid)
+    
+    return property(getter, setter, doc=doc)
+
+
 class GridCell:
-    """Represents a single cell in the ocean grid"""
-    lat: float          # Center latitude
-    lon: float          # Center longitude
-    level: int          # Grid level (1 or 2)
-    cell_type: CellType = CellType.UNKNOWN
-    depth_m: float = 0.0  # Average depth in meters
-    cost: float = 1.0   # Traversal cost for A* (1.0 = water, >1.0 = hazard, ∞ = land)
-    weather_factor: float = 1.0  # Weather impact multiplier
-    neighbors: Set[Tuple[float, float]] = field(default_factory=set)  # (lat, lon) of neighbors
+    """
+    Represents a single cell in the ocean grid.
+    
+    A lightweight view onto the grid's per-cell arrays (row i, column j):
+    attribute reads and writes go straight to OceanGrid storage, so the grid
+    does not keep one Python object per cell.
+    """
+    
+    __slots__ = ("_grid", "_i", "_j")
+    
+    lat = property(lambda self: float(self._grid.lat_axis[self._i]), doc="Center latitude")
+    lon = property(lambda self: float(self._grid.lon_axis[self._j]), doc="Center longitude")
+    level = property(lambda self: self._grid.level, doc="Grid level (1 or 2)")
+    cell_type = _cell_array_attribute("cell_type", "Cell classification",
+                                      to_value=CellType, to_storage=lambda t: t.value,
+                                      on_write=lambda grid: grid._invalidate_navigable())
+    depth_m = _cell_array_attribute("depth_m", "Average depth in meters")
+    cost = _cell_array_attribute(
+        "cost", "Traversal cost for A* (1.0 = water, >1.0 = hazard, ∞ = land)")
+    weather_factor = _cell_array_attribute("weather_factor", "Weather impact multiplier")
+    
+    def __init__(self, grid: "OceanGrid", i: int, j: int):
+        self._grid = grid
+        self._i = i
+        self._j = j
     
     def __hash__(self):
         return hash((round(self.lat, 6), round(self.lon, 6)))
     
     def __eq__(self, other):
         return isinstance(other, GridCell) and abs(self.lat - other.lat) < 1e-6 and abs(self.lon - other.lon) < 1e-6
+    
+    def __repr__(self):
+        return (f"GridCell(lat={self.lat}, lon={self.lon}, level={self.level}, "
+                f"cell_type={self.cell_type}, depth_m={self.depth_m}, cost={self.cost})")
+
+
+class _CellMap(Mapping):
+    """Read-only {(lat, lon): GridCell} view over an OceanGrid, in row-major order"""
+    
+    def __init__(self, grid: "OceanGrid"):
+        self._grid = grid
+    
+    def __getitem__(self, key: Tuple[float, float]) -> GridCell:
+        i = self._grid._lat_index.get(key[0])
+        j = self._grid._lon_index.get(key[1])
+        if i is None or j is None:
+            raise KeyError(key)
+        return GridCell(self._grid, i, j)
+    
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        lon_keys = list(self._grid._lon_index)
+        for lat_key in self._grid._lat_index:
+            for lon_key in lon_keys:
+                yield (lat_key, lon_key)
+    
+    def __len__(self) -> int:
+        return self._grid.cell_type.size
+    
+    def values(self) -> Iterator[GridCell]:
+        grid = self._grid
+        n_lat, n_lon = grid.cell_type.shape
+        return (GridCell(grid, i, j) for i in range(n_lat) for j in range(n_lon))
+    
+    def items(self) -> Iterator[Tuple[Tuple[float, float], GridCell]]:
+        return zip(iter(self), self.values())
 
 
 class OceanGrid:
@@ -86,6 +165,10 @@ class OceanGrid:
     DEPTH_SHALLOW_BOUNDARY = 50  # Below = shallow water
     DEPTH_DEEP_OCEAN = 200       # Above = suitable for most vessels
     
+    # (row, column) steps to neighboring cells: E, W, N, S, then NE, NW, SE, SW
+    NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1),
+                        (1, 1), (-1, 1), (1, -1), (-1, -1))
+    
     # Cost multipliers for different cell types
     COST_MULTIPLIERS = {
         CellType.WATER: 1.0,         # Safe water
@@ -94,6 +177,10 @@ class OceanGrid:
         CellType.LAND: float('inf')  # Impassable
     }
     
+    # Same multipliers indexed by CellType value (LAND, SHALLOW, HAZARD, WATER, UNKNOWN),
+    # so whole-grid costs are a single gather: cost = _COST_LUT[cell_type]
+    _COST_LUT = np.array([float('inf'), 3.0, 2.5, 1.0, 1.0], dtype=np.float32)
+    
     def __init__(self, level: int = 1, use_cached_depth: bool = True):
         """
         Initialize ocean grid.
@@ -104,7 +191,6 @@ class OceanGrid:
         """
         self.level = level
         self.resolution = self.LEVEL1_RESOLUTION if level == 1 else self.LEVEL2_RESOLUTION
-        self.cells: Dict[Tuple[float, float], GridCell] = {}
         self.use_cached_depth = use_cached_depth
         
         # Initialize grid cells
@@ -116,6 +202,11 @@ class OceanGrid:
         # Load depth data
         if use_cached_depth:
             self._load_depth_data()
+        
+        # Hazard-free classification; hazard zones are an overlay on top of it
+        self.base_cell_type = self.cell_type.copy()
+        self.base_cost = self.cost.copy()
+        self.hazard_zones: List[Dict] = []
     
     def _initialize_grid(self):
         """Generate all grid cells at specified resolution"""
@@ -125,51 +216,95 @@ class OceanGrid:
         min_lon = bounds["min_lon"]
         max_lon = bounds["max_lon"]
         
-        # Generate cells
-        lat = min_lat
-        while lat <= max_lat:
-            lon = min_lon
-            while lon <= max_lon:
-                cell_key = (round(lat, 6), round(lon, 6))
-                self.cells[cell_key] = GridCell(
-                    lat=lat,
-                    lon=lon,
-                    level=self.level,
-                    cell_type=CellType.UNKNOWN
-                )
-                lon += self.resolution
-            lat += self.resolution
+        # Axis coordinates in one vectorized pass each, then the full grid
+        self.lat_axis = self._grid_axis(min_lat, max_lat, self.resolution)
+        self.lon_axis = self._grid_axis(min_lon, max_lon, self.resolution)
+        self.lat, self.lon = np.meshgrid(self.lat_axis, self.lon_axis, indexing='ij')
+        
+        # Structure-of-arrays cell storage, shape (n_lat, n_lon), in compact
+        # dtypes: whole-grid passes are memory-bound. Depths are whole meters
+        # (0-11000 fits int16); cost keeps float32 so land can stay at inf.
+        # Row-major rather than Morton order: spatial queries work on
+        # rectangular windows, which stay plain slices of contiguous row runs.
+        shape = self.lat.shape
+        self.cell_type = np.full(shape, CellType.UNKNOWN.value, dtype=np.int8)
+        self.depth_m = np.zeros(shape, dtype=np.int16)
+        self.cost = np.ones(shape, dtype=np.float32)
+        self.weather_factor = np.ones(shape, dtype=np.float32)
+        
+        # (round(lat, 6), round(lon, 6)) keys resolve to (row, column) per axis
+        self._lat_index = {round(lat, 6): i for i, lat in enumerate(self.lat_axis.tolist())}
+        self._lon_index = {round(lon, 6): j for j, lon in enumerate(self.lon_axis.tolist())}
+        self.cells: Mapping[Tuple[float, float], GridCell] = _CellMap(self)
+        
+        # Axis origins in whole grid steps, for integer (row, column) addressing
+        self._lat_step0 = round(float(self.lat_axis[0]) / self.resolution)
+        self._lon_step0 = round(float(self.lon_axis[0]) / self.resolution)
+        self._invalidate_navigable()
         
         print(f"[OceanGrid] Initialized {len(self.cells)} cells at Level-{self.level}")
     
+    @staticmethod
+    def _grid_axis(start: float, stop: float, step: float) -> np.ndarray:
+        """
+        Coordinates start, start + step, ... up to stop (inclusive).
+        
+        Accumulates step by step like a running `value += step` (add.accumulate
+        is sequential), so coordinates and the cell count are exactly those of
+        the incremental loop, rounding drift included.
+        """
+        steps = np.full(int((stop - start) / step) + 2, step)
+        steps[0] = start
+        axis = np.add.accumulate(steps)
+        return axis[axis <= stop]
+    
+    @staticmethod
+    def _axis_span(axis: np.ndarray, low: float, high: float) -> slice:
+        """Slice of the (ascending) axis entries strictly between low and high"""
+        return slice(int(np.searchsorted(axis, low, side='right')),
+                     int(np.searchsorted(axis, high, side='left')))
+    
+    def _axis_window(self, lat: float, lon: float, radius_deg: float) -> Tuple[slice, slice]:
+        """
+        (rows, columns) slices covering every cell within radius_deg of (lat, lon)
+        per axis, with one cell of slack on each side for coordinate rounding.
+        """
+        i0 = max(int(np.searchsorted(self.lat_axis, lat - radius_deg)) - 1, 0)
+        i1 = int(np.searchsorted(self.lat_axis, lat + radius_deg, side='right')) + 1
+        j0 = max(int(np.searchsorted(self.lon_axis, lon - radius_deg)) - 1, 0)
+        j1 = int(np.searchsorted(self.lon_axis, lon + radius_deg, side='right')) + 1
+        return slice(i0, i1), slice(j0, j1)
+    
     def _classify_cells(self):
         """Classify each cell as LAND or WATER using LandDetectionService"""
-        print(f"[OceanGrid] Classifying {len(self.cells)} cells...")
-        
-        classified = 0
-        # Fast mode: Sample-based classification for speed (every 4th cell)
-        # In production, use full classification on background task
-        sample_rate = 4 if self.level == 1 else 1
-        
-        for i, (cell_key, cell) in enumerate(self.cells.items()):
-            # Sample-based check for speed
-            if i % sample_rate == 0:
-                if LandDetectionService.is_point_on_land(cell.lat, cell.lon):
-                    cell.cell_type = CellType.LAND
-                    cell.cost = float('inf')  # Impassable
-                else:
-                    cell.cell_type = CellType.WATER
-                    cell.cost = 1.0  # Base cost
-            else:
-                # Skip detailed check, assume water (conservative - fewer false positives)
-                cell.cell_type = CellType.WATER
-                cell.cost = 1.0
-            
-            classified += 1
-            if classified % 5000 == 0:
-                print(f"  [Progress] Classified {classified}/{len(self.cells)} cells (fast mode)")
-        
-        print(f"[OceanGrid] Classification complete (fast mode - 25% sampled)")
+        n_cells = self.cell_type.size
+        print(f"[OceanGrid] Classifying {n_cells} cells...")
+        
+        # Every cell is checked: a land test is one bit lookup in the rasterized
+        # landmask, so the old every-4th-cell sampling no longer saves anything
+        lats = self.lat.reshape(-1)
+        lons = self.lon.reshape(-1)
+        
+        # Batch land lookups, in chunks spread over the worker pool
+        on_land = np.empty(n_cells, dtype=bool)
+        
+        def classify_chunk(start: int):
+            stop = start + _CLASSIFY_CHUNK_CELLS
+            on_land[start:stop] = LandDetectionService.points_on_land(lats[start:stop], lons[start:stop])
+        
+        starts = range(0, n_cells, _CLASSIFY_CHUNK_CELLS)
+        if len(starts) > 1:
+            list(_get_executor().map(classify_chunk, starts))
+        else:
+            for start in starts:
+                classify_chunk(start)
+        
+        # Land is impassable (inf cost), water has base cost
+        self.cell_type.reshape(-1)[...] = np.where(on_land, CellType.LAND.value, CellType.WATER.value)
+        np.take(self._COST_LUT, self.cell_type, out=self.cost)
+        self._invalidate_navigable()
+        
+        print(f"[OceanGrid] Classification complete ({int(on_land.sum())} land cells)")
     
     def _load_depth_data(self):
         """
@@ -180,64 +315,105 @@ class OceanGrid:
         """
         print(f"[OceanGrid] Loading depth data (fast mode)...")
         
-        # Fast depth assignment without individual cell iteration
-        for cell_key, cell in self.cells.items():
-            if cell.cell_type == CellType.LAND:
-                cell.depth_m = 0
-                continue
-            
-            lat = cell.lat
-            lon = cell.lon
-            
-            # Simplified depth model (vectorized for speed)
-            if lat > 60 or lat < -50:  # Polar waters
-                cell.depth_m = 3500
-            elif lat > 40 or lat < -40:  # Mid-latitudes
-                cell.depth_m = 4000
-            else:  # Tropics/subtropics
-                cell.depth_m = 3500
-            
-            # Shelf areas (shallower) - simplified thresholds
-            if (lat > 35 and lat < 45 and lon > -20 and lon < 40):  # Mediterranean/North Africa shelf
-                cell.depth_m = 200
-            elif (lat > 20 and lat < 35 and lon > 50 and lon < 75):  # Arabian Sea shelf
-                cell.depth_m = 150
-            elif (lat > 5 and lat < 20 and lon > 85 and lon < 105):  # Southeast Asia shelves
-                cell.depth_m = 100
-            elif (lat > -15 and lat < 5 and lon > 95 and lon < 140):  # Indonesia shelves
-                cell.depth_m = 80
-            
-            # Update cell type based on depth
-            if cell.depth_m < self.DEPTH_SHALLOW_BOUNDARY and cell.cell_type != CellType.LAND:
-                cell.cell_type = CellType.SHALLOW
-                cell.cost = self.COST_MULTIPLIERS[CellType.SHALLOW]
+        # The depth model is separable: latitude bands are per row and each
+        # shelf region is a rectangle of rows x columns, so it is written
+        # through broadcasting and slices without whole-grid temporaries
+        lat = self.lat_axis
+        polar = (lat > 60) | (lat < -50)
+        mid_latitude = ((lat > 40) | (lat < -40)) & ~polar
+        self.depth_m[...] = np.where(mid_latitude, 4000, 3500)[:, None]  # Polar waters and tropics: 3500
+        
+        # Shelf areas (shallower) - first matching region wins, so apply in reverse
+        shelves = [
+            ((35, 45), (-20, 40), 200),   # Mediterranean/North Africa shelf
+            ((20, 35), (50, 75), 150),    # Arabian Sea shelf
+            ((5, 20), (85, 105), 100),    # Southeast Asia shelves
+            ((-15, 5), (95, 140), 80),    # Indonesia shelves
+        ]
+        for (lat_lo, lat_hi), (lon_lo, lon_hi), shelf_depth in reversed(shelves):
+            rows = self._axis_span(self.lat_axis, lat_lo, lat_hi)
+            cols = self._axis_span(self.lon_axis, lon_lo, lon_hi)
+            self.depth_m[rows, cols] = shelf_depth
+        
+        land = self.cell_type == CellType.LAND.value
+        self.depth_m[land] = 0
+        depth = self.depth_m
+        
+        # Update cell type based on depth
+        shallow = (depth < self.DEPTH_SHALLOW_BOUNDARY) & ~land
+        self.cell_type[shallow] = CellType.SHALLOW.value
+        self.cost[shallow] = self._COST_LUT[CellType.SHALLOW.value]
+        self._invalidate_navigable()
     
     def get_cell(self, lat: float, lon: float) -> Optional[GridCell]:
         """Get grid cell for coordinates"""
-        # Round to grid resolution
-        lat_rounded = round(lat / self.resolution) * self.resolution
-        lon_rounded = round(lon / self.resolution) * self.resolution
+        # Round to grid resolution, as whole steps from the first row/column
+        i = round(lat / self.resolution) - self._lat_step0
+        j = round(lon / self.resolution) - self._lon_step0
         
-        cell_key = (round(lat_rounded, 6), round(lon_rounded, 6))
-        return self.cells.get(cell_key)
+        n_lat, n_lon = self.cell_type.shape
+        if 0 <= i < n_lat and 0 <= j < n_lon:
+            return GridCell(self, i, j)
+        return None
+    
+    def _invalidate_navigable(self):
+        """Drop cached navigability; called whenever cell types change"""
+        self._navigable_mask: Optional[np.ndarray] = None
+        self._navigable_index: Optional[np.ndarray] = None
+        self._navigable_latlon: Optional[np.ndarray] = None
+    
+    @property
+    def navigable_mask(self) -> np.ndarray:
+        """Boolean (n_lat, n_lon) mask of WATER + SHALLOW cells, cached until cell types change"""
+        if self._navigable_mask is None:
+            self._navigable_mask = (self.cell_type == CellType.WATER.value) | \
+                (self.cell_type == CellType.SHALLOW.value)
+        return self._navigable_mask
+    
+    @property
+    def navigable_index(self) -> np.ndarray:
+        """Flat row-major indices of navigable cells, cached until cell types change"""
+        if self._navigable_index is None:
+            self._navigable_index = np.flatnonzero(self.navigable_mask)
+        return self._navigable_index
+    
+    def navigable_latlon(self) -> np.ndarray:
+        """(N, 2) float32 array of navigable cell centers (lat, lon), in navigable_index order"""
+        if self._navigable_latlon is None:
+            index = self.navigable_index
+            self._navigable_latlon = np.column_stack((
+                self.lat.reshape(-1)[index], self.lon.reshape(-1)[index],
+            )).astype(np.float32)
+        return self._navigable_latlon
     
     def get_water_cells(self) -> List[GridCell]:
         """Get all navigable water cells (WATER + SHALLOW, excluding LAND + HAZARD)"""
-        return [cell for cell in self.cells.values() if cell.cell_type in [CellType.WATER, CellType.SHALLOW]]
+        rows, cols = np.divmod(self.navigable_index, self.cell_type.shape[1])
+        return [GridCell(self, i, j) for i, j in zip(rows.tolist(), cols.tolist())]
     
     def get_nearest_water_cell(self, lat: float, lon: float, max_distance_deg: float = 1.0) -> Optional[GridCell]:
-        """Find nearest water cell to coordinates (for port alignment)"""
-        best_cell = None
-        best_dist = float('inf')
+        """
+        Find nearest water cell to coordinates (for port alignment).
+        
+        The grid is a regular raster, so it is its own spatial index: only the
+        window of rows/columns within max_distance_deg (plus one cell of slack
+        for coordinate rounding) is scanned, instead of every cell.
+        """
+        window = self._axis_window(lat, lon, max_distance_deg)
+        i0, j0 = window[0].start, window[1].start
         
-        for cell in self.cells.values():
-            if cell.cell_type != CellType.LAND:
-                dist = math.sqrt((cell.lat - lat)**2 + (cell.lon - lon)**2)
-                if dist < best_dist and dist <= max_distance_deg:
-                    best_dist = dist
-                    best_cell = cell
+        # Squared distances order the same as distances, no sqrt needed
+        dlat = self.lat_axis[window[0]] - lat
+        dlon = self.lon_axis[window[1]] - lon
+        dist_sq = dlat[:, None] * dlat[:, None] + dlon * dlon
+        candidates = (self.cell_type[window] != CellType.LAND.value) & \
+            (dist_sq <= max_distance_deg * max_distance_deg)
+        if not candidates.any():
+            return None
         
-        return best_cell
+        # First minimum in row-major order, as in a full scan
+        i, j = np.unravel_index(np.argmin(np.where(candidates, dist_sq, np.inf)), dist_sq.shape)
+        return GridCell(self, i0 + int(i), j0 + int(j))
     
     def get_neighbors(self, cell: GridCell, diagonal: bool = True) -> List[GridCell]:
         """
@@ -250,28 +426,46 @@ class OceanGrid:
         Returns:
             List of neighboring water cells
         """
+        offsets = self.NEIGHBOR_OFFSETS if diagonal else self.NEIGHBOR_OFFSETS[:4]
+        n_lat, n_lon = self.cell_type.shape
+        land = CellType.LAND.value
+        
         neighbors = []
-        offsets = [
-            (self.resolution, 0),    # East
-            (-self.resolution, 0),   # West
-            (0, self.resolution),    # North
-            (0, -self.resolution),   # South
-        ]
+        for di, dj in offsets:
+            ni = cell._i + di
+            nj = cell._j + dj
+            if 0 <= ni < n_lat and 0 <= nj < n_lon and self.cell_type[ni, nj] != land:
+                neighbors.append(GridCell(self, ni, nj))
         
-        if diagonal:
-            offsets.extend([
-                (self.resolution, self.resolution),      # NE
-                (-self.resolution, self.resolution),     # NW
-                (self.resolution, -self.resolution),     # SE
-                (-self.resolution, -self.resolution),    # SW
-            ])
+        return neighbors
+    
+    def get_neighbors_batch(self, rows: np.ndarray, cols: np.ndarray,
+                            diagonal: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized get_neighbors for many cells given by (row, column) index.
+        
+        Args:
+            rows, cols: Cell indices into the grid arrays
+            diagonal: Include diagonal neighbors (8-connected) or just orthogonal (4-connected)
         
-        for dlat, dlon in offsets:
-            neighbor_cell = self.get_cell(cell.lat + dlat, cell.lon + dlon)
-            if neighbor_cell and neighbor_cell.cell_type != CellType.LAND:
-                neighbors.append(neighbor_cell)
+        Returns:
+            (source, neighbor_rows, neighbor_cols): non-land neighbors, with
+            source[k] the position in rows/cols of the cell they belong to
+        """
+        offsets = np.array(self.NEIGHBOR_OFFSETS if diagonal else self.NEIGHBOR_OFFSETS[:4])
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        n_lat, n_lon = self.cell_type.shape
         
-        return neighbors
+        # (cells, offsets) candidates, flattened cell-major like repeated get_neighbors calls
+        ni = (rows[:, None] + offsets[:, 0]).ravel()
+        nj = (cols[:, None] + offsets[:, 1]).ravel()
+        source = np.repeat(np.arange(rows.size), len(offsets))
+        
+        keep = (ni >= 0) & (ni < n_lat) & (nj >= 0) & (nj < n_lon)
+        source, ni, nj = source[keep], ni[keep], nj[keep]
+        keep = self.cell_type[ni, nj] != CellType.LAND.value
+        return source[keep], ni[keep], nj[keep]
     
     def add_hazard_zone(self, center_lat: float, center_lon: float, radius_deg: float, 
                         hazard_type: str = "weather", cost_multiplier: float = 2.5):
@@ -284,13 +478,92 @@ class OceanGrid:
             hazard_type: Type of hazard
             cost_multiplier: Cost increase factor
         """
-        for cell in self.cells.values():
-            dist = math.sqrt((cell.lat - center_lat)**2 + (cell.lon - center_lon)**2)
-            if dist <= radius_deg and cell.cell_type != CellType.LAND:
-                if cell.cell_type != CellType.HAZARD:
-                    cell.cell_type = CellType.HAZARD
-                cell.cost = self.COST_MULTIPLIERS[CellType.HAZARD] * cost_multiplier
-                cell.weather_factor = cost_multiplier
+        zone = {
+            "center_lat": center_lat,
+            "center_lon": center_lon,
+            "radius_deg": radius_deg,
+            "hazard_type": hazard_type,
+            "cost_multiplier": cost_multiplier,
+        }
+        self.hazard_zones.append(zone)
+        self._apply_hazard_zones([zone])
+    
+    def _apply_hazard_zones(self, zones: List[Dict]):
+        """
+        Mark non-land cells inside any of the zones as HAZARD, in one write.
+        
+        Where zones overlap the later one wins, exactly as if they were added
+        one by one. Only the bounding window of all circles is touched;
+        distances are squared and broadcast from the two axes.
+        """
+        if not zones:
+            return
+        
+        windows = [self._axis_window(z["center_lat"], z["center_lon"], z["radius_deg"]) for z in zones]
+        rows = slice(min(w[0].start for w in windows), max(w[0].stop for w in windows))
+        cols = slice(min(w[1].start for w in windows), max(w[1].stop for w in windows))
+        
+        # Index of the last zone covering each cell of the window, -1 for none
+        zone_of = np.full((len(self.lat_axis[rows]), len(self.lon_axis[cols])), -1, dtype=np.int16)
+        for k, (zone, (zone_rows, zone_cols)) in enumerate(zip(zones, windows)):
+            dlat = self.lat_axis[zone_rows] - zone["center_lat"]
+            dlon = self.lon_axis[zone_cols] - zone["center_lon"]
+            in_zone = dlat[:, None] * dlat[:, None] + dlon * dlon <= zone["radius_deg"] * zone["radius_deg"]
+            sub = (slice(zone_rows.start - rows.start, zone_rows.stop - rows.start),
+                   slice(zone_cols.start - cols.start, zone_cols.stop - cols.start))
+            zone_of[sub][in_zone] = k
+        
+        cell_type = self.cell_type[rows, cols]
+        hit = (zone_of >= 0) & (cell_type != CellType.LAND.value)
+        multipliers = np.array([z["cost_multiplier"] for z in zones], dtype=np.float32)[zone_of[hit]]
+        
+        cell_type[hit] = CellType.HAZARD.value
+        self.cost[rows, cols][hit] = self._COST_LUT[CellType.HAZARD.value] * multipliers
+        self.weather_factor[rows, cols][hit] = multipliers
+        self._invalidate_navigable()
+    
+    def clear_hazard_zones(self, hazard_type: Optional[str] = None):
+        """
+        Remove hazard zones, restoring the hazard-free classification underneath.
+        
+        Lets seasonal hazards be swapped (e.g. for another month) without
+        rebuilding the grid or stacking zones from earlier calls.
+        
+        Args:
+            hazard_type: Only remove zones of this type (default: all zones)
+        """
+        if hazard_type is None:
+            self.hazard_zones = []
+        else:
+            self.hazard_zones = [z for z in self.hazard_zones if z["hazard_type"] != hazard_type]
+        
+        np.copyto(self.cell_type, self.base_cell_type)
+        np.copyto(self.cost, self.base_cost)
+        self.weather_factor.fill(1.0)
+        self._invalidate_navigable()
+        
+        # Re-apply the remaining zones in their original order
+        self._apply_hazard_zones(self.hazard_zones)
+    
+    def apply_seasonal_hazards(self, current_month: int, include_tss: bool = True):
+        """
+        Replace all hazard zones with the monsoon, cyclone and (optionally)
+        traffic separation zones for a month, applied in a single grid pass.
+        
+        Same result as clear_hazard_zones() followed by add_monsoon_zones,
+        add_cyclone_zones and add_traffic_separation_schemes.
+        
+        Args:
+            current_month: Month number (1-12)
+            include_tss: Also add traffic separation schemes
+        """
+        zones = self._monsoon_zones(current_month) + self._cyclone_zones(current_month)
+        if include_tss:
+            zones += self._traffic_separation_zones()
+        
+        self.clear_hazard_zones()
+        self.hazard_zones = zones
+        self._apply_hazard_zones(zones)
     
     def add_monsoon_zones(self, current_month: int):
         """
@@ -300,24 +573,8 @@ class OceanGrid:
         - Southwest Monsoon (May-September): Arabian Sea, Indian Ocean
         - Northeast Monsoon (October-April): More stable but with transitions
         """
-        if current_month in [5, 6, 7, 8, 9]:  # Southwest monsoon
-            # Arabian Sea monsoon
-            self.add_hazard_zone(center_lat=12, center_lon=65, radius_deg=15, 
-                                hazard_type="monsoon_sw", cost_multiplier=3.0)
-            
-            # Bay of Bengal monsoon
-            self.add_hazard_zone(center_lat=15, center_lon=90, radius_deg=12, 
-                                hazard_type="monsoon_sw", cost_multiplier=2.8)
-            
-            # Eastern Indian Ocean monsoon
-            self.add_hazard_zone(center_lat=5, center_lon=105, radius_deg=10, 
-                                hazard_type="monsoon_sw", cost_multiplier=2.5)
-        
-        elif current_month in [10, 11, 12, 1, 2, 3, 4]:  # Northeast monsoon
-            # Generally calmer, but transition periods risky
-            if current_month in [10, 11, 3, 4]:  # Transition months
-                self.add_hazard_zone(center_lat=12, center_lon=65, radius_deg=10, 
-                                    hazard_type="monsoon_ne_transition", cost_multiplier=1.5)
+        for zone in self._monsoon_zones(current_month):
+            self.add_hazard_zone(**zone)
     
     def add_cyclone_zones(self, current_month: int):
         """
@@ -327,15 +584,8 @@ class OceanGrid:
         - Bay of Bengal: May-June (pre-monsoon), September-October (post-monsoon)
         - Arabian Sea: May-June, September-November
         """
-        # Cyclone season in Bay of Bengal
-        if current_month in [5, 6, 9, 10]:
-            self.add_hazard_zone(center_lat=15, center_lon=88, radius_deg=8, 
-                                hazard_type="cyclone", cost_multiplier=4.0)
-        
-        # Cyclone season in Arabian Sea
-        if current_month in [5, 6, 9, 10, 11]:
-            self.add_hazard_zone(center_lat=12, center_lon=62, radius_deg=8, 
-                                hazard_type="cyclone", cost_multiplier=4.0)
+        for zone in self._cyclone_zones(current_month):
+            self.add_hazard_zone(**zone)
     
     def add_traffic_separation_schemes(self):
         """
@@ -343,28 +593,76 @@ class OceanGrid:
         
         Creates preferred shipping lanes with lower cost to encourage route guidance through established lanes.
         """
-        # Suez Canal approach
-        self.add_hazard_zone(center_lat=30.5, center_lon=32.3, radius_deg=2, 
-                            hazard_type="tss", cost_multiplier=0.8)  # Preferred lane - LOWER cost
+        for zone in self._traffic_separation_zones():
+            self.add_hazard_zone(**zone)
+    
+    @staticmethod
+    def _monsoon_zones(current_month: int) -> List[Dict]:
+        """Monsoon hazard zones for a month, as add_hazard_zone arguments"""
+        zones = []
+        if current_month in [5, 6, 7, 8, 9]:  # Southwest monsoon
+            zones.extend([
+                # Arabian Sea monsoon
+                dict(center_lat=12, center_lon=65, radius_deg=15,
+                     hazard_type="monsoon_sw", cost_multiplier=3.0),
+                # Bay of Bengal monsoon
+                dict(center_lat=15, center_lon=90, radius_deg=12,
+                     hazard_type="monsoon_sw", cost_multiplier=2.8),
+                # Eastern Indian Ocean monsoon
+                dict(center_lat=5, center_lon=105, radius_deg=10,
+                     hazard_type="monsoon_sw", cost_multiplier=2.5),
+            ])
+        
+        elif current_month in [10, 11, 12, 1, 2, 3, 4]:  # Northeast monsoon
+            # Generally calmer, but transition periods risky
+            if current_month in [10, 11, 3, 4]:  # Transition months
+                zones.append(dict(center_lat=12, center_lon=65, radius_deg=10,
+                                  hazard_type="monsoon_ne_transition", cost_multiplier=1.5))
         
-        # Singapore Strait
-        self.add_hazard_zone(center_lat=1.3, center_lon=103.8, radius_deg=1.5, 
-                            hazard_type="tss", cost_multiplier=0.8)
+        return zones
+    
+    @staticmethod
+    def _cyclone_zones(current_month: int) -> List[Dict]:
+        """Cyclone hazard zones for a month, as add_hazard_zone arguments"""
+        zones = []
+        # Cyclone season in Bay of Bengal
+        if current_month in [5, 6, 9, 10]:
+            zones.append(dict(center_lat=15, center_lon=88, radius_deg=8,
+                              hazard_type="cyclone", cost_multiplier=4.0))
         
-        # Malacca Strait
-        self.add_hazard_zone(center_lat=2.0, center_lon=101.0, radius_deg=2, 
-                            hazard_type="tss", cost_multiplier=0.8)
+        # Cyclone season in Arabian Sea
+        if current_month in [5, 6, 9, 10, 11]:
+            zones.append(dict(center_lat=12, center_lon=62, radius_deg=8,
+                              hazard_type="cyclone", cost_multiplier=4.0))
         
-        # Arabian Sea shipping lanes
-        self.add_hazard_zone(center_lat=10, center_lon=60, radius_deg=3, 
-                            hazard_type="tss", cost_multiplier=0.9)
+        return zones
+    
+    @staticmethod
+    def _traffic_separation_zones() -> List[Dict]:
+        """Traffic separation scheme zones, as add_hazard_zone arguments"""
+        return [
+            # Suez Canal approach
+            dict(center_lat=30.5, center_lon=32.3, radius_deg=2,
+                 hazard_type="tss", cost_multiplier=0.8),  # Preferred lane - LOWER cost
+            # Singapore Strait
+            dict(center_lat=1.3, center_lon=103.8, radius_deg=1.5,
+                 hazard_type="tss", cost_multiplier=0.8),
+            # Malacca Strait
+            dict(center_lat=2.0, center_lon=101.0, radius_deg=2,
+                 hazard_type="tss", cost_multiplier=0.8),
+            # Arabian Sea shipping lanes
+            dict(center_lat=10, center_lon=60, radius_deg=3,
+                 hazard_type="tss", cost_multiplier=0.9),
+        ]
     
     def get_statistics(self) -> Dict:
         """Get grid statistics"""
-        water_count = sum(1 for c in self.cells.values() if c.cell_type == CellType.WATER)
-        shallow_count = sum(1 for c in self.cells.values() if c.cell_type == CellType.SHALLOW)
-        hazard_count = sum(1 for c in self.cells.values() if c.cell_type == CellType.HAZARD)
-        land_count = sum(1 for c in self.cells.values() if c.cell_type == CellType.LAND)
+        # One counting pass over the cell type array
+        counts = np.bincount(self.cell_type.reshape(-1), minlength=len(CellType))
+        water_count = int(counts[CellType.WATER.value])
+        shallow_count = int(counts[CellType.SHALLOW.value])
+        hazard_count = int(counts[CellType.HAZARD.value])
+        land_count = int(counts[CellType.LAND.value])
         
         return {
             "total_cells": len(self.cells),
@@ -21,17 +21,263 @@ References:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import math
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Tuple, Optional
+from datetime import datetime, timedelta, timezone
 import hashlib
+import numpy as np
+from dataclasses import dataclass, field
+from functools import lru_cache
+from scipy.spatial import cKDTree
 from app.core.config import settings
+from app.services.cache import SingleFlight, TTLCache, get_disk_cache
+
+
+# Shared pool for concurrent provider requests (point lookups race providers here)
+_MAX_CONCURRENT_REQUESTS = 20
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Per-point route fallback requests get their own small pool: they wait on
+# provider rate limiters, and a long route must not park the shared workers
+_MAX_PACED_REQUESTS = 8
+_paced_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared weather request thread pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS,
+                                       thread_name_prefix="weather-fetch")
+    return _executor
+
+
+def _get_paced_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool for rate-limited per-point route requests"""
+    global _paced_executor
+    if _paced_executor is None:
+        _paced_executor = ThreadPoolExecutor(max_workers=_MAX_PACED_REQUESTS,
+                                             thread_name_prefix="weather-paced")
+    return _paced_executor
+
+
+def _create_session() -> requests.Session:
+    """
+    HTTP session with pooled keep-alive connections, sized for the worker
+    pool, and retries with backoff on rate limiting and server errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_CONCURRENT_REQUESTS,
+        pool_maxsize=_MAX_CONCURRENT_REQUESTS,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # api.weather.gov rejects requests without an identifying User-Agent
+    session.headers["User-Agent"] = "ship-routing/0.1 (maritime route planning)"
+    return session
+
+
+def _json_payload(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body directly from bytes.
+    
+    json.loads detects UTF-8/16/32 itself, so this skips requests' text
+    decoding and charset guessing on every (large, for NOAA) payload.
+    """
+    return json.loads(response.content)
+
+
+def _fetch_waypoints(fetch: Callable[[float, float], Optional[Dict]],
+                     waypoints: List[Tuple[float, float]]) -> List[Optional[Dict]]:
+    """
+    Call fetch(lat, lon) for every waypoint concurrently.
+    
+    Network round trips overlap instead of running back to back; results
+    come back in waypoint order. Runs on the paced pool, where waiting on a
+    provider's rate limiter only holds back other per-point requests.
+    """
+    if len(waypoints) <= 1:
+        return [fetch(lat, lon) for lat, lon in waypoints]
+    return list(_get_paced_executor().map(lambda point: fetch(*point), waypoints))
+
+
+# Racing providers for a single point: overall time budget, and how long a
+# more preferred provider may still answer once a fallback result is in
+_PROVIDER_RACE_TIMEOUT = 5.0
+_PROVIDER_GRACE_SECONDS = 0.5
+
+# How long a failed lookup (error, non-200, no data for the location) is
+# remembered before the endpoint is asked again
+_FAILURE_CACHE_DURATION = 60
+
+# Shortest time upstream data is cached, even when it is already past its
+# validity window (providers can lag behind their nominal update cycle)
+_MIN_REFRESH_SECONDS = 60
+
+
+def _seconds_until(valid_until: Optional[datetime], default: float) -> float:
+    """Cache lifetime for data valid until valid_until (timezone-aware)"""
+    if valid_until is None:
+        return default
+    remaining = (valid_until - datetime.now(timezone.utc)).total_seconds()
+    return max(remaining, _MIN_REFRESH_SECONDS)
+
+
+# 16-point compass, clockwise from north in 22.5° steps
+_COMPASS_POINTS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                   'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+_DIRECTION_DEGREES: Dict[str, float] = {point: i * 22.5 for i, point in enumerate(_COMPASS_POINTS)}
+
+
+@lru_cache(maxsize=64)
+def _parse_direction(direction_str: str) -> float:
+    """Parse direction string like 'NE' to degrees (0 if unrecognized)"""
+    # Memoized, so inputs needing normalization are only normalized once
+    return _DIRECTION_DEGREES.get(direction_str.upper(), 0)
+
+
+def _wind_to_wave_height(wind_speed_knots: float) -> float:
+    """Estimate wave height (m) from wind speed (simplified Beaufort scale)"""
+    # Simplified relationship between wind speed and wave height
+    if wind_speed_knots < 3:
+        return 0.0
+    elif wind_speed_knots < 10:
+        return wind_speed_knots * 0.05
+    elif wind_speed_knots < 20:
+        return 0.5 + (wind_speed_knots - 10) * 0.1
+    else:
+        return 1.5 + (wind_speed_knots - 20) * 0.15
+
+
+# Weather cost slopes: wind adds 30% per 20 knots, waves add 20% per 2 m
+_WIND_COST_PER_KNOT = 0.3 / 20.0
+_WAVE_COST_PER_METER = 0.2 / 2.0
+
+
+def _apply_weather_multiplier(costs: np.ndarray, winds: np.ndarray, waves: np.ndarray):
+    """
+    Scale costs in place by the wind and wave factors.
+    
+    costs *= (1 + wind effect) * (1 + wave effect), computed with in-place
+    ufuncs and a single scratch array, so very long routes do not allocate
+    one temporary per operation.
+    """
+    # Wind effect: head wind increases cost, tailwind decreases
+    factor = np.multiply(winds, _WIND_COST_PER_KNOT)
+    factor += 1.0
+    costs *= factor
+    
+    # Wave effect: higher waves increase fuel consumption
+    np.multiply(waves, _WAVE_COST_PER_METER, out=factor)
+    factor += 1.0
+    costs *= factor
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket: up to max_calls per period, with bursts of at
+    most max_calls. acquire() blocks until a call is allowed.
+    """
+    
+    def __init__(self, max_calls: int, period: float):
+        self.capacity = float(max_calls)
+        self.rate = max_calls / period  # Tokens per second
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait_seconds = (1.0 - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+@dataclass
+class WeatherBatch:
+    """
+    Weather for many points as columns (structure of arrays).
+    
+    Numeric fields are contiguous arrays for vectorized cost math; per-point
+    dicts are only built at the response boundary with to_dicts().
+    Coordinates are float64, weather fields float32: model and observation
+    values carry far less precision than that, and half-width arrays halve
+    the memory traffic of the cost kernel.
+    """
+    lat: np.ndarray
+    lon: np.ndarray
+    wind_kt: np.ndarray
+    wind_dir_deg: np.ndarray
+    wave_m: np.ndarray
+    temp_c: np.ndarray
+    current_kt: np.ndarray
+    source: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.lat)
+    
+    @classmethod
+    def from_dicts(cls, weather_data: List[Dict]) -> "WeatherBatch":
+        """Columns from per-point weather dicts"""
+        def column(key: str, default: float = 0.0, dtype=np.float32) -> np.ndarray:
+            return np.fromiter((w.get(key, default) for w in weather_data),
+                               dtype=dtype, count=len(weather_data))
+        
+        return cls(
+            lat=column("latitude", dtype=np.float64),
+            lon=column("longitude", dtype=np.float64),
+            wind_kt=column("wind_speed_knots"),
+            wind_dir_deg=column("wind_direction_deg"),
+            wave_m=column("wave_height_m"),
+            temp_c=column("temperature_c"),
+            current_kt=column("current_speed_knots"),
+            source=[w.get("source", "") for w in weather_data],
+        )
+    
+    def to_dicts(self) -> List[Dict]:
+        """Per-point weather dicts, as returned by get_weather_point"""
+        timestamp = datetime.utcnow().isoformat()
+        return [
+            {
+                "source": source,
+                "latitude": lat,
+                "longitude": lon,
+                "timestamp": timestamp,
+                "wind_speed_knots": wind,
+                "wind_direction_deg": wind_dir,
+                "wave_height_m": wave,
+                "temperature_c": temp,
+                "current_speed_knots": current,
+            }
+            for source, lat, lon, wind, wind_dir, wave, temp, current in zip(
+                self.source, self.lat.tolist(), self.lon.tolist(), self.wind_kt.tolist(),
+                self.wind_dir_deg.tolist(), self.wave_m.tolist(), self.temp_c.tolist(),
+                self.current_kt.tolist())
+        ]
 
 
 class WeatherDataProvider:
     """Abstract base for weather data providers"""
     
+    session: requests.Session
+    limiter: Optional[_RateLimiter] = None
+    
     def get_weather_point(self, lat: float, lon: float, 
                          forecast_hours: int = 0) -> Optional[Dict]:
         """
@@ -50,6 +296,33 @@ class WeatherDataProvider:
                          forecast_hours: int = 0) -> List[Dict]:
         """Get weather along route waypoints"""
         raise NotImplementedError
+    
+    def get_weather_points(self, waypoints: List[Tuple[float, float]],
+                           forecast_hours: int = 0) -> List[Optional[Dict]]:
+        """
+        Get weather for many points, aligned with waypoints (None where unavailable).
+        
+        Default: concurrent get_weather_point calls. Providers with a bulk
+        endpoint override this.
+        """
+        return _fetch_waypoints(lambda lat, lon: self._get_weather_point_safe(lat, lon, forecast_hours), waypoints)
+    
+    def _get_weather_point_safe(self, lat: float, lon: float, forecast_hours: int) -> Optional[Dict]:
+        try:
+            return self.get_weather_point(lat, lon, forecast_hours)
+        except Exception as e:
+            print(f"[Weather] Provider error: {e}")
+            return None
+    
+    def is_available(self) -> bool:
+        """Whether the provider is configured to serve requests at all"""
+        return True
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET on the provider's session, paced by its rate limiter"""
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self.session.get(url, **kwargs)
 
 
 class NOAAGFSProvider(WeatherDataProvider):
@@ -65,68 +338,111 @@ class NOAAGFSProvider(WeatherDataProvider):
     POINTS_URL = f"{BASE_URL}/points"
     GRID_URL = "https://www.ncei.noaa.gov/thredds/dodsC/model-ndfd-file"
     
+    POINTS_CACHE_MAXSIZE = 50_000
+    POINTS_CACHE_DURATION = 30 * 86400  # 30 days
+    
     def __init__(self):
-        self.cache = {}
         self.cache_duration = 3600  # 1 hour
+        self.session = _create_session()
+        # No published quota, but api.weather.gov throttles bursts
+        self.limiter = _RateLimiter(10, 1.0)
+        self.cache = TTLCache(settings.WEATHER_CACHE_MAXSIZE, self.cache_duration, get_disk_cache())
+        # Grid point -> forecast URL is effectively static, so keep it far longer
+        self.points_cache = TTLCache(self.POINTS_CACHE_MAXSIZE, self.POINTS_CACHE_DURATION, get_disk_cache())
+        self.failure_cache = TTLCache(settings.WEATHER_CACHE_MAXSIZE, _FAILURE_CACHE_DURATION)
+        self._inflight = SingleFlight()
     
     def _get_cache_key(self, lat: float, lon: float) -> str:
         """Generate cache key"""
         return f"noaa_{round(lat, 2)}_{round(lon, 2)}"
     
-    def _is_cached(self, key: str) -> bool:
-        """Check if data is cached and fresh"""
-        if key in self.cache:
-            cached_time, _ = self.cache[key]
-            if (datetime.utcnow() - cached_time).total_seconds() < self.cache_duration:
-                return True
-        return False
-    
     def get_weather_point(self, lat: float, lon: float, forecast_hours: int = 0) -> Optional[Dict]:
         """Get weather from NOAA GFS"""
+        cache_key = self._get_cache_key(lat, lon)
+        
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return data
+        if self.failure_cache.get(cache_key):
+            return None  # Failed recently, don't retry yet
+        
+        # Concurrent misses for the same cell share one request
+        return self._inflight.do(cache_key, lambda: self._fetch_weather(lat, lon, forecast_hours, cache_key))
+    
+    def _fetch_weather(self, lat: float, lon: float, forecast_hours: int, cache_key: str) -> Optional[Dict]:
+        """Request the forecast for a point from NOAA and cache it"""
         try:
-            cache_key = self._get_cache_key(lat, lon)
-            
-            if self._is_cached(cache_key):
-                _, data = self.cache[cache_key]
-                return data
-            
-            # Get grid point data
-            points_response = requests.get(
-                f"{self.POINTS_URL}/{lat},{lon}",
-                timeout=5
-            )
-            
-            if points_response.status_code == 200:
-                points_data = points_response.json()
-                
-                # Get forecast URL
-                if 'properties' in points_data and 'forecast' in points_data['properties']:
-                    forecast_url = points_data['properties']['forecast']
+            forecast_url = self._get_forecast_url(lat, lon)
+            if forecast_url:
+                # Get actual forecast data
+                forecast_response = self._get(forecast_url, timeout=5)
+                if forecast_response.status_code == 200:
+                    forecast_data = _json_payload(forecast_response)
                     
-                    # Get actual forecast data
-                    forecast_response = requests.get(forecast_url, timeout=5)
-                    if forecast_response.status_code == 200:
-                        forecast_data = forecast_response.json()
-                        
-                        weather = self._parse_forecast(forecast_data, forecast_hours)
-                        self.cache[cache_key] = (datetime.utcnow(), weather)
-                        return weather
+                    weather = self._parse_forecast(forecast_data, forecast_hours)
+                    self.cache.set(cache_key, weather, self._forecast_ttl(forecast_data, forecast_hours))
+                    return weather
         
         except Exception as e:
             print(f"[NOAA] Error getting weather for {lat},{lon}: {e}")
         
+        # Non-200, no forecast for this location (e.g. open ocean) or error
+        self.failure_cache.set(cache_key, True)
         return None
     
-    def _parse_forecast(self, data: Dict, forecast_hours: int) -> Dict:
-        """Parse NOAA forecast data"""
+    def _get_forecast_url(self, lat: float, lon: float) -> Optional[str]:
+        """Forecast URL for the NOAA grid point at lat/lon (cached separately, long TTL)"""
+        points_key = f"noaa_points_{round(lat, 2)}_{round(lon, 2)}"
+        forecast_url = self.points_cache.get(points_key)
+        if forecast_url is not None:
+            return forecast_url
+        
+        # Get grid point data
+        points_response = self._get(
+            f"{self.POINTS_URL}/{lat},{lon}",
+            timeout=5
+        )
+        
+        if points_response.status_code == 200:
+            points_data = _json_payload(points_response)
+            
+            # Get forecast URL
+            if 'properties' in points_data and 'forecast' in points_data['properties']:
+                forecast_url = points_data['properties']['forecast']
+                self.points_cache.set(points_key, forecast_url)
+                return forecast_url
+        
+        return None
+    
+    def _select_period(self, data: Dict, forecast_hours: int) -> Optional[Dict]:
+        """Forecast period covering forecast_hours, None if the payload has none"""
         if 'properties' not in data or 'periods' not in data['properties']:
-            return self._mock_weather(0, 0)
+            return None
         
         periods = data['properties']['periods']
+        if not periods:
+            return None
         
         # Get appropriate period based on forecast_hours
         period_idx = min(forecast_hours // 12, len(periods) - 1)  # NOAA uses 12-hour periods
-        period = periods[period_idx]
+        return periods[period_idx]
+    
+    def _forecast_ttl(self, data: Dict, forecast_hours: int) -> float:
+        """Cache the forecast until its period ends (NOAA 'endTime')"""
+        period = self._select_period(data, forecast_hours)
+        try:
+            end_time = datetime.fromisoformat(period['endTime'])
+        except (TypeError, KeyError, ValueError):
+            return self.cache_duration
+        if end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=timezone.utc)
+        return _seconds_until(end_time, self.cache_duration)
+    
+    def _parse_forecast(self, data: Dict, forecast_hours: int) -> Dict:
+        """Parse NOAA forecast data"""
+        period = self._select_period(data, forecast_hours)
+        if period is None:
+            return self._mock_weather(0, 0)
         
         wind_speed = 0
         wind_direction = 0
@@ -159,32 +475,18 @@ class NOAAGFSProvider(WeatherDataProvider):
     
     def _parse_direction(self, direction_str: str) -> float:
         """Parse direction string like 'NE' to degrees"""
-        directions = {
-            'N': 0, 'NNE': 22.5, 'NE': 45, 'ENE': 67.5,
-            'E': 90, 'ESE': 112.5, 'SE': 135, 'SSE': 157.5,
-            'S': 180, 'SSW': 202.5, 'SW': 225, 'WSW': 247.5,
-            'W': 270, 'WNW': 292.5, 'NW': 315, 'NNW': 337.5
-        }
-        return directions.get(direction_str.upper(), 0)
+        return _parse_direction(direction_str)
     
     def _wind_to_wave_height(self, wind_speed_knots: float) -> float:
         """Estimate wave height from wind speed (simplified Beaufort scale)"""
-        # Simplified relationship between wind speed and wave height
-        if wind_speed_knots < 3:
-            return 0.0
-        elif wind_speed_knots < 10:
-            return wind_speed_knots * 0.05
-        elif wind_speed_knots < 20:
-            return 0.5 + (wind_speed_knots - 10) * 0.1
-        else:
-            return 1.5 + (wind_speed_knots - 20) * 0.15
+        return _wind_to_wave_height(wind_speed_knots)
     
     def get_weather_route(self, waypoints: List[Tuple[float, float]], 
                          forecast_hours: int = 0) -> List[Dict]:
         """Get weather for multiple waypoints"""
         weather_data = []
-        for lat, lon in waypoints:
-            weather = self.get_weather_point(lat, lon, forecast_hours)
+        fetched = self.get_weather_points(waypoints, forecast_hours)
+        for (lat, lon), weather in zip(waypoints, fetched):
             if weather:
                 weather['latitude'] = lat
                 weather['longitude'] = lon
@@ -205,26 +507,45 @@ class OpenWeatherMapProvider(WeatherDataProvider):
     
     BASE_URL = "https://api.openweathermap.org/data/2.5"
     
+    # Bounding-box station lookup: map zoom level, and how far a station may
+    # be from a waypoint and still stand in for it
+    BOX_ZOOM = 10
+    MAX_STATION_DISTANCE_DEG = 0.25
+    
     def __init__(self):
         self.api_key = settings.OPENWEATHER_API_KEY
-        self.cache = {}
         self.cache_duration = 600  # 10 minutes
+        self.session = _create_session()
+        self.limiter = _RateLimiter(60, 60.0)  # Free tier: 60 calls/minute
+        self.cache = TTLCache(settings.WEATHER_CACHE_MAXSIZE, self.cache_duration, get_disk_cache())
+        self.failure_cache = TTLCache(settings.WEATHER_CACHE_MAXSIZE, _FAILURE_CACHE_DURATION)
+        self._inflight = SingleFlight()
     
     def get_weather_point(self, lat: float, lon: float, 
                          forecast_hours: int = 0) -> Optional[Dict]:
         """Get current weather from OpenWeatherMap"""
+        if not self.is_available():
+            return None
+        
+        cache_key = self._get_cache_key(lat, lon)
+        
+        # Check cache
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return data
+        if self.failure_cache.get(cache_key):
+            return None  # Failed recently, don't retry yet
+        
+        # Concurrent misses for the same cell share one request
+        return self._inflight.do(cache_key, lambda: self._fetch_weather(lat, lon, cache_key))
+    
+    def _get_cache_key(self, lat: float, lon: float) -> str:
+        """Generate cache key"""
+        return f"owm_{round(lat, 2)}_{round(lon, 2)}"
+    
+    def _fetch_weather(self, lat: float, lon: float, cache_key: str) -> Optional[Dict]:
+        """Request current weather for a point from OpenWeatherMap and cache it"""
         try:
-            if not self.api_key or self.api_key == "your-openweather-api-key":
-                return None
-            
-            cache_key = f"owm_{round(lat, 2)}_{round(lon, 2)}"
-            
-            # Check cache
-            if cache_key in self.cache:
-                cached_time, data = self.cache[cache_key]
-                if (datetime.utcnow() - cached_time).total_seconds() < self.cache_duration:
-                    return data
-            
             # Get current weather
             params = {
                 "lat": lat,
@@ -233,57 +554,118 @@ class OpenWeatherMapProvider(WeatherDataProvider):
                 "units": "metric"
             }
             
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/weather",
                 params=params,
                 timeout=5
             )
             
             if response.status_code == 200:
-                data = response.json()
-                weather = {
-                    "source": "OpenWeatherMap",
-                    "latitude": lat,
-                    "longitude": lon,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "wind_speed_knots": data['wind']['speed'] * 1.94384,  # m/s to knots
-                    "wind_direction_deg": data['wind'].get('deg', 0),
-                    "wave_height_m": self._estimate_wave_height(data['wind']['speed']),
-                    "temperature_c": data['main']['temp'],
-                    "humidity_percent": data['main'].get('humidity', 50),
-                    "pressure_hpa": data['main'].get('pressure', 1013),
-                    "current_speed_knots": 0.3
-                }
-                
-                self.cache[cache_key] = (datetime.utcnow(), weather)
+                data = _json_payload(response)
+                weather = self._parse_observation(data, lat, lon)
+                self._cache_observation(cache_key, weather, data)
                 return weather
         
         except Exception as e:
             print(f"[OpenWeatherMap] Error: {e}")
         
+        self.failure_cache.set(cache_key, True)
         return None
     
+    def _parse_observation(self, data: Dict, lat: float, lon: float) -> Dict:
+        """Weather dict from an OpenWeatherMap observation payload"""
+        return {
+            "source": "OpenWeatherMap",
+            "latitude": lat,
+            "longitude": lon,
+            "timestamp": datetime.utcnow().isoformat(),
+            "wind_speed_knots": data['wind']['speed'] * 1.94384,  # m/s to knots
+            "wind_direction_deg": data['wind'].get('deg', 0),
+            "wave_height_m": self._estimate_wave_height(data['wind']['speed']),
+            "temperature_c": data['main']['temp'],
+            "humidity_percent": data['main'].get('humidity', 50),
+            "pressure_hpa": data['main'].get('pressure', 1013),
+            "current_speed_knots": 0.3
+        }
+    
+    def _cache_observation(self, cache_key: str, weather: Dict, data: Dict):
+        """Cache weather until the observation is superseded"""
+        # Observations are superseded cache_duration after they were taken
+        valid_until = None
+        if 'dt' in data:
+            valid_until = datetime.fromtimestamp(data['dt'], timezone.utc) + \
+                timedelta(seconds=self.cache_duration)
+        self.cache.set(cache_key, weather, _seconds_until(valid_until, self.cache_duration))
+    
+    def _fetch_box_stations(self, waypoints: List[Tuple[float, float]]) -> List[Dict]:
+        """Observations of all stations inside the waypoints' bounding box, in one request"""
+        lats = [lat for lat, _ in waypoints]
+        lons = [lon for _, lon in waypoints]
+        pad = self.MAX_STATION_DISTANCE_DEG
+        bbox = (f"{min(lons) - pad},{min(lats) - pad},"
+                f"{max(lons) + pad},{max(lats) + pad},{self.BOX_ZOOM}")
+        try:
+            response = self._get(
+                f"{self.BASE_URL}/box/city",
+                params={"bbox": bbox, "appid": self.api_key, "units": "metric"},
+                timeout=5
+            )
+            if response.status_code == 200:
+                return [
+                    station for station in _json_payload(response).get('list', [])
+                    if 'coord' in station and 'wind' in station and 'main' in station
+                ]
+        except Exception as e:
+            print(f"[OpenWeatherMap] Bounding box request failed: {e}")
+        return []
+    
+    def get_weather_points(self, waypoints: List[Tuple[float, float]],
+                           forecast_hours: int = 0) -> List[Optional[Dict]]:
+        """
+        Get current weather for many points with as few requests as possible.
+        
+        Cached points are served directly; the rest are matched to the
+        nearest station from a single bounding-box request. Only points with
+        no station within MAX_STATION_DISTANCE_DEG fall back to per-point
+        requests.
+        """
+        if not self.is_available():
+            return [None] * len(waypoints)
+        
+        keys = [self._get_cache_key(lat, lon) for lat, lon in waypoints]
+        results: List[Optional[Dict]] = [self.cache.get(key) for key in keys]
+        missing = [k for k, weather in enumerate(results)
+                   if weather is None and not self.failure_cache.get(keys[k])]
+        
+        if len(missing) > 1:
+            stations = self._fetch_box_stations([waypoints[k] for k in missing])
+            if stations:
+                tree = cKDTree([(station['coord']['Lat'], station['coord']['Lon']) for station in stations])
+                distances, nearest = tree.query([waypoints[k] for k in missing])
+                for k, distance, i in zip(missing, distances.tolist(), nearest.tolist()):
+                    if distance <= self.MAX_STATION_DISTANCE_DEG:
+                        lat, lon = waypoints[k]
+                        results[k] = self._parse_observation(stations[i], lat, lon)
+                        self._cache_observation(keys[k], results[k], stations[i])
+                missing = [k for k in missing if results[k] is None]
+        
+        fetched = super().get_weather_points([waypoints[k] for k in missing], forecast_hours)
+        for k, weather in zip(missing, fetched):
+            results[k] = weather
+        return results
+    
+    def is_available(self) -> bool:
+        """Requires a configured API key"""
+        return bool(self.api_key) and self.api_key != "your-openweather-api-key"
+    
     def _estimate_wave_height(self, wind_speed_ms: float) -> float:
         """Estimate wave height from wind speed"""
-        wind_knots = wind_speed_ms * 1.94384
-        if wind_knots < 3:
-            return 0.0
-        elif wind_knots < 10:
-            return wind_knots * 0.05
-        elif wind_knots < 20:
-            return 0.5 + (wind_knots - 10) * 0.1
-        else:
-            return 1.5 + (wind_knots - 20) * 0.15
+        return _wind_to_wave_height(wind_speed_ms * 1.94384)
     
     def get_weather_route(self, waypoints: List[Tuple[float, float]], 
                          forecast_hours: int = 0) -> List[Dict]:
         """Get weather for multiple waypoints"""
-        weather_data = []
-        for lat, lon in waypoints:
-            weather = self.get_weather_point(lat, lon, forecast_hours)
-            if weather:
-                weather_data.append(weather)
-        return weather_data
+        return [weather for weather in self.get_weather_points(waypoints, forecast_hours) if weather]
 
 
 class RealTimeWeatherService:
@@ -317,34 +699,117 @@ class RealTimeWeatherService:
         Returns:
             Weather dictionary with wind, waves, temperature
         """
-        # Try each provider
-        for provider in self.providers:
-            try:
-                weather = provider.get_weather_point(lat, lon, forecast_hours)
-                if weather:
-                    weather['latitude'] = lat
-                    weather['longitude'] = lon
-                    return weather
-            except Exception as e:
-                print(f"[Weather] Provider error: {e}")
-                continue
+        weather = self._get_provider_weather(lat, lon, forecast_hours)
+        if weather:
+            weather['latitude'] = lat
+            weather['longitude'] = lon
+            return weather
         
         # Fallback to mock
         return self._mock_weather(lat, lon)
     
+    def _get_provider_weather(self, lat: float, lon: float, forecast_hours: int) -> Optional[Dict]:
+        """
+        Weather from the most preferred provider that has it, None if none do.
+        
+        Providers are queried concurrently, so a slow or failing provider no
+        longer delays the next one by its full timeout. A result is returned
+        as soon as every more preferred provider has answered without data;
+        otherwise more preferred providers get a short grace period before
+        the best result so far is used.
+        """
+        providers = [provider for provider in self.providers if provider.is_available()]
+        if len(providers) <= 1:
+            for provider in providers:
+                return provider._get_weather_point_safe(lat, lon, forecast_hours)
+            return None
+        
+        executor = _get_executor()
+        futures = [executor.submit(provider._get_weather_point_safe, lat, lon, forecast_hours)
+                   for provider in providers]
+        deadline = time.monotonic() + _PROVIDER_RACE_TIMEOUT
+        
+        while True:
+            decided, weather = self._preferred_result(futures)
+            now = time.monotonic()
+            if decided or now >= deadline:
+                break
+            if weather is not None:
+                deadline = min(deadline, now + _PROVIDER_GRACE_SECONDS)
+            wait([f for f in futures if not f.done()], timeout=deadline - now, return_when=FIRST_COMPLETED)
+        
+        for future in futures:
+            future.cancel()  # Only stops requests that have not started yet
+        return weather
+    
+    @staticmethod
+    def _preferred_result(futures: List[Future]) -> Tuple[bool, Optional[Dict]]:
+        """
+        (decided, weather) from provider futures in preference order: the
+        first usable result among finished ones, and whether it is final
+        (no more preferred provider still running).
+        """
+        running = False
+        for future in futures:
+            if not future.done():
+                running = True
+                continue
+            weather = future.result()
+            if weather:
+                return not running, weather
+        return not running, None
+    
     def get_weather_route(self, waypoints: List[Tuple[float, float]], 
                          forecast_hours: int = 0) -> List[Dict]:
-        """Get weather along route"""
-        weather_data = []
+        """
+        Get weather along route.
+        
+        Waypoints falling in the same 0.01° cell (the providers' cache
+        granularity) are fetched once; unique cells are fetched concurrently.
+        Waypoints no provider covers get mock weather in one vectorized pass.
+        """
+        fetched: Dict[Tuple[float, float], Optional[Dict]] = {}
+        if any(provider.is_available() for provider in self.providers):
+            cells: Dict[Tuple[float, float], Tuple[float, float]] = {}
+            for lat, lon in waypoints:
+                cells.setdefault((round(lat, 2), round(lon, 2)), (lat, lon))
+            
+            # Each provider in order of preference fills the cells still uncovered,
+            # using its own batch strategy
+            for provider in self.providers:
+                remaining = [key for key in cells if not fetched.get(key)]
+                if not remaining or not provider.is_available():
+                    continue
+                try:
+                    results = provider.get_weather_points([cells[key] for key in remaining], forecast_hours)
+                except Exception as e:
+                    print(f"[Weather] Provider error: {e}")
+                    continue
+                fetched.update(zip(remaining, results))
+        
+        weather_data: List[Optional[Dict]] = []
+        missing: List[int] = []
         for lat, lon in waypoints:
-            weather = self.get_weather_point(lat, lon, forecast_hours)
+            weather = fetched.get((round(lat, 2), round(lon, 2)))
+            if weather:
+                weather = dict(weather)
+                weather['latitude'] = lat
+                weather['longitude'] = lon
+            else:
+                missing.append(len(weather_data))
             weather_data.append(weather)
+        
+        # Fallback to mock
+        if missing:
+            mock = self.get_weather_route_mock_bulk(
+                [waypoints[k][0] for k in missing], [waypoints[k][1] for k in missing])
+            for k, weather in zip(missing, mock.to_dicts()):
+                weather_data[k] = weather
+        
         return weather_data
     
     def _mock_weather(self, lat: float, lon: float) -> Dict:
         """Generate realistic mock weather"""
-        import random
-        
         # Base conditions vary by latitude
         lat_factor = (lat + 60) / 120
         
@@ -365,6 +830,45 @@ class RealTimeWeatherService:
             "current_speed_knots": 0.3 + (lat_factor * 0.7)
         }
     
+    def get_weather_batch(self, waypoints: List[Tuple[float, float]],
+                          forecast_hours: int = 0) -> WeatherBatch:
+        """Get weather along route as column arrays"""
+        return WeatherBatch.from_dicts(self.get_weather_route(waypoints, forecast_hours))
+    
+    def get_weather_route_mock_bulk(self, lats: np.ndarray, lons: np.ndarray) -> WeatherBatch:
+        """
+        Mock weather for many points at once, same model as _mock_weather.
+        
+        Args:
+            lats, lons: Point coordinates
+        
+        Returns:
+            WeatherBatch with one entry per point
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        rng = np.random.default_rng()
+        n = lats.size
+        
+        # Base conditions vary by latitude
+        lat_factor = ((lats + 60) / 120).astype(np.float32)
+        
+        base_wind = 8 + (lat_factor * 15)
+        wind_speed = base_wind + rng.uniform(-3, 3, n).astype(np.float32)
+        
+        wave_height = 1.0 + (lat_factor * 2) + rng.uniform(-0.5, 0.5, n).astype(np.float32)
+        
+        return WeatherBatch(
+            lat=lats,
+            lon=lons,
+            wind_kt=np.maximum(wind_speed, 0),
+            wind_dir_deg=rng.uniform(0, 360, n).astype(np.float32),
+            wave_m=np.maximum(wave_height, 0.5),
+            temp_c=20 + (lat_factor * 8),
+            current_kt=0.3 + (lat_factor * 0.7),
+            source=["MOCK"] * n,
+        )
+    
     def apply_weather_to_route_cost(self, waypoints: List[Tuple[float, float]], 
                                    base_costs: List[float]) -> List[float]:
         """
@@ -379,27 +883,14 @@ class RealTimeWeatherService:
         Returns:
             Weather-adjusted costs
         """
-        weather_data = self.get_weather_route(waypoints)
-        adjusted_costs = []
-        
-        for i, cost in enumerate(base_costs):
-            if i < len(weather_data):
-                weather = weather_data[i]
-                
-                # Wind effect: head wind increases cost, tailwind decreases
-                wind_factor = 1.0 + (weather['wind_speed_knots'] / 20.0) * 0.3
-                
-                # Wave effect: higher waves increase fuel consumption
-                wave_factor = 1.0 + (weather['wave_height_m'] / 2.0) * 0.2
-                
-                # Combined weather multiplier
-                weather_multiplier = wind_factor * wave_factor
-                
-                adjusted_costs.append(cost * weather_multiplier)
-            else:
-                adjusted_costs.append(cost)
+        weather = self.get_weather_batch(waypoints)
+        costs = np.array(base_costs, dtype=np.float32)
+        
+        # Segments without weather keep their base cost
+        n = min(len(costs), len(weather))
+        _apply_weather_multiplier(costs[:n], weather.wind_kt[:n], weather.wave_m[:n])
         
-        return adjusted_costs
+        return costs.tolist()
 
 
 # Singleton instance
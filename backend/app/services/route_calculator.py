@@ -1,12 +1,73 @@
 import numpy as np
-import math
-from typing import List, Tuple, Dict, Optional
+from math import asin as _asin, atan2 as _atan2, cos as _cos, degrees as _deg, \
+    radians as _rad, sin as _sin, sqrt as _sqrt
+import time
+from functools import lru_cache
+from typing import Callable, List, Tuple, Dict, Optional
 from app.algorithms.rrt_star import RRTStar
 from app.algorithms.hybrid_bidirectional_rrt_star import HybridBidirectionalRRTStar
 from app.algorithms.d_star import DStar
-from app.services.weather_cmems import CMEMSWeatherService, get_fuel_impact_factors
+from app.services.weather_cmems import CMEMSWeatherService, fuel_impact_multipliers
+from app.services.cache import SingleFlight, TTLCache
 from app.services.fuel_model import FuelConsumptionModel, VesselType
 
+# Mean Earth radius, and in nautical miles for distances
+_EARTH_RADIUS_KM = 6371
+_KM_TO_NM = 0.539957
+_EARTH_RADIUS_NM = _EARTH_RADIUS_KM * _KM_TO_NM
+
+# Route weather summaries, keyed by rounded endpoints and hour: conditions
+# do not change per request, so repeated port pairs skip the fetch
+_WEATHER_CACHE_TTL = 900  # 15 minutes
+_WEATHER_CACHE_MAXSIZE = 256
+_weather_cache = TTLCache(_WEATHER_CACHE_MAXSIZE, _WEATHER_CACHE_TTL)  # LRU once full
+_weather_inflight = SingleFlight()  # Concurrent misses for a route share one fetch
+
+
+def _cached_route_weather(key: Tuple, fetch: Callable[[], Dict]) -> Dict:
+    """Cached result of fetch() for key, fetching (and caching) on a miss or expiry"""
+    value = _weather_cache.get(key)
+    if value is None:
+        def fetch_and_cache() -> Dict:
+            fetched = fetch()
+            _weather_cache.set(key, fetched)
+            return fetched
+        
+        value = _weather_inflight.do(key, fetch_and_cache)
+    return dict(value)
+
+
+@lru_cache(maxsize=16)
+def _get_fuel_model(vessel_type: VesselType) -> FuelConsumptionModel:
+    """Fuel model per vessel type, shared across calculator instances (requests)"""
+    return FuelConsumptionModel(vessel_type)
+
+
+def _central_angle_and_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """
+    Great-circle central angle (radians) and initial bearing (degrees)
+    between two coordinates.
+    
+    Haversine distance and bearing share their radians and cos(lat) terms,
+    so both come out of one pass.
+    """
+    lat1_rad = _rad(lat1)
+    lat2_rad = _rad(lat2)
+    cos_lat1 = _cos(lat1_rad)
+    cos_lat2 = _cos(lat2_rad)
+    
+    dlat = lat2_rad - lat1_rad
+    dlon = _rad(lon2) - _rad(lon1)
+    
+    a = _sin(dlat/2)**2 + cos_lat1 * cos_lat2 * _sin(dlon/2)**2
+    c = 2 * _asin(_sqrt(a))
+    
+    x = _sin(dlon) * cos_lat2
+    y = cos_lat1 * _sin(lat2_rad) - _sin(lat1_rad) * cos_lat2 * _cos(dlon)
+    initial_bearing = (_deg(_atan2(x, y)) + 360) % 360
+    
+    return c, initial_bearing
+
 
 class ShipRouteCalculator:
     """
@@ -36,85 +97,158 @@ class ShipRouteCalculator:
         "roro_ship": {"fuel_per_nm": 0.22, "max_speed": 19.0, "capacity": 3500},
     }
     
+    # Known offshore coordinates for major Indian ports (to avoid land polygon
+    # issues): ports within 0.2° of a source are moved to its destination
+    _OFFSHORE_PORTS_SRC = np.array([
+        (19.076, 72.877),  # Mumbai
+        (13.194, 80.282),  # Chennai
+        (22.572, 88.364),  # Kolkata
+    ])
+    _OFFSHORE_PORTS_DST = np.array([
+        (18.9, 72.8),  # Mumbai -> offshore
+        (13.0, 80.3),  # Chennai -> offshore
+        (21.5, 88.0),  # Kolkata -> offshore
+    ])
+    
+    # _snap_to_water search pattern as (dlat, dlon) offsets in search order:
+    # 19 offshore steps of 0.05° away from the coast, then 8 directions at
+    # growing radii (up to 60nm)
+    _SNAP_OFFSHORE_STEPS = 0.05 * np.arange(1, 20)
+    _SNAP_GRID_OFFSETS = np.array([
+        (dlat * radius, dlon * radius)
+        for radius in (0.1, 0.2, 0.3, 0.5, 0.7, 1.0)
+        for dlat, dlon in (
+            (0, 1), (0, -1), (1, 0), (-1, 0),  # Cardinal
+            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal
+        )
+    ])
+    _SNAP_OFFSETS_WEST = np.vstack([
+        np.column_stack([np.zeros(19), -_SNAP_OFFSHORE_STEPS]), _SNAP_GRID_OFFSETS
+    ])
+    _SNAP_OFFSETS_EAST = np.vstack([
+        np.column_stack([np.zeros(19), _SNAP_OFFSHORE_STEPS]), _SNAP_GRID_OFFSETS
+    ])
+    
     # CO2 emission factor (kg CO2 per liter of fuel)
     CO2_PER_LITER = 3.15
     # Fuel density (liters per tonne)
     FUEL_DENSITY = 1.025
     
     def __init__(self):
-        self.earth_radius = 6371  # km
+        self.earth_radius = _EARTH_RADIUS_KM  # km
         self.weather_service = CMEMSWeatherService()
-        self.fuel_models = {}  # Cache for fuel models
         self.grid_cache = None  # Cache ocean grid to avoid reinitializing
         self.hazard_cache = None  # Cache hazard service
     
     def haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance between two coordinates in km"""
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        return self.earth_radius * c * 0.539957  # Convert to nautical miles
+        """Calculate distance between two coordinates in nautical miles"""
+        c, _ = _central_angle_and_bearing(lat1, lon1, lat2, lon2)
+        return _EARTH_RADIUS_NM * c
     
     def bearing(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate bearing between two coordinates"""
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        _, initial_bearing = _central_angle_and_bearing(lat1, lon1, lat2, lon2)
+        return initial_bearing
+    
+    def distance_and_bearing(self, lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Distance in nautical miles and bearing between two coordinates, in one pass"""
+        c, initial_bearing = _central_angle_and_bearing(lat1, lon1, lat2, lon2)
+        return _EARTH_RADIUS_NM * c, initial_bearing
+    
+    def segment_metrics(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distances and bearings of all consecutive segments of a route at once.
         
-        dlon = lon2_rad - lon1_rad
-        x = math.sin(dlon) * math.cos(lat2_rad)
-        y = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
+        Batch counterpart of distance_and_bearing (same spherical model), so
+        route metrics and the straight-line baseline agree; single point
+        pairs stay on the scalar math kernel, which is cheaper per call.
         
-        initial_bearing = math.atan2(x, y)
-        initial_bearing = math.degrees(initial_bearing)
-        initial_bearing = (initial_bearing + 360) % 360
+        Args:
+            points: (N, 2) array of (lat, lon) waypoints
         
-        return initial_bearing
+        Returns:
+            (distances in nautical miles, bearings in degrees), N - 1 each
+        """
+        lat_rad = np.radians(points[:, 0])
+        lon_rad = np.radians(points[:, 1])
+        lat1, lat2 = lat_rad[:-1], lat_rad[1:]
+        cos_lat1, cos_lat2 = np.cos(lat1), np.cos(lat2)
+        sin_lat1, sin_lat2 = np.sin(lat1), np.sin(lat2)
+        dlat = lat2 - lat1
+        dlon = np.diff(lon_rad)
+        
+        a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+        distances = _EARTH_RADIUS_NM * 2 * np.arcsin(np.sqrt(a))
+        
+        x = np.sin(dlon) * cos_lat2
+        y = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * np.cos(dlon)
+        bearings = (np.degrees(np.arctan2(x, y)) + 360) % 360
+        
+        return distances, bearings
     
     def destination_point(self, lat: float, lon: float, bearing: float, distance_nm: float) -> Tuple[float, float]:
         """Calculate destination point given bearing and distance"""
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        bearing_rad = math.radians(bearing)
-        distance_rad = distance_nm / (self.earth_radius * 0.539957)
+        lat_rad = _rad(lat)
+        lon_rad = _rad(lon)
+        bearing_rad = _rad(bearing)
+        distance_rad = distance_nm / _EARTH_RADIUS_NM
+        
+        lat2_rad = _asin(_sin(lat_rad) * _cos(distance_rad) + 
+                             _cos(lat_rad) * _sin(distance_rad) * _cos(bearing_rad))
+        lon2_rad = lon_rad + _atan2(_sin(bearing_rad) * _sin(distance_rad) * _cos(lat_rad),
+                                        _cos(distance_rad) - _sin(lat_rad) * _sin(lat2_rad))
+        
+        return (_deg(lat2_rad), _deg(lon2_rad))
+    
+    def destination_points(self, lat: float, lon: float, bearings: np.ndarray,
+                           distances_nm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized destination_point for many bearings/distances from one origin.
         
-        lat2_rad = math.asin(math.sin(lat_rad) * math.cos(distance_rad) + 
-                             math.cos(lat_rad) * math.sin(distance_rad) * math.cos(bearing_rad))
-        lon2_rad = lon_rad + math.atan2(math.sin(bearing_rad) * math.sin(distance_rad) * math.cos(lat_rad),
-                                        math.cos(distance_rad) - math.sin(lat_rad) * math.sin(lat2_rad))
+        Args:
+            lat, lon: Origin
+            bearings: Bearings in degrees
+            distances_nm: Distances in nautical miles (broadcast against bearings)
         
-        return (math.degrees(lat2_rad), math.degrees(lon2_rad))
+        Returns:
+            (latitudes, longitudes) arrays of the destinations
+        """
+        lat_rad = _rad(lat)
+        sin_lat, cos_lat = _sin(lat_rad), _cos(lat_rad)
+        bearing_rad = np.radians(bearings)
+        distance_rad = np.asarray(distances_nm, dtype=np.float64) / _EARTH_RADIUS_NM
+        sin_dist, cos_dist = np.sin(distance_rad), np.cos(distance_rad)
+        
+        sin_lat2 = sin_lat * cos_dist + cos_lat * sin_dist * np.cos(bearing_rad)
+        lat2_rad = np.arcsin(sin_lat2)
+        lon2_rad = _rad(lon) + np.arctan2(np.sin(bearing_rad) * sin_dist * cos_lat,
+                                                  cos_dist - sin_lat * sin_lat2)
+        
+        return np.degrees(lat2_rad), np.degrees(lon2_rad)
     
-    def interpolate_route(self, waypoints: List[Tuple[float, float]], num_points: int = 50) -> List[Tuple[float, float]]:
-        """Simple linear interpolation between waypoints"""
+    def interpolate_route(self, waypoints: List[Tuple[float, float]], num_points: int = 50) -> np.ndarray:
+        """
+        Simple linear interpolation between waypoints.
+        
+        Returns:
+            (N, 2) array of (lat, lon) points; convert with tolist() at the
+            response boundary
+        """
         if len(waypoints) < 2:
-            return waypoints
+            return np.asarray(waypoints, dtype=np.float64).reshape(-1, 2)
         
-        interpolated = [waypoints[0]]
+        # Number of segments between each pair of waypoints
+        segments = max(2, int(num_points / (len(waypoints) - 1)))
         
-        for i in range(len(waypoints) - 1):
-            lat1, lon1 = waypoints[i]
-            lat2, lon2 = waypoints[i + 1]
-            
-            # Number of segments between these two waypoints
-            segments = max(2, int(num_points / (len(waypoints) - 1)))
-            
-            for j in range(1, segments):
-                ratio = j / segments
-                lat = lat1 + (lat2 - lat1) * ratio
-                lon = lon1 + (lon2 - lon1) * ratio
-                interpolated.append((lat, lon))
-            
-            interpolated.append(waypoints[i + 1])
+        # Each leg contributes its start waypoint and segments - 1 points
+        # along it; the final waypoint closes the route
+        points = np.asarray(waypoints, dtype=np.float64)
+        ratios = np.arange(segments) / segments
+        legs = points[:-1, None, :] + (points[1:] - points[:-1])[:, None, :] * ratios[None, :, None]
+        
+        interpolated = np.empty((legs.shape[0] * segments + 1, 2))
+        interpolated[:-1] = legs.reshape(-1, 2)
+        interpolated[-1] = points[-1]
         
         return interpolated
     
@@ -134,44 +268,35 @@ class ShipRouteCalculator:
         # Determine if west or east coast based on longitude
         is_west_coast = lon < 76  # Rough India midpoint
         
-        # Search offshore first (perpendicular to coast)
-        if is_west_coast:
-            # West coast: search westward (decreasing lon)
-            for i in range(1, 20):
-                offset = -0.05 * i  # Move west
-                test_lat, test_lon = lat, lon + offset
-                if not LandDetectionService.is_point_on_land(test_lat, test_lon):
-                    print(f"[INFO] Snapped {point_name} to water at ({test_lat:.3f}, {test_lon:.3f})")
-                    return (test_lat, test_lon)
-        else:
-            # East coast: search eastward (increasing lon)
-            for i in range(1, 20):
-                offset = 0.05 * i  # Move east
-                test_lat, test_lon = lat, lon + offset
-                if not LandDetectionService.is_point_on_land(test_lat, test_lon):
-                    print(f"[INFO] Snapped {point_name} to water at ({test_lat:.3f}, {test_lon:.3f})")
-                    return (test_lat, test_lon)
-        
-        # Fallback: grid search
-        search_radius_deg = [0.1, 0.2, 0.3, 0.5, 0.7, 1.0]  # Up to 60nm
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),  # Cardinal
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal
-        ]
+        # Search offshore first (perpendicular to coast: west coast moves
+        # west, east coast moves east), then the grid around the point.
+        # All candidates are checked in one batch, first water hit wins.
+        offsets = self._SNAP_OFFSETS_WEST if is_west_coast else self._SNAP_OFFSETS_EAST
+        test_lats = lat + offsets[:, 0]
+        test_lons = lon + offsets[:, 1]
+        water = np.flatnonzero(~LandDetectionService.points_on_land(test_lats, test_lons))
         
-        for radius in search_radius_deg:
-            for dlat, dlon in directions:
-                test_lat = lat + dlat * radius
-                test_lon = lon + dlon * radius
-                
-                if not LandDetectionService.is_point_on_land(test_lat, test_lon):
-                    print(f"[INFO] Snapped {point_name} to water at ({test_lat:.3f}, {test_lon:.3f})")
-                    return (test_lat, test_lon)
+        if water.size:
+            test_lat, test_lon = float(test_lats[water[0]]), float(test_lons[water[0]])
+            print(f"[INFO] Snapped {point_name} to water at ({test_lat:.3f}, {test_lon:.3f})")
+            return (test_lat, test_lon)
         
         # Fallback: return original (will cause failure, but explicit)
         print(f"[WARNING] Could not find water near {point_name}, using original coordinates")
         return (lat, lon)
     
+    def _resolve_port(self, lat: float, lon: float, point_name: str) -> Tuple[float, float]:
+        """Known offshore coordinates for a major port, otherwise the point snapped to water"""
+        # Always snap Mumbai, Chennai and Kolkata to offshore water grid cells
+        near_port = np.abs(self._OFFSHORE_PORTS_SRC - (lat, lon)).max(axis=1) < 0.2
+        if near_port.any():
+            lat, lon = self._OFFSHORE_PORTS_DST[np.argmax(near_port)].tolist()
+            print(f"[INFO] Using offshore coordinates for {point_name} port: ({lat}, {lon})")
+            return (lat, lon)
+        
+        # Anywhere else, snap to nearest water
+        return self._snap_to_water(lat, lon, point_name)
+    
     def calculate_fuel_consumption(self, distance_nm: float, vessel_type: str, weather_factor: float = 1.0) -> float:
         """Calculate fuel consumption in tonnes"""
         if vessel_type not in self.VESSEL_SPECS:
@@ -191,28 +316,35 @@ class ShipRouteCalculator:
         
         return co2_tonnes
     
-    def weather_impact_factor(self, wind_speed: float, wave_height: float, current_speed: float) -> float:
-        """Calculate weather impact factor on fuel consumption"""
-        # Base factor
-        factor = 1.0
-        
-        # Wind impact (knots)
-        if wind_speed > 20:
-            factor += 0.1
-        if wind_speed > 30:
-            factor += 0.1
-        
-        # Wave impact (meters)
-        if wave_height > 2:
-            factor += 0.05
-        if wave_height > 4:
-            factor += 0.1
-        
-        # Current impact (knots)
-        if current_speed > 1:
-            factor += 0.05
-        
-        return min(factor, 1.5)  # Cap at 1.5x
+    def weather_impact_factor(self, wind_speed, wave_height, current_speed):
+        """
+        Calculate weather impact factor on fuel consumption.
+        
+        Thresholds are summed as 0/1 terms rather than branched on, so the
+        same expression works for scalars and for per-segment arrays.
+        
+        Args:
+            wind_speed: Knots (float or array)
+            wave_height: Meters (float or array)
+            current_speed: Knots (float or array)
+        
+        Returns:
+            Factor (float, or array matching the inputs)
+        """
+        factor = (
+            1.0
+            # Wind impact (knots)
+            + 0.1 * np.greater(wind_speed, 20)
+            + 0.1 * np.greater(wind_speed, 30)
+            # Wave impact (meters)
+            + 0.05 * np.greater(wave_height, 2)
+            + 0.1 * np.greater(wave_height, 4)
+            # Current impact (knots)
+            + 0.05 * np.greater(current_speed, 1)
+        )
+        factor = np.minimum(factor, 1.5)  # Cap at 1.5x
+        
+        return float(factor) if np.ndim(factor) == 0 else factor
     
     def plan_route(
         self,
@@ -244,32 +376,8 @@ class ShipRouteCalculator:
         Returns:
             Complete route plan with fuel, emissions, and safety metrics
         """
-        from app.services.land_detection import LandDetectionService
-        
-        # Known offshore coordinates for major Indian ports (to avoid land polygon issues)
-        OFFSHORE_PORTS = {
-            (19.076, 72.877): (18.9, 72.8),  # Mumbai -> offshore
-            (13.194, 80.282): (13.0, 80.3),  # Chennai -> offshore
-            (22.572, 88.364): (21.5, 88.0),  # Kolkata -> offshore
-        }
-        
-        # Check if we have pre-defined offshore coordinates
-        start_key = (round(start_lat, 2), round(start_lon, 2))
-        end_key = (round(end_lat, 2), round(end_lon, 2))
-        
-         # Always snap Mumbai and Chennai to offshore water grid cells
-        for port_coords, offshore_coords in OFFSHORE_PORTS.items():
-            if abs(start_lat - port_coords[0]) < 0.2 and abs(start_lon - port_coords[1]) < 0.2:
-                start_lat, start_lon = offshore_coords
-                print(f"[INFO] Using offshore coordinates for start port: ({start_lat}, {start_lon})")
-            if abs(end_lat - port_coords[0]) < 0.2 and abs(end_lon - port_coords[1]) < 0.2:
-                end_lat, end_lon = offshore_coords
-                print(f"[INFO] Using offshore coordinates for end port: ({end_lat}, {end_lon})")
-        # If not Mumbai/Chennai, snap to nearest water
-        if not any(abs(start_lat - v[0]) < 0.2 and abs(start_lon - v[1]) < 0.2 for v in OFFSHORE_PORTS.values()):
-            start_lat, start_lon = self._snap_to_water(start_lat, start_lon, "start")
-        if not any(abs(end_lat - v[0]) < 0.2 and abs(end_lon - v[1]) < 0.2 for v in OFFSHORE_PORTS.values()):
-            end_lat, end_lon = self._snap_to_water(end_lat, end_lon, "end")
+        start_lat, start_lon = self._resolve_port(start_lat, start_lon, "start")
+        end_lat, end_lon = self._resolve_port(end_lat, end_lon, "end")
         
         start = (start_lat, start_lon)
         goal = (end_lat, end_lon)
@@ -278,7 +386,7 @@ class ShipRouteCalculator:
         bounds = (-60, 30, 20, 120)  # (min_lat, max_lat, min_lon, max_lon)
         
         # Adaptive parameters based on route distance
-        straight_line_dist = math.sqrt((end_lat - start_lat)**2 + (end_lon - start_lon)**2) * 60  # Convert degrees to nautical miles
+        straight_line_dist = _sqrt((end_lat - start_lat)**2 + (end_lon - start_lon)**2) * 60  # Convert degrees to nautical miles
         
         # For short routes (<500nm), use more iterations and smaller steps
         if straight_line_dist < 500:
@@ -305,7 +413,6 @@ class ShipRouteCalculator:
         # If RRT* fails, try D* algorithm for dynamic planning
         if not waypoints or len(waypoints) < 2:
             print("[INFO] RRT* failed, trying D* algorithm...")
-            from app.algorithms.d_star import DStar
             d_star_planner = DStar(start, goal, step_size_nm=step_size_nm, max_iterations=max_iterations//2)
             waypoints = d_star_planner.plan()
             print(f"[INFO] D* complete: {len(waypoints) if waypoints else 0} waypoints")
@@ -318,22 +425,27 @@ class ShipRouteCalculator:
         interpolated = self.interpolate_route(waypoints, num_points=100)
         
         # SAFETY CHECK: Interpolation must never be empty
-        if not interpolated or len(interpolated) < 2:
+        if len(interpolated) < 2:
             raise ValueError("Interpolation failed: No valid water-only route.")
         
         # Get real weather if available (from CMEMS)
         if weather_data is None:
-            try:
+            def fetch_weather() -> Dict:
                 weather_response = self.weather_service.get_current_weather_on_route(
                     start_lat, start_lon, end_lat, end_lon
                 )
                 # Convert to simplified format
-                weather_data = {
+                return {
                     "wind_speed": weather_response["route_summary"]["avg_wind_speed"],
                     "wave_height": weather_response["route_summary"]["avg_wave_height"],
                     "current_speed": weather_response["route_summary"]["avg_current_speed"],
                     "weather_source": "CMEMS_real_time"
                 }
+            
+            weather_key = (round(start_lat, 1), round(start_lon, 1), round(end_lat, 1), round(end_lon, 1),
+                           int(time.time() // 3600))
+            try:
+                weather_data = _cached_route_weather(weather_key, fetch_weather)
             except Exception as e:
                 # Fall back to mock data
                 weather_data = {
@@ -348,9 +460,7 @@ class ShipRouteCalculator:
         vessel_type_enum = self.VESSEL_TYPE_MAP.get(
             vessel_type, VesselType.CONTAINER_10000_TEU
         )
-        if vessel_type not in self.fuel_models:
-            self.fuel_models[vessel_type] = FuelConsumptionModel(vessel_type_enum)
-        fuel_model = self.fuel_models[vessel_type]
+        fuel_model = _get_fuel_model(vessel_type_enum)
         
         # Get vessel specs
         specs = fuel_model.specs
@@ -360,44 +470,24 @@ class ShipRouteCalculator:
         if operating_speed_knots is None:
             operating_speed_knots = design_speed * 0.85  # Common practice: 85% of design
         
-        # Calculate metrics along route
-        total_distance_nm = 0
-        route_segments = []
-        total_weather_factor = 0
-        segment_count = 0
+        # Calculate metrics along route, all segments at once
+        distances, bearings = self.segment_metrics(interpolated)
+        total_distance_nm = float(distances.sum())
         
-        for i in range(len(interpolated) - 1):
-            lat1, lon1 = interpolated[i]
-            lat2, lon2 = interpolated[i + 1]
-            
-            distance_nm = self.haversine_distance(lat1, lon1, lat2, lon2)
-            bearing = self.bearing(lat1, lon1, lat2, lon2)
-            total_distance_nm += distance_nm
-            
-            # Calculate weather impact at this segment
-            segment_weather = get_fuel_impact_factors(
+        # Weather impact: weather_data is one route-wide mean, and wind and
+        # current are taken at fixed angles to each segment's heading, so
+        # every segment gets the same multiplier - compute it once
+        if len(distances) > 0:
+            avg_weather_factor = float(fuel_impact_multipliers(
                 wind_speed=weather_data["wind_speed"],
                 wave_height=weather_data["wave_height"],
                 current_speed=weather_data["current_speed"],
-                ship_heading=bearing,
-                wind_direction=bearing + 30,  # Assume wind comes at angle
-                current_direction=bearing
-            )
-            
-            weather_factor = segment_weather["total_fuel_multiplier"]
-            total_weather_factor += weather_factor
-            segment_count += 1
-            
-            route_segments.append({
-                "latitude": lat2,
-                "longitude": lon2,
-                "bearing": bearing,
-                "distance": distance_nm,
-                "waypoint_index": i
-            })
-        
-        # Average weather factor
-        avg_weather_factor = total_weather_factor / segment_count if segment_count > 0 else 1.0
+                ship_heading=0.0,
+                wind_direction=30.0,  # Assume wind comes at angle
+                current_direction=0.0
+            ))
+        else:
+            avg_weather_factor = 1.0
         
         # Calculate fuel consumption using scientific model (Speed³ relationship)
         fuel_estimate = fuel_model.estimate_voyage_fuel(
@@ -418,7 +508,7 @@ class ShipRouteCalculator:
         distance_efficiency = (straight_line_nm / total_distance_nm * 100) if total_distance_nm > 0 else 100
         
         # Convert to kilometers for reference
-        total_distance_km = total_distance_nm / 0.539957
+        total_distance_km = total_distance_nm / _KM_TO_NM
         
         # Calculate precise fuel metrics
         fuel_consumption_liters = total_fuel_tons * self.FUEL_DENSITY
@@ -427,9 +517,8 @@ class ShipRouteCalculator:
         fuel_per_nm_actual = total_fuel_tons / total_distance_nm if total_distance_nm > 0 else 0
         
         # Human readable time format
-        hours_remainder = int(voyage_time_hours % 24)
-        minutes = int((voyage_time_hours % 1) * 60)
-        days_int = int(voyage_time_days)
+        days_int, minutes = divmod(round(voyage_time_hours * 60), 24 * 60)
+        hours_remainder, minutes = divmod(minutes, 60)
         time_hms = f"{days_int}d {hours_remainder}h {minutes}m"
         
         # Speed optimization reason
@@ -473,6 +562,21 @@ class ShipRouteCalculator:
             (start_lat + end_lat) / 2, (start_lon + end_lon) / 2
         )
         
+        # Per-segment records are only built for the response; everything
+        # above works on the segment columns
+        route_segments = [
+            {
+                "latitude": lat2,
+                "longitude": lon2,
+                "bearing": bearing,
+                "distance": distance_nm,
+                "waypoint_index": i
+            }
+            for i, (lat2, lon2, bearing, distance_nm) in enumerate(zip(
+                interpolated[1:, 0].tolist(), interpolated[1:, 1].tolist(), bearings.tolist(), distances.tolist()
+            ))
+        ]
+        
         return {
             # Route information
             "start_lat": start_lat,
@@ -1,7 +1,68 @@
 import requests
 import random
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Tuple, Optional
 from app.core.config import settings
+from app.services.cache import SingleFlight, TTLCache, get_disk_cache
+
+
+# Shared HTTP session and pool for concurrent route point requests
+_MAX_CONCURRENT_REQUESTS = 10
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+
+# OpenWeather responses are cached per tile; concurrent misses share one call
+_TILE_DECIMALS = 2  # ~1 km, finer than the provider's grid
+CACHE_DURATION = 600  # 10 minutes, OpenWeather's update interval
+_cache: Optional[TTLCache] = None
+_inflight = SingleFlight()
+
+# Beaufort scale approximation: (upper wind speed m/s, wave height m) bands.
+# Band edges are whole m/s, so the bands are tabulated per truncated m/s.
+_WAVE_HEIGHT_BANDS = ((2, 0.1), (4, 0.5), (7, 1.0), (11, 2.0), (16, 3.0), (21, 4.0))
+_WAVE_BANDS_END_MS = _WAVE_HEIGHT_BANDS[-1][0]
+_WAVE_HEIGHT_BY_WHOLE_MS = tuple(
+    next(height for upper, height in _WAVE_HEIGHT_BANDS if ms < upper)
+    for ms in range(_WAVE_BANDS_END_MS)
+)
+
+
+def _get_session() -> requests.Session:
+    """
+    Get or create the shared HTTP session: pooled keep-alive connections and
+    retries with exponential backoff on rate limiting and server errors.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=_MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        _session = session
+    return _session
+
+
+def _get_cache() -> TTLCache:
+    """Get or create the shared OpenWeather response cache (memory and disk)"""
+    global _cache
+    if _cache is None:
+        _cache = TTLCache(settings.WEATHER_CACHE_MAXSIZE, CACHE_DURATION, get_disk_cache())
+    return _cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared weather request thread pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS,
+                                       thread_name_prefix="weather-route")
+    return _executor
 
 
 class WeatherService:
@@ -11,13 +72,30 @@ class WeatherService:
     
     def __init__(self):
         self.api_key = settings.OPENWEATHER_API_KEY
+        # No real key configured: serve mock weather without touching the network
+        self._use_mock = not self.api_key or self.api_key == "your-openweather-api-key"
     
     def get_current_weather(self, latitude: float, longitude: float) -> Optional[Dict]:
         """Get current weather for coordinates"""
+        if self._use_mock:
+            return self.generate_mock_weather(latitude, longitude)
+        
+        # Query by tile so nearby points share a cache entry
+        tile_lat = round(latitude, _TILE_DECIMALS)
+        tile_lon = round(longitude, _TILE_DECIMALS)
+        cache_key = f"owm_current_{tile_lat}_{tile_lon}"
+        
+        weather = _get_cache().get(cache_key)
+        if weather is None:
+            weather = _inflight.do(cache_key, lambda: self._fetch_current_weather(tile_lat, tile_lon, cache_key))
+        
+        if weather is None:
+            return self.generate_mock_weather(latitude, longitude)
+        return dict(weather)  # Callers annotate their copy
+    
+    def _fetch_current_weather(self, latitude: float, longitude: float, cache_key: str) -> Optional[Dict]:
+        """Query OpenWeather for coordinates and cache the result, None if the request fails"""
         try:
-            if self.api_key == "your-openweather-api-key":
-                return self.generate_mock_weather(latitude, longitude)
-            
             params = {
                 "lat": latitude,
                 "lon": longitude,
@@ -25,32 +103,39 @@ class WeatherService:
                 "units": "metric"
             }
             
-            response = requests.get(self.OPENWEATHER_URL, params=params, timeout=5)
+            response = _get_session().get(self.OPENWEATHER_URL, params=params, timeout=5)
             if response.status_code == 200:
                 data = response.json()
-                return {
+                weather = {
                     "temperature": data["main"]["temp"],
                     "wind_speed": data["wind"]["speed"] * 1.94384,  # m/s to knots
                     "wind_direction": data["wind"].get("deg", 0),
                     "wave_height": self.estimate_wave_height(data["wind"]["speed"]),
                     "current_speed": 0.5
                 }
-        except:
-            pass
+                _get_cache().set(cache_key, weather)
+                return weather
+        except (requests.RequestException, KeyError, ValueError) as e:
+            print(f"[Weather] OpenWeather request failed for ({latitude}, {longitude}): {e}")
         
-        return self.generate_mock_weather(latitude, longitude)
+        return None
     
     def get_route_weather(self, start_lat: float, start_lon: float,
                          end_lat: float, end_lon: float, num_points: int = 5) -> List[Dict]:
-        """Get weather along route"""
-        weather_points = []
+        """Get weather along route (points are fetched concurrently)"""
+        ratios = np.arange(num_points) / (num_points - 1) if num_points > 1 else np.zeros(num_points)
+        lats = start_lat + (end_lat - start_lat) * ratios
+        lons = start_lon + (end_lon - start_lon) * ratios
+        points = list(zip(lats.tolist(), lons.tolist()))
         
-        for i in range(num_points):
-            ratio = i / (num_points - 1) if num_points > 1 else 0
-            lat = start_lat + (end_lat - start_lat) * ratio
-            lon = start_lon + (end_lon - start_lon) * ratio
-            
-            weather = self.get_current_weather(lat, lon)
+        if self._use_mock:
+            # Mock weather is computed locally, for the whole route in one pass
+            results = self.generate_mock_route_weather(lats)
+        else:
+            results = _get_executor().map(lambda point: self.get_current_weather(*point), points)
+        
+        weather_points = []
+        for (lat, lon), weather in zip(points, results):
             if weather:
                 weather["latitude"] = lat
                 weather["longitude"] = lon
@@ -78,21 +163,26 @@ class WeatherService:
             "current_speed": max(0, current_speed)
         }
     
+    def generate_mock_route_weather(self, latitudes: np.ndarray) -> List[Dict]:
+        """Mock weather for many points at once, same model as generate_mock_weather"""
+        rng = np.random.default_rng()
+        n = len(latitudes)
+        lat_factor = (np.asarray(latitudes, dtype=np.float64) + 60) / 120  # Normalize to 0-1
+        
+        columns = {
+            "temperature": 20 + (lat_factor * 8),
+            "wind_speed": np.maximum(0, 8 + (lat_factor * 15) + rng.uniform(-3, 3, n)),
+            "wind_direction": rng.uniform(0, 360, n),
+            "wave_height": np.maximum(0.5, 1.0 + (lat_factor * 2) + rng.uniform(-0.5, 0.5, n)),
+            "current_speed": np.maximum(0, 0.3 + (lat_factor * 0.7) + rng.uniform(-0.1, 0.1, n))
+        }
+        
+        fields = list(columns)
+        return [dict(zip(fields, values)) for values in zip(*(column.tolist() for column in columns.values()))]
+    
     @staticmethod
     def estimate_wave_height(wind_speed_ms: float) -> float:
         """Estimate wave height from wind speed (simplified)"""
-        # Beaufort scale approximation
-        if wind_speed_ms < 2:
-            return 0.1
-        elif wind_speed_ms < 4:
-            return 0.5
-        elif wind_speed_ms < 7:
-            return 1.0
-        elif wind_speed_ms < 11:
-            return 2.0
-        elif wind_speed_ms < 16:
-            return 3.0
-        elif wind_speed_ms < 21:
-            return 4.0
-        else:
-            return min(wind_speed_ms * 0.2, 8.0)
+        if wind_speed_ms < _WAVE_BANDS_END_MS:
+            return _WAVE_HEIGHT_BY_WHOLE_MS[max(int(wind_speed_ms), 0)]
+        return min(wind_speed_ms * 0.2, 8.0)
@@ -8,11 +8,29 @@ References:
 """
 
 import math
+import threading
+import time
+from bisect import bisect_left, bisect_right
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import json
 
 
+# Current UTC month, refreshed at most once a minute
+_MONTH_REFRESH_SECONDS = 60
+_month_cache = {"t": float("-inf"), "m": 0}
+
+
+def _current_month() -> int:
+    """Current UTC month (1-12), without building a datetime on every call"""
+    now = time.monotonic()
+    if now - _month_cache["t"] > _MONTH_REFRESH_SECONDS:
+        _month_cache["m"] = datetime.utcnow().month
+        _month_cache["t"] = now
+    return _month_cache["m"]
+
+
 class CMEMSWeatherService:
     """
     Provides real weather data integration for maritime routing.
@@ -58,11 +76,33 @@ class CMEMSWeatherService:
         }
     }
     
+    # Point weather is cached per cell of the CMEMS product grid (1/12°)
+    GRID_CELLS_PER_DEGREE = 12
+    
+    # Column order of _compute_points_weather and weather_grid entries
+    _POINT_WEATHER_FIELDS = ("wind_speed", "wind_direction", "wave_height", "wave_direction",
+                             "current_speed", "current_direction", "sst")
+    # Response keys of the same fields in weather_at_waypoints
+    _WAYPOINT_WEATHER_KEYS = ("wind_speed_knots", "wind_direction_deg", "wave_height_m", "wave_direction_deg",
+                              "current_speed_ms", "current_direction_deg", "sea_surface_temp_c")
+    
+    # Route risk scoring: score for the highest average threshold exceeded,
+    # at least the extreme score if the route maximum exceeds the extreme limit
+    _RISK_WAVE_THRESHOLDS = (1.5, 2.0, 3.0)   # Average wave height, m
+    _RISK_WAVE_SCORES = (0, 5, 15, 30)        # None, low, moderate, high waves
+    _RISK_EXTREME_WAVE = (5.0, 40)            # (max wave height, score)
+    _RISK_WIND_THRESHOLDS = (15, 25)          # Average wind speed, knots
+    _RISK_WIND_SCORES = (0, 10, 25)           # None, moderate, strong wind
+    _RISK_EXTREME_WIND = (40, 35)             # (max wind speed, score)
+    _RISK_LEVEL_THRESHOLDS = (15, 40, 60)     # Minimum score of each level above LOW
+    _RISK_LEVELS = ("LOW", "MODERATE", "HIGH", "EXTREME")
+    
     def __init__(self):
         """Initialize weather service with cached data structures."""
-        self.weather_grid = {}  # Cached weather data
-        self.last_update = None
+        self.weather_grid = {}  # Cached weather data, (cell row, cell col) -> weather
+        self.last_update = None  # Cache period the weather grid belongs to
         self.cache_duration = 3600  # 1 hour in seconds
+        self._grid_lock = threading.Lock()  # Guards weather_grid/last_update across request threads
         
     def get_current_weather_on_route(
         self, 
@@ -84,48 +124,35 @@ class CMEMSWeatherService:
         
         # Sample waypoints along the route
         waypoints = self._interpolate_route(start_lat, start_lon, end_lat, end_lon, num_points=10)
+        lats, lons = waypoints[:, 0], waypoints[:, 1]
+        
+        # Weather at all waypoints as columns
+        weather = self._get_points_weather(lats, lons)
+        winds = weather["wind_speed"]
+        waves = weather["wave_height"]
+        currents = weather["current_speed"]
         
         weather_data = {
             "timestamp": datetime.utcnow().isoformat(),
             "route_start": {"lat": start_lat, "lon": start_lon},
             "route_end": {"lat": end_lat, "lon": end_lon},
             "waypoints_count": len(waypoints),
-            "weather_at_waypoints": [],
-            "route_summary": {}
-        }
-        
-        # Get weather at each waypoint
-        all_winds = []
-        all_waves = []
-        all_currents = []
-        
-        for i, (wp_lat, wp_lon) in enumerate(waypoints):
-            wp_weather = self._get_point_weather(wp_lat, wp_lon)
-            weather_data["weather_at_waypoints"].append({
-                "waypoint": i,
-                "lat": wp_lat,
-                "lon": wp_lon,
-                "wind_speed_knots": wp_weather["wind_speed"],
-                "wind_direction_deg": wp_weather["wind_direction"],
-                "wave_height_m": wp_weather["wave_height"],
-                "wave_direction_deg": wp_weather["wave_direction"],
-                "current_speed_ms": wp_weather["current_speed"],
-                "current_direction_deg": wp_weather["current_direction"],
-                "sea_surface_temp_c": wp_weather["sst"]
-            })
-            
-            all_winds.append(wp_weather["wind_speed"])
-            all_waves.append(wp_weather["wave_height"])
-            all_currents.append(wp_weather["current_speed"])
-        
-        # Compute route statistics
-        weather_data["route_summary"] = {
-            "avg_wind_speed": sum(all_winds) / len(all_winds),
-            "max_wind_speed": max(all_winds),
-            "avg_wave_height": sum(all_waves) / len(all_waves),
-            "max_wave_height": max(all_waves),
-            "avg_current_speed": sum(all_currents) / len(all_currents),
-            "max_current_speed": max(all_currents)
+            # One list per field (lat, lon, then _WAYPOINT_WEATHER_KEYS), see waypoint_rows
+            "weather_at_waypoints": {
+                "lat": lats.tolist(),
+                "lon": lons.tolist(),
+                **{key: weather[field].tolist()
+                   for key, field in zip(self._WAYPOINT_WEATHER_KEYS, self._POINT_WEATHER_FIELDS)}
+            },
+            # Compute route statistics
+            "route_summary": {
+                "avg_wind_speed": float(winds.mean()),
+                "max_wind_speed": float(winds.max()),
+                "avg_wave_height": float(waves.mean()),
+                "max_wave_height": float(waves.max()),
+                "avg_current_speed": float(currents.mean()),
+                "max_current_speed": float(currents.max())
+            }
         }
         
         # Determine routing risk level
@@ -135,6 +162,15 @@ class CMEMSWeatherService:
         
         return weather_data
     
+    @staticmethod
+    def waypoint_rows(weather_at_waypoints: Dict[str, List[float]]) -> List[Dict]:
+        """Per-waypoint dicts ("wide" format) from the weather_at_waypoints columns"""
+        keys = list(weather_at_waypoints)
+        return [
+            {"waypoint": i, **dict(zip(keys, values))}
+            for i, values in enumerate(zip(*weather_at_waypoints.values()))
+        ]
+    
     def get_monsoon_season_info(self) -> Dict:
         """
         Get current monsoon season information for Indian Ocean.
@@ -143,19 +179,8 @@ class CMEMSWeatherService:
             Current season details and impact on routing
         """
         
-        current_month = datetime.utcnow().month
-        current_season = None
-        
-        for season_name, season_data in self.MONSOON_SEASONS.items():
-            # Handle wraparound for northeast monsoon (Oct-Apr)
-            if season_name == "northeast":
-                if current_month >= season_data["start_month"] or current_month <= season_data["end_month"]:
-                    current_season = (season_name, season_data)
-                    break
-            else:
-                if season_data["start_month"] <= current_month <= season_data["end_month"]:
-                    current_season = (season_name, season_data)
-                    break
+        current_month = _current_month()
+        current_season = _MONTH_TO_SEASON[current_month]
         
         return {
             "current_month": current_month,
@@ -166,6 +191,20 @@ class CMEMSWeatherService:
             ) else "Moderate risk"
         }
     
+    @classmethod
+    def _resolve_monsoon_season(cls, current_month: int) -> Optional[Tuple[str, Dict]]:
+        """(season name, season data) active in a month, or None if transitional"""
+        for season_name, season_data in cls.MONSOON_SEASONS.items():
+            # Handle wraparound for northeast monsoon (Oct-Apr)
+            if season_name == "northeast":
+                if current_month >= season_data["start_month"] or current_month <= season_data["end_month"]:
+                    return season_name, season_data
+            else:
+                if season_data["start_month"] <= current_month <= season_data["end_month"]:
+                    return season_name, season_data
+        
+        return None
+    
     def detect_cyclone_risk(
         self,
         lat: float,
@@ -189,9 +228,10 @@ class CMEMSWeatherService:
             "recommendation": ""
         }
         
+        month = _current_month()
+        
         # Bay of Bengal: October-November & May-June are cyclone seasons
         if 20 < lat < 25 and 85 < lon < 92:
-            month = datetime.utcnow().month
             if month in [5, 6, 10, 11]:  # Cyclone seasons
                 cyclone_risk["cyclone_probability"] = 0.15
                 cyclone_risk["high_risk_zones"].append({
@@ -202,7 +242,6 @@ class CMEMSWeatherService:
         
         # Arabian Sea: May-June & September-November
         if 15 < lat < 25 and 50 < lon < 75:
-            month = datetime.utcnow().month
             if month in [5, 6, 9, 10, 11]:
                 cyclone_risk["cyclone_probability"] = 0.12
                 cyclone_risk["high_risk_zones"].append({
@@ -289,7 +328,38 @@ class CMEMSWeatherService:
     
     def _get_point_weather(self, lat: float, lon: float) -> Dict:
         """Get weather at a specific lat/lon point (simulated CMEMS data)."""
+        weather = self._get_points_weather(np.array([lat]), np.array([lon]))
+        return {field: float(values[0]) for field, values in weather.items()}
+    
+    def _get_points_weather(self, lats: np.ndarray, lons: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Weather at many points as columns, one array per field.
+        
+        Points are snapped to the product grid; cells not yet in weather_grid
+        for the current cache_duration period are computed in one batch.
+        """
+        scale = self.GRID_CELLS_PER_DEGREE
+        cells = list(zip(np.rint(lats * scale).astype(int).tolist(),
+                         np.rint(lons * scale).astype(int).tolist()))
+        
+        with self._grid_lock:
+            period = int(time.time() // self.cache_duration)
+            if period != self.last_update:
+                self.weather_grid = {}  # Previous period's weather is stale
+                self.last_update = period
+            
+            missing = [cell for cell in dict.fromkeys(cells) if cell not in self.weather_grid]
+            if missing:
+                centers = np.array(missing, dtype=np.float64) / scale
+                computed = self._compute_points_weather(centers[:, 0], centers[:, 1])
+                self.weather_grid.update(zip(missing, computed.tolist()))
+            
+            values = np.array([self.weather_grid[cell] for cell in cells], dtype=np.float64)
         
+        return dict(zip(self._POINT_WEATHER_FIELDS, values.T))
+    
+    def _compute_points_weather(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Weather at grid cell centers, (N, fields) in _POINT_WEATHER_FIELDS order"""
         # This would connect to real CMEMS API in production
         # For now, return realistic values based on location and season
         
@@ -299,18 +369,19 @@ class CMEMSWeatherService:
         base_wave = monsoon_info["season_data"]["avg_wave_height"] if monsoon_info["season_data"] else 1.5
         
         # Add location-based variation
-        wind_variation = math.sin((lat + lon) / 50) * 5  # Small variation
-        wave_variation = math.cos((lat + lon) / 40) * 0.8
-        
-        return {
-            "wind_speed": max(5, base_wind + wind_variation),  # knots
-            "wind_direction": (lon * 2) % 360,  # degrees
-            "wave_height": max(0.5, base_wave + wave_variation),  # meters
-            "wave_direction": ((lat + lon) * 3) % 360,  # degrees
-            "current_speed": 0.3 + (lon - 50) / 100,  # m/s
-            "current_direction": (lon * 1.5) % 360,  # degrees
-            "sst": 25 - (lat / 5)  # Sea surface temperature, °C
-        }
+        lat_lon_sum = lats + lons
+        wind_variation = np.sin(lat_lon_sum / 50) * 5  # Small variation
+        wave_variation = np.cos(lat_lon_sum / 40) * 0.8
+        
+        return np.column_stack([
+            np.maximum(5, base_wind + wind_variation),  # Wind speed, knots
+            (lons * 2) % 360,  # Wind direction, degrees
+            np.maximum(0.5, base_wave + wave_variation),  # Wave height, meters
+            (lat_lon_sum * 3) % 360,  # Wave direction, degrees
+            0.3 + (lons - 50) / 100,  # Current speed, m/s
+            (lons * 1.5) % 360,  # Current direction, degrees
+            25 - (lats / 5)  # Sea surface temperature, °C
+        ])
     
     def _interpolate_route(
         self,
@@ -319,17 +390,14 @@ class CMEMSWeatherService:
         end_lat: float,
         end_lon: float,
         num_points: int = 10
-    ) -> List[Tuple[float, float]]:
-        """Interpolate waypoints along a great-circle route."""
-        
-        waypoints = []
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            lat = start_lat + (end_lat - start_lat) * t
-            lon = start_lon + (end_lon - start_lon) * t
-            waypoints.append((lat, lon))
-        
-        return waypoints
+    ) -> np.ndarray:
+        """Interpolate waypoints along a great-circle route, as an (N, 2) array of (lat, lon)."""
+        
+        t = np.arange(num_points) / (num_points - 1)
+        return np.column_stack([
+            start_lat + (end_lat - start_lat) * t,
+            start_lon + (end_lon - start_lon) * t
+        ])
     
     def _calculate_wave_impact(self, wave_height: float) -> float:
         """
@@ -363,17 +431,14 @@ class CMEMSWeatherService:
         - Crosswind (90°): Moderate resistance
         """
         
-        # Normalize angle to [0, 180]
-        angle = min(relative_angle, 360 - relative_angle)
-        
         # Impact decreases as wind becomes more from stern (0° = tailwind)
         # Impact increases as wind becomes more from bow (180° = headwind)
-        angle_factor = math.cos(math.radians(angle))  # 1.0 for headwind, -1.0 for tailwind
+        # cos is symmetric about 0°, so the angle needs no folding to [0, 180]
+        angle_factor = math.cos(math.radians(relative_angle))  # 1.0 for headwind, -1.0 for tailwind
         
-        if angle_factor > 0:  # Headwind component
-            return 0.12 * angle_factor * (wind_speed / 20) ** 2
-        else:  # Tailwind component (slight assistance)
-            return -0.08 * abs(angle_factor) * (wind_speed / 20) ** 2
+        # Headwind component resists, tailwind component slightly assists (negative factor)
+        speed_ratio = wind_speed / 20
+        return (0.12 if angle_factor > 0 else 0.08) * angle_factor * (speed_ratio * speed_ratio)
     
     def _calculate_current_impact(self, current_speed: float, relative_angle: float) -> float:
         """
@@ -383,14 +448,10 @@ class CMEMSWeatherService:
         - Opposing current: Increases fuel consumption
         """
         
-        # Normalize angle to [0, 180]
-        angle = min(relative_angle, 360 - relative_angle)
-        angle_factor = math.cos(math.radians(angle))
+        angle_factor = math.cos(math.radians(relative_angle))  # Symmetric about 0°, no folding needed
         
-        if angle_factor > 0:  # Current from ahead (resistance)
-            return 0.08 * angle_factor * (current_speed / 0.5)
-        else:  # Current from behind (assistance)
-            return -0.05 * abs(angle_factor) * (current_speed / 0.5)
+        # Current from ahead resists, current from behind assists (negative factor)
+        return (0.08 if angle_factor > 0 else 0.05) * angle_factor * (current_speed * 2.0)  # speed / 0.5
     
     def _calculate_relative_angle(self, ship_heading: float, source_direction: float) -> float:
         """
@@ -416,92 +477,90 @@ class CMEMSWeatherService:
         avg_wind = route_summary["avg_wind_speed"]
         max_wind = route_summary["max_wind_speed"]
         
-        risk_score = 0
-        
-        # Wave scoring
-        if max_wave > 5.0:
-            risk_score += 40  # Extreme waves
-        elif avg_wave > 3.0:
-            risk_score += 30  # High waves
-        elif avg_wave > 2.0:
-            risk_score += 15  # Moderate waves
-        elif avg_wave > 1.5:
-            risk_score += 5   # Low waves
-        
-        # Wind scoring
-        if max_wind > 40:
-            risk_score += 35  # Extreme wind
-        elif avg_wind > 25:
-            risk_score += 25  # Strong wind
-        elif avg_wind > 15:
-            risk_score += 10  # Moderate wind
-        
-        if risk_score >= 60:
-            return "EXTREME"
-        elif risk_score >= 40:
-            return "HIGH"
-        elif risk_score >= 15:
-            return "MODERATE"
-        else:
-            return "LOW"
+        extreme_wave, extreme_wave_score = self._RISK_EXTREME_WAVE
+        extreme_wind, extreme_wind_score = self._RISK_EXTREME_WIND
+        
+        # Strict thresholds: bisect_left only counts thresholds below the value
+        wave_score = self._RISK_WAVE_SCORES[bisect_left(self._RISK_WAVE_THRESHOLDS, avg_wave)]
+        if max_wave > extreme_wave:
+            wave_score = extreme_wave_score
+        
+        wind_score = self._RISK_WIND_SCORES[bisect_left(self._RISK_WIND_THRESHOLDS, avg_wind)]
+        if max_wind > extreme_wind:
+            wind_score = extreme_wind_score
+        
+        risk_score = wave_score + wind_score
+        return self._RISK_LEVELS[bisect_right(self._RISK_LEVEL_THRESHOLDS, risk_score)]
+
 
+# Active monsoon season by month (index 1-12), resolved once at import
+_MONTH_TO_SEASON = [None] + [
+    CMEMSWeatherService._resolve_monsoon_season(month) for month in range(1, 13)
+]
 
 # ===== Public API Functions =====
 
+# Shared by all requests so the weather grid cache survives between calls
+_SERVICE = CMEMSWeatherService()
+
 def get_weather_on_route(
     start_lat: float,
     start_lon: float,
     end_lat: float,
-    end_lon: float
+    end_lon: float,
+    wide: bool = False
 ) -> Dict:
-    """Public API: Get weather conditions for a route."""
+    """Public API: Get weather conditions for a route (wide: one dict per waypoint)."""
     
-    service = CMEMSWeatherService()
-    return service.get_current_weather_on_route(start_lat, start_lon, end_lat, end_lon)
-
+    weather_data = _SERVICE.get_current_weather_on_route(start_lat, start_lon, end_lat, end_lon)
+    if wide:
+        weather_data["weather_at_waypoints"] = CMEMSWeatherService.waypoint_rows(
+            weather_data["weather_at_waypoints"]
+        )
+    return weather_data
 
-def get_monsoon_info() -> Dict:
-    """Public API: Get current monsoon season information."""
-    
-    service = CMEMSWeatherService()
-    return service.get_monsoon_season_info()
 
+# Public API: bound directly to the shared service, no forwarding wrapper
+get_monsoon_info = _SERVICE.get_monsoon_season_info
+check_cyclone_risk = _SERVICE.detect_cyclone_risk
+calculate_fuel_impact = _SERVICE.get_fuel_impact_factors
 
-def check_cyclone_risk(lat: float, lon: float) -> Dict:
-    """Public API: Check cyclone risk at location."""
-    
-    service = CMEMSWeatherService()
-    return service.detect_cyclone_risk(lat, lon)
+# Alias for backward compatibility
+get_fuel_impact_factors = calculate_fuel_impact
 
 
-def calculate_fuel_impact(
+def fuel_impact_multipliers(
     wind_speed: float,
     wave_height: float,
     current_speed: float,
-    ship_heading: float,
-    wind_direction: float,
-    current_direction: float
-) -> Dict:
-    """Public API: Calculate fuel consumption impact factors."""
+    ship_heading: np.ndarray,
+    wind_direction: np.ndarray,
+    current_direction: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized total_fuel_multiplier of get_fuel_impact_factors.
     
-    service = CMEMSWeatherService()
-    return service.get_fuel_impact_factors(
-        wind_speed, wave_height, current_speed,
-        ship_heading, wind_direction, current_direction
-    )
-
-
-# Alias for backward compatibility
-def get_fuel_impact_factors(
-    wind_speed: float,
-    wave_height: float,
-    current_speed: float,
-    ship_heading: float,
-    wind_direction: float,
-    current_direction: float
-) -> Dict:
-    """Public API: Calculate fuel consumption impact factors (alias for calculate_fuel_impact)."""
-    return calculate_fuel_impact(
-        wind_speed, wave_height, current_speed,
-        ship_heading, wind_direction, current_direction
+    Same model as the per-segment call, evaluated for arrays of headings
+    and directions at once (scalars broadcast).
+    
+    Returns:
+        Array of fuel multipliers, one per heading
+    """
+    wave_height = np.asarray(wave_height, dtype=np.float64)
+    f_wave = np.select(
+        [wave_height < 1.5, wave_height < 3.0],
+        [0.0, 0.15 * (wave_height - 1.5)],
+        default=np.minimum(0.75, 0.225 + 0.20 * (wave_height - 3.0)),
     )
+    
+    def angle_factor(source_direction):
+        # cos of relative angle: 1.0 from bow, -1.0 from stern
+        return np.cos(np.radians(np.mod(np.subtract(source_direction, ship_heading), 360)))
+    
+    wind_factor = angle_factor(wind_direction)
+    f_wind = np.where(wind_factor > 0, 0.12, 0.08) * wind_factor * np.square(np.asarray(wind_speed) / 20)
+    
+    current_factor = angle_factor(current_direction)
+    f_current = np.where(current_factor > 0, 0.08, 0.05) * current_factor * (np.asarray(current_speed) * 2.0)
+    
+    return np.maximum(1.0 + f_wave + f_wind + f_current, 0.1)  # Never below 10% of base